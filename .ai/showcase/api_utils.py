@@ -5,10 +5,18 @@ Handles all external API integrations for generating visual assets.
 
 import os
 import io
-import requests
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import urlencode
 from PIL import Image
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
+from asset_cache import AssetCache, default_cache
+from http_session import get_pool, DEFAULT_MAX_DOWNLOAD_BYTES
+from asset_prefetch import AssetPrefetcher
 
 # Load environment variables
 load_dotenv()
@@ -19,28 +27,145 @@ PEXELS_API_KEY = os.getenv('PEXELS_API_KEY')
 UNSPLASH_ACCESS_KEY = os.getenv('UNSPLASH_ACCESS_KEY')
 ERASER_API_TOKEN = os.getenv('ERASER_API_TOKEN')
 
+# Chart rendering: "quickchart" (falls back to local rendering when the request
+# fails and matplotlib is installed) or "local" (chart_render.py, no network)
+CHART_BACKEND = os.getenv('CHART_BACKEND', 'quickchart')
+
+# Diagram rendering: "ink" (mermaid.ink; falls back to local rendering when the
+# request fails and the local renderer is installed) or "local" (mermaid_render.py)
+MERMAID_BACKEND = os.getenv('MERMAID_BACKEND', 'ink')
+
+# Avatars: "local" (avatar_render.py, deterministic and offline) or "dicebear"
+# (api.dicebear.com; falls back to local rendering when the request fails)
+AVATAR_BACKEND = os.getenv('AVATAR_BACKEND', 'local')
+
+# Shared content-addressed cache for generated assets
+CACHE = default_cache()
+
+# Shared per-host keep-alive sessions with retry/backoff on 429/5xx
+HTTP = get_pool()
+
+# QuickChart: configs whose GET URL would be longer than this are POSTed as JSON instead
+QUICKCHART_URL = "https://quickchart.io/chart"
+QUICKCHART_MAX_GET_URL = int(os.getenv('QUICKCHART_MAX_GET_URL', '1024'))
+# Short URLs expire on QuickChart's side; reuse a recorded one for at most this long
+QUICKCHART_SHORT_URL_DAYS = float(os.getenv('QUICKCHART_SHORT_URL_DAYS', '30'))
+
+
+class ShortURLIndex:
+    """
+    JSON file mapping chart request keys to QuickChart short URLs.
+
+    Short URLs are created once per (config, size) and reused by later
+    builds until they are max_age seconds old, so a large config is sent
+    to QuickChart once instead of on every request.
+    """
+
+    def __init__(self, path, max_age: float):
+        self.path = Path(path)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Recorded short URL for a key, or None if missing or too old"""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and time.time() - entry.get('created', 0) < self.max_age:
+            return entry.get('url')
+        return None
+
+    def _save(self, index: Dict[str, Any]):
+        """Write the index atomically (call with the lock held)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp_name, self.path)
+        except OSError as e:
+            print(f"Error saving short URL index {self.path}: {e}")
+
+    def put(self, key: str, url: str):
+        """Record a short URL (expired entries are dropped on write)"""
+        with self._lock:
+            now = time.time()
+            index = {k: v for k, v in self._load().items() if now - v.get('created', 0) < self.max_age}
+            index[key] = {'url': url, 'created': now}
+            self._save(index)
+
+    def delete(self, key: str):
+        """Forget a short URL (e.g. one QuickChart no longer serves)"""
+        with self._lock:
+            index = self._load()
+            if index.pop(key, None) is not None:
+                self._save(index)
+
+
+SHORT_URLS = ShortURLIndex(CACHE.cache_dir / "quickchart-short-urls.json", QUICKCHART_SHORT_URL_DAYS * 86400)
+
+
+def quickchart_keys(chart_config: Dict[str, Any], width: int, height: int) -> Tuple[str, str]:
+    """(image cache key, short URL index key) for a chart request"""
+    payload = {"chart": chart_config, "width": width, "height": height}
+    return AssetCache.make_key(QUICKCHART_URL, payload), AssetCache.make_key(f"{QUICKCHART_URL}/create", payload)
+
+
+def quickchart_request(chart_config: Dict[str, Any], width: int, height: int,
+                       short_url: bool = True) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Choose how to fetch a chart image from QuickChart.
+
+    Small configs are sent as a compact GET query (cacheable by URL);
+    large ones reuse a recorded short URL if there is one (and short_url
+    is True), otherwise go in a JSON POST body, so config size never hits
+    URL length limits.
+
+    Returns:
+        (method, url, request kwargs: params or json)
+    """
+    params = {"c": json.dumps(chart_config, separators=(',', ':')), "width": width, "height": height}
+    if len(QUICKCHART_URL) + 1 + len(urlencode(params)) <= QUICKCHART_MAX_GET_URL:
+        return 'GET', QUICKCHART_URL, {'params': params}
+
+    recorded = SHORT_URLS.get(quickchart_keys(chart_config, width, height)[1]) if short_url else None
+    if recorded:
+        return 'GET', recorded, {}
+    return 'POST', QUICKCHART_URL, {'json': {"chart": chart_config, "width": width, "height": height,
+                                             "format": "png"}}
+
 
 class APIUtils:
     """Utility class for API interactions"""
 
     @staticmethod
-    def download_image(url: str, output_path: str) -> bool:
+    def download_image(url: str, output_path: str,
+                       max_bytes: Optional[int] = DEFAULT_MAX_DOWNLOAD_BYTES,
+                       expected_sha256: Optional[str] = None) -> bool:
         """
         Download an image from a URL and save it locally.
 
+        The body is streamed to a temp file and renamed into place only once
+        complete, so a failed or oversized download never leaves a partial
+        file at output_path.
+
         Args:
             url: The URL of the image
             output_path: Local path to save the image
+            max_bytes: Abort if the image is larger than this (None = unlimited)
+            expected_sha256: Optional checksum the downloaded bytes must match
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            HTTP.download(url, output_path, max_bytes=max_bytes,
+                          expected_digest=expected_sha256, timeout=30)
             return True
         except Exception as e:
             print(f"Error downloading image from {url}: {e}")
@@ -81,14 +206,21 @@ class APIUtils:
             }
         }
 
+        cache_key = AssetCache.make_key(url, payload)
+        if CACHE.fetch(cache_key, output_path):
+            return True
+
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
+            response = HTTP.post(url, json=payload, headers=headers, timeout=60)
             response.raise_for_status()
 
             data = response.json()
             if data.get('data') and len(data['data']) > 0:
                 image_url = data['data'][0]['url']
-                return APIUtils.download_image(image_url, output_path)
+                if APIUtils.download_image(image_url, output_path):
+                    CACHE.put(cache_key, output_path)
+                    return True
+                return False
             else:
                 print("No image generated by Ideogram")
                 return False
@@ -125,7 +257,7 @@ class APIUtils:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = HTTP.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -165,7 +297,7 @@ class APIUtils:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = HTTP.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -184,7 +316,8 @@ class APIUtils:
     def generate_quickchart(chart_config: Dict[str, Any],
                            output_path: str,
                            width: int = 800,
-                           height: int = 600) -> bool:
+                           height: int = 600,
+                           backend: Optional[str] = None) -> bool:
         """
         Generate a chart using QuickChart.io API.
 
@@ -193,68 +326,166 @@ class APIUtils:
             output_path: Local path to save the chart image
             width: Chart width in pixels
             height: Chart height in pixels
+            backend: "quickchart" or "local" (default: CHART_BACKEND env var)
 
         Returns:
             True if successful, False otherwise
         """
-        import json
+        # Imported here: chart_render itself imports this module
+        from chart_render import render_chart, LOCAL_CHARTS
 
-        # Build QuickChart URL
-        base_url = "https://quickchart.io/chart"
-        params = {
-            "c": json.dumps(chart_config),
-            "width": width,
-            "height": height
-        }
+        if (backend or CHART_BACKEND) == 'local':
+            return render_chart(chart_config, output_path, width, height)
 
-        try:
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
+        cache_key, index_key = quickchart_keys(chart_config, width, height)
+        if CACHE.fetch(cache_key, output_path):
+            return True
 
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+        try:
+            method, url, kwargs = quickchart_request(chart_config, width, height)
+            try:
+                # Rendering is a pure function of the config, so a POST is safe to resend
+                HTTP.download(url, output_path, method=method, retry=True, timeout=30, **kwargs)
+            except Exception as e:
+                if url == QUICKCHART_URL:
+                    raise
+                # The recorded short URL stopped working: forget it and send the config
+                print(f"QuickChart short URL failed ({e}); posting the config instead")
+                SHORT_URLS.delete(index_key)
+                method, url, kwargs = quickchart_request(chart_config, width, height, short_url=False)
+                HTTP.download(url, output_path, method=method, retry=True, timeout=30, **kwargs)
+            CACHE.put(cache_key, output_path)
             return True
 
         except Exception as e:
             print(f"Error generating QuickChart: {e}")
+            if LOCAL_CHARTS:
+                print("  Rendering chart locally instead")
+                return render_chart(chart_config, output_path, width, height)
             return False
 
+    @staticmethod
+    def generate_quickcharts(charts: Dict[str, Dict[str, Any]],
+                             backend: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Generate several charts in one batch.
+
+        Charts are fetched concurrently over the shared keep-alive session
+        (AssetPrefetcher, 'quickchart' provider limit); requests that are
+        identical (same config, size and output) run once.
+
+            results = APIUtils.generate_quickcharts({
+                "q1_q4": {"config": config, "output_path": "chart.png",
+                          "width": 900, "height": 500},
+            })
+
+        Args:
+            charts: {name: {config, output_path, width (800), height (600)}}
+            backend: "quickchart" or "local" (default: CHART_BACKEND env var)
+
+        Returns:
+            {name: True if that chart was generated}
+        """
+        prefetcher = AssetPrefetcher()
+        jobs = {}      # request key -> name of the job that runs it
+        job_for = {}   # chart name -> job name
+        for name, chart in charts.items():
+            args = (chart['config'], str(chart['output_path']), chart.get('width', 800), chart.get('height', 600))
+            request = AssetCache.make_key("quickchart-batch", {"args": args})
+            if request not in jobs:
+                jobs[request] = name
+                prefetcher.add('charts', name, 'quickchart', APIUtils.generate_quickchart, *args, backend)
+            job_for[name] = jobs[request]
+
+        done = prefetcher.run().get('charts', {})
+        return {name: bool(done.get(job)) for name, job in job_for.items()}
+
+    @staticmethod
+    def quickchart_short_url(chart_config: Dict[str, Any], width: int = 800,
+                             height: int = 600) -> Optional[str]:
+        """
+        Get a QuickChart short URL for a chart (e.g. to link or embed it).
+
+        A recorded URL younger than QUICKCHART_SHORT_URL_DAYS is reused;
+        otherwise one is created with a single POST to /chart/create and
+        recorded. Large configs then download through the short URL.
+
+        Returns:
+            The short URL, or None on failure
+        """
+        _, index_key = quickchart_keys(chart_config, width, height)
+        short_url = SHORT_URLS.get(index_key)
+        if short_url:
+            return short_url
+
+        try:
+            response = HTTP.post(f"{QUICKCHART_URL}/create", json={
+                "chart": chart_config, "width": width, "height": height, "format": "png"
+            }, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            if not data.get('success') or not data.get('url'):
+                print(f"QuickChart did not return a short URL: {data}")
+                return None
+            SHORT_URLS.put(index_key, data['url'])
+            return data['url']
+
+        except Exception as e:
+            print(f"Error creating QuickChart short URL: {e}")
+            return None
+
     @staticmethod
     def get_dicebear_avatar(seed: str, output_path: str,
-                           style: str = "avataaars", size: int = 200) -> bool:
+                           style: str = "avataaars", size: int = 200,
+                           backend: Optional[str] = None) -> bool:
         """
-        Generate an avatar using DiceBear API.
+        Generate an avatar, drawn locally by default or fetched from DiceBear.
+
+        With the local backend (the default) the avatar is drawn in-process
+        and DiceBear styles map to the closest local style (see
+        avatar_render.DICEBEAR_STYLES); AVATAR_BACKEND=dicebear calls the
+        DiceBear API instead.
 
         Args:
             seed: Seed for avatar generation (determines unique look)
             style: Avatar style (avataaars, bottts, pixel-art, etc.)
             output_path: Local path to save the avatar
             size: Avatar size in pixels
+            backend: "local" or "dicebear" (default: AVATAR_BACKEND env var)
 
         Returns:
             True if successful, False otherwise
         """
+        # Imported here: avatar_render itself imports this module
+        from avatar_render import render_avatar
+
+        if (backend or AVATAR_BACKEND) == 'local':
+            return render_avatar(seed, output_path, style, size)
+
         url = f"https://api.dicebear.com/7.x/{style}/png"
         params = {
             "seed": seed,
             "size": size
         }
 
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
+        cache_key = AssetCache.make_key(url, params)
+        if CACHE.fetch(cache_key, output_path):
+            return True
 
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+        try:
+            HTTP.download(url, output_path, params=params, timeout=30)
+            CACHE.put(cache_key, output_path)
             return True
 
         except Exception as e:
             print(f"Error generating DiceBear avatar: {e}")
-            return False
+            print("  Rendering avatar locally instead")
+            return render_avatar(seed, output_path, style, size)
 
     @staticmethod
     def generate_mermaid_diagram(mermaid_code: str, output_path: str,
-                                theme: str = "default") -> bool:
+                                theme: str = "default",
+                                backend: Optional[str] = None) -> bool:
         """
         Generate a diagram from Mermaid code using mermaid.ink.
 
@@ -262,26 +493,38 @@ class APIUtils:
             mermaid_code: Mermaid diagram code
             output_path: Local path to save the diagram
             theme: Diagram theme (default, dark, forest, neutral)
+            backend: "ink" or "local" (default: MERMAID_BACKEND env var)
 
         Returns:
             True if successful, False otherwise
         """
         import base64
+        # Imported here: mermaid_render itself imports this module
+        from mermaid_render import render_mermaid, LOCAL_MERMAID
+
+        if (backend or MERMAID_BACKEND) == 'local':
+            return render_mermaid(mermaid_code, output_path, theme)
 
         # Encode mermaid code for URL
         encoded = base64.urlsafe_b64encode(mermaid_code.encode('utf-8')).decode('utf-8')
         url = f"https://mermaid.ink/img/{encoded}?theme={theme}"
 
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+        cache_key = AssetCache.make_key("https://mermaid.ink/img", {
+            "code": mermaid_code, "theme": theme
+        })
+        if CACHE.fetch(cache_key, output_path):
+            return True
 
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+        try:
+            HTTP.download(url, output_path, timeout=30)
+            CACHE.put(cache_key, output_path)
             return True
 
         except Exception as e:
             print(f"Error generating Mermaid diagram: {e}")
+            if LOCAL_MERMAID:
+                print("  Rendering diagram locally instead")
+                return render_mermaid(mermaid_code, output_path, theme)
             return False
 
 
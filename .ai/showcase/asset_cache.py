@@ -0,0 +1,153 @@
+"""
+Asset Cache
+Content-addressed on-disk cache for generated presentation assets.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Default cache location (repo root/.cache/assets), overridable via .env
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "assets"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+
+class AssetCache:
+    """
+    Content-addressed asset cache with size-bounded LRU eviction.
+
+    Entries are keyed on a canonical SHA-256 of (endpoint, payload), so any
+    byte-identical request maps to the same file. Recency is tracked with
+    the file mtime, which is bumped on every hit.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 enabled: bool = True):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict[str, Any]) -> str:
+        """
+        Build a canonical cache key for a request.
+
+        Args:
+            endpoint: Provider endpoint or logical generator name
+            payload: Request parameters (config, prompt, size, theme, ...)
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON encoding
+        """
+        canonical = json.dumps(
+            {"endpoint": endpoint, "payload": payload},
+            sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached file for a key (marking it recently used), or None"""
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def fetch(self, key: str, output_path) -> bool:
+        """
+        Copy a cached entry to output_path.
+
+        Returns:
+            True on a cache hit, False otherwise
+        """
+        cached = self.get(key)
+        if cached is None:
+            return False
+
+        try:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, output_path)
+            return True
+        except OSError as e:
+            print(f"Error reading cached asset {key[:12]}: {e}")
+            return False
+
+    def put(self, key: str, source_path) -> Optional[Path]:
+        """
+        Store a copy of source_path under key and evict old entries if needed.
+
+        Returns:
+            Path of the cache entry, or None if caching is disabled/failed
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(source_path, tmp_name)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            print(f"Error caching asset {key[:12]}: {e}")
+            return None
+
+        self.evict()
+        return path
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*/*"):
+                if path.suffix == ".tmp":
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Delete every cache entry"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def default_cache() -> AssetCache:
+    """Build the shared cache from ASSET_CACHE_* environment variables"""
+    cache_dir = os.getenv('ASSET_CACHE_DIR') or None
+    max_mb = os.getenv('ASSET_CACHE_MAX_MB')
+    max_bytes = int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES
+    enabled = os.getenv('ASSET_CACHE_DISABLED', '').lower() not in ('1', 'true', 'yes')
+    return AssetCache(cache_dir, max_bytes=max_bytes, enabled=enabled)
@@ -0,0 +1,319 @@
+"""
+Asset Catalog
+Persistent index of assets/ (size, aspect, hash, tags) with O(1) lookup by name, path and tag.
+"""
+
+import os
+import re
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Iterable, Tuple
+
+from PIL import Image
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_ASSETS_DIR = REPO_ROOT / "assets"
+DEFAULT_INDEX_PATH = REPO_ROOT / ".cache" / "asset-catalog.json"
+FIGMA_MANIFEST_NAME = "figma-sync-manifest.json"
+
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.svg'}
+INDEX_VERSION = 1
+
+TAG_SPLIT = re.compile(r'[^a-z0-9]+')
+SVG_ROOT = re.compile(rb'<svg\b[^>]*>', re.IGNORECASE | re.DOTALL)
+SVG_ATTR = re.compile(rb'\b(width|height|viewBox)\s*=\s*["\']([^"\']+)["\']')
+
+
+def _tokens(text: str) -> List[str]:
+    """Lowercase word tokens usable as tags (drops numbers and 1-letter noise)"""
+    return [t for t in TAG_SPLIT.split(text.lower()) if len(t) > 1 and not t.isdigit()]
+
+
+def _svg_size(path: Path) -> Tuple[Optional[int], Optional[int]]:
+    """Intrinsic SVG size from width/height, falling back to the viewBox"""
+    with open(path, 'rb') as f:
+        match = SVG_ROOT.search(f.read(4096))
+    if not match:
+        return None, None
+
+    attrs = {k.decode(): v.decode() for k, v in SVG_ATTR.findall(match.group(0))}
+    try:
+        return round(float(attrs['width'])), round(float(attrs['height']))
+    except (KeyError, ValueError):
+        pass
+    try:
+        _, _, width, height = (float(v) for v in re.split(r'[\s,]+', attrs['viewBox'].strip()))
+        return round(width), round(height)
+    except (KeyError, ValueError):
+        return None, None
+
+
+class AssetCatalog:
+    """
+    Index of every image under assets/, persisted between runs.
+
+    Each entry records path, category, format, pixel size, aspect ratio,
+    SHA-256, and tags (from folder names, the file name, and the Figma
+    page/category in figma-sync-manifest.json). refresh() only re-reads
+    files whose mtime or size changed.
+
+        catalog = AssetCatalog()
+        catalog.refresh()
+        logo = catalog.path("logo")
+        wide = catalog.find(tag="undraw", min_width=1200, aspect=16/9)
+    """
+
+    def __init__(self, assets_dir=None, index_path=None):
+        self.assets_dir = Path(assets_dir) if assets_dir else DEFAULT_ASSETS_DIR
+        self.index_path = Path(index_path) if index_path else DEFAULT_INDEX_PATH
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._figma_mtime = None
+        self._by_name: Dict[str, List[str]] = {}
+        self._by_tag: Dict[str, set] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('assets_dir') != str(self.assets_dir):
+            return
+        self.entries = data.get('entries', {})
+        self._figma_mtime = data.get('figma_mtime')
+        self._build_indexes()
+
+    def _save(self):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'assets_dir': str(self.assets_dir),
+                'figma_mtime': self._figma_mtime,
+                'entries': self.entries
+            }, f, indent=1, sort_keys=True)
+        os.replace(tmp_name, self.index_path)
+
+    def _build_indexes(self):
+        self._by_name = {}
+        self._by_tag = {}
+        for rel_path in sorted(self.entries):
+            entry = self.entries[rel_path]
+            self._by_name.setdefault(entry['name'], []).append(rel_path)
+            for tag in entry['tags']:
+                self._by_tag.setdefault(tag, set()).add(rel_path)
+
+    def _figma_items(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Map path keys to Figma node info from the sync manifest.
+
+        Keys are the filename stems FigmaSync writes (the node name,
+        lowercased, spaces to dashes), which may include sub-folders
+        (e.g. remix-icons/fill/logos/alipay-fill).
+        """
+        try:
+            with open(self.assets_dir / FIGMA_MANIFEST_NAME) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        items = {}
+        for category, nodes in manifest.get('organization', {}).items():
+            for item in nodes:
+                key = item['name'].lower().replace(' ', '-')
+                items[key] = {'figma_id': item['id'], 'figma_category': category,
+                              'figma_page': item.get('page', '')}
+        return items
+
+    def _describe(self, path: Path, rel_path: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Read size and hash for one file"""
+        if path.suffix.lower() == '.svg':
+            width, height = _svg_size(path)
+        else:
+            try:
+                with Image.open(path) as img:  # reads the header only
+                    width, height = img.size
+            except OSError:
+                width = height = None
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+        parts = Path(rel_path).parts
+        return {
+            'path': rel_path,
+            'name': path.stem.lower(),
+            'category': '/'.join(parts[:2]) if len(parts) > 2 else parts[0] if len(parts) > 1 else '',
+            'format': path.suffix.lower().lstrip('.'),
+            'width': width,
+            'height': height,
+            'aspect': round(width / height, 4) if width and height else None,
+            'sha256': digest.hexdigest(),
+            'bytes': stat.st_size,
+            'mtime': stat.st_mtime,
+        }
+
+    def _tag(self, entry: Dict[str, Any], figma: Dict[str, Dict[str, Any]]):
+        """(Re)compute an entry's tags and Figma fields"""
+        rel = Path(entry['path'])
+        tags = set()
+        for part in rel.parts[:-1]:
+            tags.update(_tokens(part))
+        tags.update(_tokens(rel.stem))
+        tags.add(entry['format'])
+
+        # Longest matching path suffix wins (remix-icons/.../alipay-fill before alipay-fill)
+        stem_parts = rel.with_suffix('').parts
+        for i in range(len(stem_parts)):
+            info = figma.get('/'.join(stem_parts[i:]))
+            if info:
+                entry.update(info)
+                tags.add(info['figma_category'])
+                tags.update(_tokens(info['figma_page']))
+                tags.add('figma')
+                break
+
+        entry['tags'] = sorted(tags)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with assets/.
+
+        Only new files and files whose mtime or size changed are re-read;
+        tags are recomputed for all entries when the Figma manifest changes.
+
+        Returns:
+            Counts of added, updated, removed and unchanged entries
+        """
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+        figma_path = self.assets_dir / FIGMA_MANIFEST_NAME
+        figma_mtime = figma_path.stat().st_mtime if figma_path.exists() else None
+        retag_all = figma_mtime != self._figma_mtime
+        figma = self._figma_items() if retag_all else None
+
+        seen = set()
+        for root, dirs, files in os.walk(self.assets_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for filename in files:
+                path = Path(root) / filename
+                if path.suffix.lower() not in IMAGE_SUFFIXES:
+                    continue
+                rel_path = path.relative_to(self.assets_dir).as_posix()
+                seen.add(rel_path)
+
+                stat = path.stat()
+                entry = self.entries.get(rel_path)
+                if entry and entry['mtime'] == stat.st_mtime and entry['bytes'] == stat.st_size:
+                    counts['unchanged'] += 1
+                    if retag_all:
+                        self._tag(entry, figma)
+                    continue
+
+                counts['updated' if entry else 'added'] += 1
+                entry = self._describe(path, rel_path, stat)
+                if figma is None:
+                    figma = self._figma_items()
+                self._tag(entry, figma)
+                self.entries[rel_path] = entry
+
+        for rel_path in set(self.entries) - seen:
+            del self.entries[rel_path]
+            counts['removed'] += 1
+
+        changed = counts['added'] or counts['updated'] or counts['removed'] or retag_all
+        self._figma_mtime = figma_mtime
+        if changed or not self.index_path.exists():
+            self._build_indexes()
+            self._save()
+        return counts
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry by relative path (e.g. "brand/logos/logo.png") or
+        by file name without extension (e.g. "logo"); raster formats win
+        over SVG when both exist.
+        """
+        entry = self.entries.get(key)
+        if entry:
+            return entry
+        paths = self._by_name.get(key.lower())
+        if not paths:
+            return None
+        return min((self.entries[p] for p in paths), key=lambda e: (e['format'] == 'svg', e['path']))
+
+    def path(self, key: str) -> Optional[Path]:
+        """Absolute path for a name or relative path, or None if not catalogued"""
+        entry = self.get(key)
+        return self.assets_dir / entry['path'] if entry else None
+
+    def resolve(self, names: Dict[str, str]) -> Dict[str, Path]:
+        """
+        Resolve {label: asset name} to {label: absolute path} up front.
+
+        Missing assets are reported once here (before any rendering) and
+        left out of the result.
+        """
+        resolved = {}
+        missing = []
+        for label, name in names.items():
+            path = self.path(name)
+            if path is None or not path.exists():
+                missing.append(f"{label} ({name})")
+            else:
+                resolved[label] = path
+        if missing:
+            print(f"WARNING: {len(missing)} asset(s) not found in {self.assets_dir}:")
+            for item in missing:
+                print(f"  [X] {item}")
+        return resolved
+
+    def find(self, tag: Optional[str] = None, category: Optional[str] = None,
+             format: Optional[str] = None, min_width: Optional[int] = None,
+             min_height: Optional[int] = None, aspect: Optional[float] = None,
+             aspect_tolerance: float = 0.05) -> List[Dict[str, Any]]:
+        """
+        Query entries by tag, category, format, minimum size and aspect ratio.
+
+        Returns:
+            Matching entries sorted by path
+        """
+        if tag is not None:
+            candidates: Iterable[str] = self._by_tag.get(tag.lower(), ())
+        else:
+            candidates = self.entries
+
+        results = []
+        for rel_path in candidates:
+            entry = self.entries[rel_path]
+            if category and not entry['category'].startswith(category):
+                continue
+            if format and entry['format'] != format.lower().lstrip('.'):
+                continue
+            if min_width and (entry['width'] or 0) < min_width:
+                continue
+            if min_height and (entry['height'] or 0) < min_height:
+                continue
+            if aspect and (not entry['aspect'] or abs(entry['aspect'] - aspect) > aspect * aspect_tolerance):
+                continue
+            results.append(entry)
+        return sorted(results, key=lambda e: e['path'])
+
+    def tags(self) -> Dict[str, int]:
+        """Tag -> number of assets"""
+        return {tag: len(paths) for tag, paths in sorted(self._by_tag.items())}
+
+
+if __name__ == "__main__":
+    catalog = AssetCatalog()
+    counts = catalog.refresh()
+    print(f"Catalog: {len(catalog.entries)} assets "
+          f"({counts['added']} added, {counts['updated']} updated, "
+          f"{counts['removed']} removed, {counts['unchanged']} unchanged)")
+    print(f"Index: {catalog.index_path}")
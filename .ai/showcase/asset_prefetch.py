@@ -0,0 +1,96 @@
+"""
+Asset Prefetcher
+Fans asset generation jobs out over a bounded thread pool with per-provider limits.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from typing import Any, Callable, Dict, Optional
+
+# Concurrent requests allowed per provider (slow/paid APIs get fewer slots)
+DEFAULT_PROVIDER_LIMITS = {
+    'ideogram': 2,
+    'unsplash': 2,
+    'pexels': 2,
+    'quickchart': 4,
+    'mermaid': 4,
+    'dicebear': 4,
+}
+
+
+class AssetPrefetcher:
+    """
+    Run independent asset jobs concurrently and collect their results.
+
+    Jobs are registered with add() under a group (e.g. 'charts') and a name
+    (e.g. 'roi'); run() returns {group: {name: result}} containing only jobs
+    that returned a non-None result, matching the dicts the sequential
+    generators used to build.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 provider_limits: Optional[Dict[str, int]] = None):
+        self.max_workers = max_workers or int(os.getenv('ASSET_PREFETCH_WORKERS', '8'))
+        self.provider_limits = dict(DEFAULT_PROVIDER_LIMITS)
+        if provider_limits:
+            self.provider_limits.update(provider_limits)
+        self._jobs = []
+
+    def add(self, group: str, name: str, provider: str,
+            fn: Callable[..., Any], *args, **kwargs):
+        """
+        Register a job.
+
+        Args:
+            group: Result group the job belongs to
+            name: Key of the result within its group
+            provider: Provider name used for the concurrency limit
+            fn: Callable returning the asset (e.g. a Path) or None on failure
+        """
+        self._jobs.append((group, name, provider, fn, args, kwargs))
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def _interleaved(self):
+        """Order jobs round-robin across providers so limited providers don't starve the pool"""
+        by_provider = OrderedDict()
+        for job in self._jobs:
+            by_provider.setdefault(job[2], []).append(job)
+        for batch in zip_longest(*by_provider.values()):
+            for job in batch:
+                if job is not None:
+                    yield job
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Execute every registered job and return {group: {name: result}}"""
+        semaphores = {
+            provider: threading.BoundedSemaphore(self.provider_limits.get(provider, self.max_workers))
+            for provider in {job[2] for job in self._jobs}
+        }
+
+        def execute(job):
+            group, name, provider, fn, args, kwargs = job
+            with semaphores[provider]:
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    print(f"    [X] {group}/{name} failed: {e}")
+                    return None
+
+        results = {job[0]: {} for job in self._jobs}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(job, executor.submit(execute, job)) for job in self._interleaved()]
+
+        # Preserve registration order in the returned dicts
+        completed = {(job[0], job[1]): future.result() for job, future in futures}
+        for group, name, *_ in self._jobs:
+            result = completed[(group, name)]
+            if result is not None:
+                results[group][name] = result
+
+        self._jobs = []
+        return results
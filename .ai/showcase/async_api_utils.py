@@ -0,0 +1,416 @@
+"""
+Async API Utilities for Presentation Generation
+Coroutine versions of the APIUtils operations for high-concurrency batch builds.
+"""
+
+import os
+import base64
+import asyncio
+from typing import Optional, Dict, Any
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from asset_cache import AssetCache
+from http_session import (
+    RETRY_STATUSES, IDEMPOTENT_METHODS, CHUNK_SIZE, DEFAULT_MAX_DOWNLOAD_BYTES, AtomicDownload, retry_delay
+)
+from api_utils import (
+    CACHE, CHART_BACKEND, MERMAID_BACKEND, AVATAR_BACKEND, IDEOGRAM_API_KEY, PEXELS_API_KEY, UNSPLASH_ACCESS_KEY,
+    QUICKCHART_URL, SHORT_URLS, quickchart_keys, quickchart_request
+)
+from chart_render import render_chart, LOCAL_CHARTS
+from mermaid_render import render_mermaid, LOCAL_MERMAID
+from avatar_render import render_avatar
+
+# Requests in flight per provider; the connector caps the total
+ASYNC_PROVIDER_LIMITS = {
+    'ideogram': 4,
+    'unsplash': 10,
+    'pexels': 10,
+    'quickchart': 32,
+    'mermaid': 32,
+    'dicebear': 32,
+    'download': 64,
+}
+
+
+class AsyncAPIUtils:
+    """
+    Async counterpart of APIUtils sharing one aiohttp connection pool.
+
+    Use as an async context manager so the pool is closed when done:
+
+        async with AsyncAPIUtils() as api:
+            await asyncio.gather(
+                api.generate_quickchart(config, "chart.png"),
+                api.get_dicebear_avatar("alice", "alice.png"),
+            )
+
+    Each provider is rate limited by its own semaphore, and results share
+    the same on-disk cache as the synchronous APIUtils.
+    """
+
+    def __init__(self, max_connections: Optional[int] = None,
+                 limit_per_host: int = 32,
+                 provider_limits: Optional[Dict[str, int]] = None,
+                 max_retries: Optional[int] = None,
+                 backoff_base: Optional[float] = None,
+                 timeout: float = 30):
+        if aiohttp is None:
+            raise ImportError("AsyncAPIUtils requires aiohttp: pip install aiohttp")
+
+        self.max_connections = max_connections or int(os.getenv('ASYNC_HTTP_MAX_CONNECTIONS', '200'))
+        self.limit_per_host = limit_per_host
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('HTTP_MAX_RETRIES', '3'))
+        self.backoff_base = (backoff_base if backoff_base is not None
+                             else float(os.getenv('HTTP_BACKOFF_BASE', '0.5')))
+        self.timeout = timeout
+        self.provider_limits = dict(ASYNC_PROVIDER_LIMITS)
+        if provider_limits:
+            self.provider_limits.update(provider_limits)
+
+        self._session = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Create the shared connection pool"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.limit_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout)
+            )
+
+    async def close(self):
+        """Close the shared connection pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        if provider not in self._semaphores:
+            self._semaphores[provider] = asyncio.Semaphore(
+                self.provider_limits.get(provider, self.limit_per_host)
+            )
+        return self._semaphores[provider]
+
+    async def _request(self, provider: str, method: str, url: str,
+                       read: str = 'json', output_path: Optional[str] = None,
+                       max_bytes: Optional[int] = DEFAULT_MAX_DOWNLOAD_BYTES,
+                       retry: Optional[bool] = None, **kwargs):
+        """
+        Send a request with provider rate limiting and jittered retries.
+
+        Args:
+            provider: Semaphore name for rate limiting
+            method: HTTP method
+            url: Request URL
+            read: 'json' to return decoded JSON, 'file' to stream the body
+                  to output_path (returns the SHA-256 digest)
+            output_path: Destination for read='file'
+            max_bytes: Size limit for read='file'
+            retry: Retry on 429/5xx and connection errors (default: only
+                   for idempotent methods, as in HTTPSessionPool)
+
+        Raises:
+            aiohttp.ClientError on a final failure
+        """
+        await self.open()
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+        max_retries = self.max_retries if retry else 0
+
+        async with self._semaphore(provider):
+            for attempt in range(max_retries + 1):
+                retry_after = None
+                try:
+                    async with self._session.request(method, url, **kwargs) as response:
+                        if response.status in RETRY_STATUSES and attempt < max_retries:
+                            retry_after = response.headers.get('Retry-After')
+                        else:
+                            response.raise_for_status()
+                            if read == 'file':
+                                return await self._stream(response, output_path, max_bytes)
+                            return await response.json()
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == max_retries:
+                        raise
+
+                await asyncio.sleep(retry_delay(attempt, retry_after, self.backoff_base))
+
+    @staticmethod
+    async def _stream(response, output_path: str, max_bytes: Optional[int]) -> Optional[str]:
+        """Stream a response body to disk in chunks, renaming into place when complete"""
+        with AtomicDownload(output_path, max_bytes) as out:
+            out.check_length(response.headers.get('Content-Length'))
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                out.write(chunk)
+        return out.hexdigest
+
+    async def _cached(self, cache_key: str, output_path: str) -> bool:
+        return await asyncio.to_thread(CACHE.fetch, cache_key, output_path)
+
+    async def _store(self, cache_key: str, output_path: str):
+        await asyncio.to_thread(CACHE.put, cache_key, output_path)
+
+    async def download_image(self, url: str, output_path: str) -> bool:
+        """
+        Download an image from a URL and save it locally.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request('download', 'GET', url, read='file',
+                                output_path=output_path)
+            return True
+        except Exception as e:
+            print(f"Error downloading image from {url}: {e}")
+            return False
+
+    async def generate_ideogram_image(self, prompt: str, output_path: str,
+                                      aspect_ratio: str = "ASPECT_16_9",
+                                      model: str = "V_2_TURBO") -> bool:
+        """Generate an image using Ideogram API (see APIUtils.generate_ideogram_image)"""
+        if not IDEOGRAM_API_KEY:
+            print("Ideogram API key not found")
+            return False
+
+        url = "https://api.ideogram.ai/generate"
+        headers = {
+            "Api-Key": IDEOGRAM_API_KEY,
+            "Content-Type": "application/json"
+        }
+
+        payload = {
+            "image_request": {
+                "prompt": prompt,
+                "aspect_ratio": aspect_ratio,
+                "model": model,
+                "magic_prompt_option": "AUTO"
+            }
+        }
+
+        cache_key = AssetCache.make_key(url, payload)
+        if await self._cached(cache_key, output_path):
+            return True
+
+        try:
+            data = await self._request('ideogram', 'POST', url,
+                                       json=payload, headers=headers)
+            if data.get('data') and len(data['data']) > 0:
+                image_url = data['data'][0]['url']
+                if await self.download_image(image_url, output_path):
+                    await self._store(cache_key, output_path)
+                    return True
+                return False
+            else:
+                print("No image generated by Ideogram")
+                return False
+
+        except Exception as e:
+            print(f"Error generating Ideogram image: {e}")
+            return False
+
+    async def get_unsplash_image(self, query: str, output_path: str,
+                                 orientation: str = "landscape") -> bool:
+        """Get a random image from Unsplash (see APIUtils.get_unsplash_image)"""
+        if not UNSPLASH_ACCESS_KEY:
+            print("Unsplash access key not found")
+            return False
+
+        url = "https://api.unsplash.com/photos/random"
+        headers = {
+            "Authorization": f"Client-ID {UNSPLASH_ACCESS_KEY}"
+        }
+        params = {
+            "query": query,
+            "orientation": orientation
+        }
+
+        try:
+            data = await self._request('unsplash', 'GET', url,
+                                       headers=headers, params=params)
+            image_url = data['urls']['regular']
+            return await self.download_image(image_url, output_path)
+
+        except Exception as e:
+            print(f"Error fetching Unsplash image: {e}")
+            return False
+
+    async def get_pexels_image(self, query: str, output_path: str,
+                               orientation: str = "landscape") -> bool:
+        """Get an image from Pexels (see APIUtils.get_pexels_image)"""
+        if not PEXELS_API_KEY:
+            print("Pexels API key not found")
+            return False
+
+        url = "https://api.pexels.com/v1/search"
+        headers = {
+            "Authorization": PEXELS_API_KEY
+        }
+        params = {
+            "query": query,
+            "orientation": orientation,
+            "per_page": 1
+        }
+
+        try:
+            data = await self._request('pexels', 'GET', url,
+                                       headers=headers, params=params)
+            if data.get('photos') and len(data['photos']) > 0:
+                image_url = data['photos'][0]['src']['large']
+                return await self.download_image(image_url, output_path)
+            else:
+                print("No images found on Pexels")
+                return False
+
+        except Exception as e:
+            print(f"Error fetching Pexels image: {e}")
+            return False
+
+    async def generate_quickchart(self, chart_config: Dict[str, Any],
+                                  output_path: str,
+                                  width: int = 800,
+                                  height: int = 600,
+                                  backend: Optional[str] = None) -> bool:
+        """Generate a chart using QuickChart.io (see APIUtils.generate_quickchart)"""
+        if (backend or CHART_BACKEND) == 'local':
+            # CPU-bound: render in a worker thread so other requests keep flowing
+            return await asyncio.get_running_loop().run_in_executor(
+                None, render_chart, chart_config, output_path, width, height)
+
+        cache_key, index_key = quickchart_keys(chart_config, width, height)
+        if await self._cached(cache_key, output_path):
+            return True
+
+        try:
+            method, url, kwargs = await asyncio.to_thread(quickchart_request, chart_config, width, height)
+            try:
+                await self._request('quickchart', method, url, read='file',
+                                    output_path=output_path, retry=True, **kwargs)
+            except Exception as e:
+                if url == QUICKCHART_URL:
+                    raise
+                # The recorded short URL stopped working: forget it and send the config
+                print(f"QuickChart short URL failed ({e}); posting the config instead")
+                await asyncio.to_thread(SHORT_URLS.delete, index_key)
+                method, url, kwargs = await asyncio.to_thread(quickchart_request, chart_config, width, height,
+                                                              False)
+                await self._request('quickchart', method, url, read='file',
+                                    output_path=output_path, retry=True, **kwargs)
+            await self._store(cache_key, output_path)
+            return True
+
+        except Exception as e:
+            print(f"Error generating QuickChart: {e}")
+            if LOCAL_CHARTS:
+                print("  Rendering chart locally instead")
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, render_chart, chart_config, output_path, width, height)
+            return False
+
+    async def generate_quickcharts(self, charts: Dict[str, Dict[str, Any]],
+                                   backend: Optional[str] = None) -> Dict[str, bool]:
+        """Generate several charts concurrently (see APIUtils.generate_quickcharts)"""
+        names = list(charts)
+        results = await asyncio.gather(*(
+            self.generate_quickchart(charts[name]['config'], str(charts[name]['output_path']),
+                                     charts[name].get('width', 800), charts[name].get('height', 600), backend)
+            for name in names
+        ))
+        return dict(zip(names, results))
+
+    async def quickchart_short_url(self, chart_config: Dict[str, Any], width: int = 800,
+                                   height: int = 600) -> Optional[str]:
+        """Get (or reuse) a QuickChart short URL (see APIUtils.quickchart_short_url)"""
+        _, index_key = quickchart_keys(chart_config, width, height)
+        short_url = await asyncio.to_thread(SHORT_URLS.get, index_key)
+        if short_url:
+            return short_url
+
+        try:
+            data = await self._request('quickchart', 'POST', f"{QUICKCHART_URL}/create", json={
+                "chart": chart_config, "width": width, "height": height, "format": "png"
+            })
+            if not data.get('success') or not data.get('url'):
+                print(f"QuickChart did not return a short URL: {data}")
+                return None
+            await asyncio.to_thread(SHORT_URLS.put, index_key, data['url'])
+            return data['url']
+
+        except Exception as e:
+            print(f"Error creating QuickChart short URL: {e}")
+            return None
+
+    async def get_dicebear_avatar(self, seed: str, output_path: str,
+                                  style: str = "avataaars", size: int = 200,
+                                  backend: Optional[str] = None) -> bool:
+        """Generate an avatar, drawn locally or via DiceBear (see APIUtils.get_dicebear_avatar)"""
+        if (backend or AVATAR_BACKEND) == 'local':
+            return await asyncio.to_thread(render_avatar, seed, output_path, style, size)
+
+        url = f"https://api.dicebear.com/7.x/{style}/png"
+        params = {
+            "seed": seed,
+            "size": size
+        }
+
+        cache_key = AssetCache.make_key(url, params)
+        if await self._cached(cache_key, output_path):
+            return True
+
+        try:
+            await self._request('dicebear', 'GET', url, read='file',
+                                output_path=output_path, params=params)
+            await self._store(cache_key, output_path)
+            return True
+
+        except Exception as e:
+            print(f"Error generating DiceBear avatar: {e}")
+            print("  Rendering avatar locally instead")
+            return await asyncio.to_thread(render_avatar, seed, output_path, style, size)
+
+    async def generate_mermaid_diagram(self, mermaid_code: str, output_path: str,
+                                       theme: str = "default",
+                                       backend: Optional[str] = None) -> bool:
+        """Generate a diagram using mermaid.ink (see APIUtils.generate_mermaid_diagram)"""
+        if (backend or MERMAID_BACKEND) == 'local':
+            return await asyncio.get_running_loop().run_in_executor(
+                None, render_mermaid, mermaid_code, output_path, theme)
+
+        encoded = base64.urlsafe_b64encode(mermaid_code.encode('utf-8')).decode('utf-8')
+        url = f"https://mermaid.ink/img/{encoded}?theme={theme}"
+
+        cache_key = AssetCache.make_key("https://mermaid.ink/img", {
+            "code": mermaid_code, "theme": theme
+        })
+        if await self._cached(cache_key, output_path):
+            return True
+
+        try:
+            await self._request('mermaid', 'GET', url, read='file',
+                                output_path=output_path)
+            await self._store(cache_key, output_path)
+            return True
+
+        except Exception as e:
+            print(f"Error generating Mermaid diagram: {e}")
+            if LOCAL_MERMAID:
+                print("  Rendering diagram locally instead")
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, render_mermaid, mermaid_code, output_path, theme)
+            return False
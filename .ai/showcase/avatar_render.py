@@ -0,0 +1,201 @@
+"""
+Local Avatar Renderer
+Draws deterministic avatars (identicon, initials, geometric) from a seed with Pillow, as an offline alternative to DiceBear.
+"""
+
+import os
+import colorsys
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from asset_cache import AssetCache
+from api_utils import CACHE
+from http_session import replace_file
+
+# Bump when the drawing changes so cached avatars are redrawn
+AVATAR_VERSION = 1
+
+LOCAL_STYLES = ('identicon', 'initials', 'geometric')
+
+# DiceBear style -> closest local style (unknown styles draw identicons)
+DICEBEAR_STYLES = {
+    'avataaars': 'initials',
+    'lorelei': 'initials',
+    'personas': 'initials',
+    'micah': 'initials',
+    'adventurer': 'initials',
+    'big-smile': 'initials',
+    'notionists': 'initials',
+    'bottts': 'geometric',
+    'fun-emoji': 'geometric',
+    'shapes': 'geometric',
+    'rings': 'geometric',
+    'thumbs': 'geometric',
+    'pixel-art': 'identicon',
+    'identicon': 'identicon',
+    'initials': 'initials',
+}
+
+# Drawn at this multiple of the output size, then downsampled (anti-aliasing)
+SUPERSAMPLE = 4
+
+BOLD_FONTS = ('DejaVuSans-Bold.ttf', 'Arial Bold.ttf', 'arialbd.ttf', 'Helvetica-Bold.ttf')
+
+
+def local_style(style: str) -> str:
+    """Local style for a local or DiceBear style name"""
+    return style if style in LOCAL_STYLES else DICEBEAR_STYLES.get(style, 'identicon')
+
+
+def _digest(seed: str, style: str) -> bytes:
+    return hashlib.sha256(f"{style}:{seed}".encode('utf-8')).digest()
+
+
+def _palette(digest: bytes) -> Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]]:
+    """(background, primary, accent) colours derived from the seed hash"""
+    hue = digest[0] / 255
+
+    def hls(h, lightness, saturation):
+        return tuple(int(c * 255) for c in colorsys.hls_to_rgb(h % 1.0, lightness, saturation))
+
+    background = hls(hue, 0.93, 0.45)
+    primary = hls(hue, 0.42 + digest[1] / 255 * 0.12, 0.55 + digest[2] / 255 * 0.3)
+    accent = hls(hue + 0.33 + digest[3] / 255 * 0.33, 0.55, 0.6)
+    return background, primary, accent
+
+
+def _bits(digest: bytes) -> List[bool]:
+    return [bool(byte >> shift & 1) for byte in digest for shift in range(8)]
+
+
+def _draw_identicon(draw: ImageDraw.ImageDraw, size: int, digest: bytes, colors):
+    """5x5 grid mirrored left-right (GitHub identicon layout)"""
+    _, primary, _ = colors
+    margin = size // 10
+    cell = (size - 2 * margin) / 5
+    bits = _bits(digest[4:])
+    for row in range(5):
+        for col in range(3):
+            if bits[row * 3 + col]:
+                for c in {col, 4 - col}:
+                    x, y = margin + c * cell, margin + row * cell
+                    draw.rectangle([x, y, x + cell, y + cell], fill=primary)
+
+
+def _font(size: int):
+    for name in BOLD_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def _initials(seed: str) -> str:
+    words = [w for w in seed.replace('_', ' ').replace('-', ' ').split() if w[:1].isalnum()]
+    if len(words) >= 2:
+        return (words[0][0] + words[-1][0]).upper()
+    return (words[0][:2] if words else seed[:2] or '?').upper()
+
+
+def _draw_initials(draw: ImageDraw.ImageDraw, size: int, digest: bytes, colors, seed: str):
+    """Initials on a coloured disc"""
+    _, primary, _ = colors
+    draw.ellipse([0, 0, size - 1, size - 1], fill=primary)
+    text = _initials(seed)
+    font = _font(int(size * (0.42 if len(text) > 1 else 0.5)))
+    draw.text((size / 2, size / 2), text, font=font, fill=(255, 255, 255), anchor='mm')
+
+
+def _draw_geometric(draw: ImageDraw.ImageDraw, size: int, digest: bytes, colors):
+    """Overlapping circles, squares and triangles placed by the seed hash"""
+    _, primary, accent = colors
+    for i in range(3):
+        b = digest[4 + i * 4:8 + i * 4]
+        radius = size * (0.18 + b[0] / 255 * 0.14)
+        cx = size * (0.25 + b[1] / 255 * 0.5)
+        cy = size * (0.25 + b[2] / 255 * 0.5)
+        fill = primary if i % 2 == 0 else accent
+        shape = b[3] % 3
+        if shape == 0:
+            draw.ellipse([cx - radius, cy - radius, cx + radius, cy + radius], fill=fill)
+        elif shape == 1:
+            draw.rectangle([cx - radius, cy - radius, cx + radius, cy + radius], fill=fill)
+        else:
+            draw.polygon([(cx, cy - radius), (cx + radius, cy + radius), (cx - radius, cy + radius)], fill=fill)
+
+
+def draw_avatar(seed: str, style: str = 'identicon', size: int = 200) -> Image.Image:
+    """
+    Draw an avatar in memory; the same (seed, style, size) always gives the same image.
+
+    Args:
+        seed: Any string (e.g. a name); also supplies the initials
+        style: identicon, initials or geometric (DiceBear names are mapped)
+        size: Width and height in pixels
+
+    Returns:
+        RGB PIL image
+    """
+    style = local_style(style)
+    digest = _digest(seed, style)
+    colors = _palette(digest)
+    canvas = size * SUPERSAMPLE
+
+    background = (255, 255, 255) if style == 'initials' else colors[0]
+    image = Image.new('RGB', (canvas, canvas), background)
+    draw = ImageDraw.Draw(image)
+    if style == 'initials':
+        _draw_initials(draw, canvas, digest, colors, seed)
+    elif style == 'geometric':
+        _draw_geometric(draw, canvas, digest, colors)
+    else:
+        _draw_identicon(draw, canvas, digest, colors)
+    return image.resize((size, size), Image.LANCZOS)
+
+
+def render_avatar(seed: str, output_path, style: str = 'identicon', size: int = 200) -> bool:
+    """
+    Render an avatar to PNG without the network.
+
+    Cached by (seed, style, size), so a grid of dozens of people is drawn
+    once and copied from the cache on later builds.
+
+    Args:
+        seed: Seed for the avatar (determines its look)
+        output_path: Local path to save the PNG
+        style: identicon, initials or geometric (DiceBear names are mapped)
+        size: Avatar size in pixels
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if isinstance(size, bool) or not isinstance(size, int) or size <= 0:
+        print(f"Error rendering avatar locally: size must be a positive integer, got {size!r}")
+        return False
+
+    style = local_style(style)
+    cache_key = AssetCache.make_key("avatar-local", {
+        "seed": seed, "style": style, "size": size, "version": AVATAR_VERSION
+    })
+    if CACHE.fetch(cache_key, output_path):
+        return True
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.stem}.", suffix=".png")
+    os.close(fd)
+    try:
+        draw_avatar(seed, style, size).save(tmp_name, format='PNG', optimize=True)
+    except (OSError, ValueError) as e:
+        os.unlink(tmp_name)
+        print(f"Error rendering avatar locally: {e}")
+        return False
+
+    replace_file(tmp_name, output_path)
+    CACHE.put(cache_key, output_path)
+    return True
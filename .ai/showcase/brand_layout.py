@@ -0,0 +1,100 @@
+"""
+Brand Layout
+Installs brand decorations (shapes, logo, footer, background) once into a slide layout that slides inherit.
+"""
+
+from typing import Callable, Optional
+
+import pptx
+from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+
+# python-pptx has no public API to add shapes to a layout or to delete a
+# slide, so this module needs two private attributes (Slides._sldIdLst and
+# LayoutShapes._spTree). They are only reached through _private(), and
+# test_brand_layout.py checks the result on the installed version.
+TESTED_PPTX_VERSIONS = ('0.6.', '1.0.')
+
+
+def _private(obj, attr: str):
+    """A python-pptx private attribute, with a clear error if a release removed it"""
+    try:
+        return getattr(obj, attr)
+    except AttributeError:
+        raise RuntimeError(
+            f"brand_layout needs {type(obj).__name__}.{attr}, which python-pptx "
+            f"{pptx.__version__} doesn't have (tested with "
+            f"{', '.join(v + 'x' for v in TESTED_PPTX_VERSIONS)})"
+        ) from None
+
+
+def _remove_slide(prs, slide):
+    """Drop a slide from the deck; its part is no longer written on save"""
+    sld_id_lst = _private(prs.slides, '_sldIdLst')
+    for sld_id in sld_id_lst:
+        if prs.part.related_part(sld_id.rId) is slide.part:
+            sld_id_lst.remove(sld_id)
+            prs.part.drop_rel(sld_id.rId)
+            break
+
+    if any(part is slide.part for part in prs.part.package.iter_parts()):
+        raise RuntimeError("brand_layout: the temporary slide is still part of the presentation")
+
+
+def install_brand_layout(prs, layout, draw: Callable, background: Optional[RGBColor] = None,
+                         name: Optional[str] = None):
+    """
+    Draw brand elements once and move them into a slide layout.
+
+    draw(slide) is called on a temporary slide using the normal python-pptx
+    shape API; every non-placeholder shape it adds is then moved into the
+    layout's shape tree (pictures are re-linked from the layout part) and
+    the temporary slide is removed. Slides added with the layout show the
+    elements behind their own content without copying them, so a brand
+    change means editing one layout instead of every slide.
+
+        layout = install_brand_layout(prs, prs.slide_layouts[6], add_brand_elements,
+                                      background=RGBColor(255, 255, 255))
+        slide = prs.slides.add_slide(layout)
+
+    Args:
+        prs: Presentation to modify
+        layout: Slide layout to brand (modified in place)
+        draw: Callable taking a slide and adding the brand shapes to it
+        background: Solid background colour for the layout
+        name: New layout name (shown in PowerPoint's layout picker)
+
+    Returns:
+        The branded layout
+
+    Raises:
+        RuntimeError if this python-pptx version lacks the internals used
+    """
+    if not pptx.__version__.startswith(TESTED_PPTX_VERSIONS):
+        print(f"Warning: brand_layout is untested with python-pptx {pptx.__version__}")
+
+    tree = _private(layout.shapes, '_spTree')
+    slide = prs.slides.add_slide(layout)
+    draw(slide)
+
+    for shape in list(slide.shapes):
+        if shape.is_placeholder:
+            continue
+        element = shape._element
+        # Image references are relative to the part holding the shape
+        for blip in element.xpath('.//a:blip[@r:embed]'):
+            image_part = slide.part.related_part(blip.get(qn('r:embed')))
+            blip.set(qn('r:embed'), layout.part.relate_to(image_part, RT.IMAGE))
+        element.xpath('./*[1]/p:cNvPr')[0].set('id', str(tree.max_shape_id + 1))
+        tree.append(element)
+
+    _remove_slide(prs, slide)
+
+    if background is not None:
+        fill = layout.background.fill
+        fill.solid()
+        fill.fore_color.rgb = background
+    if name:
+        layout.name = name
+    return layout
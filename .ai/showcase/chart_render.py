@@ -0,0 +1,520 @@
+"""
+Local Chart Renderer
+Renders Chart.js-style configs (bar/line/doughnut/pie) to PNG in-process with matplotlib, as an offline alternative to QuickChart.
+"""
+
+import os
+import re
+import math
+import operator
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.colors import to_rgba
+    from matplotlib.ticker import FuncFormatter
+except ImportError:
+    Figure = None
+
+LOCAL_CHARTS = Figure is not None
+
+from asset_cache import AssetCache
+from api_utils import CACHE
+from http_session import replace_file
+
+# Chart.js sizes are CSS pixels: 96 per inch, 0.75 pt each
+CSS_DPI = 96
+PT_PER_PX = 0.75
+# QuickChart renders at devicePixelRatio 2 by default
+DEVICE_PIXEL_RATIO = 2
+
+# Chart.js defaults
+DEFAULT_FONT_SIZE = 12
+DEFAULT_FONT_COLOR = '#666666'
+DEFAULT_GRID_COLOR = (0, 0, 0, 0.1)
+DEFAULT_COLORS = [
+    'rgb(54, 162, 235)', 'rgb(255, 99, 132)', 'rgb(75, 192, 192)', 'rgb(255, 159, 64)',
+    'rgb(153, 102, 255)', 'rgb(255, 205, 86)', 'rgb(201, 203, 207)'
+]
+BAR_TYPES = {'bar', 'horizontalBar'}
+ROUND_TYPES = {'doughnut', 'pie'}
+
+CSS_RGBA = re.compile(r'rgba?\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)')
+JS_ARROW = re.compile(r'^\(?\s*([A-Za-z_$][\w$]*)[^)=]*\)?\s*=>\s*(.+)$', re.DOTALL)
+JS_FUNCTION = re.compile(r'^function\s*\w*\s*\(\s*([A-Za-z_$][\w$]*)[^)]*\)\s*(.+)$', re.DOTALL)
+JS_RETURN = re.compile(r'^\{\s*return\s+(.+?);?\s*\}$', re.DOTALL)
+JS_STRING = re.compile(r'''^(['"`])(.*)\1$''', re.DOTALL)
+JS_CONDITION = re.compile(r'^(\w+)\s*(>=|<=|===|!==|==|!=|>|<)\s*(-?[\d.]+)$')
+JS_METHOD = re.compile(r'^(\w+)\.(toFixed|toLocaleString)\((\d*)\)$')
+JS_COMPARISONS = {
+    '>': operator.gt, '<': operator.lt, '>=': operator.ge, '<=': operator.le,
+    '==': operator.eq, '===': operator.eq, '!=': operator.ne, '!==': operator.ne,
+}
+
+
+def _color(value, default=None):
+    """CSS colour (rgb()/rgba()/#hex/name) -> matplotlib RGBA tuple"""
+    if not isinstance(value, str):
+        return default
+    match = CSS_RGBA.fullmatch(value.strip())
+    if match:
+        r, g, b, a = match.groups()
+        return (float(r) / 255, float(g) / 255, float(b) / 255, float(a) if a else 1.0)
+    try:
+        return to_rgba(value.strip())
+    except ValueError:
+        return default
+
+
+def _colors(value, count: int, default) -> List:
+    """Per-point colours from a single colour or a (cycled) list"""
+    if isinstance(value, list) and value:
+        return [_color(value[i % len(value)], default) for i in range(count)]
+    return [_color(value, default)] * count
+
+
+def _with_alpha(color, alpha):
+    return color[:3] + (alpha,)
+
+
+def _number(value) -> float:
+    if isinstance(value, dict):  # {x, y} points
+        value = value.get('y')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _js_number(value) -> str:
+    """Format a number the way JavaScript string concatenation does"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return f"{value:g}" if isinstance(value, float) and abs(value) >= 1e16 else str(value)
+
+
+def chart_font(spec: Dict[str, Any], default_size=DEFAULT_FONT_SIZE, default_weight='normal'):
+    """(size in pt, weight) from a v3 `font` dict or v2 fontSize/fontStyle"""
+    font = spec.get('font') or {}
+    size = font.get('size', spec.get('fontSize', default_size))
+    weight = font.get('weight', spec.get('fontStyle', default_weight))
+    return size * PT_PER_PX, 'bold' if str(weight) in ('bold', '600', '700', '800', '900') else 'normal'
+
+
+def _split_top(expr: str, sep: str) -> List[str]:
+    """Split on a single-character separator outside quotes and parentheses"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(expr):
+        if quote:
+            if ch == quote and expr[i - 1] != '\\':
+                quote = None
+        elif ch in '\'"`':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(expr[start:i].strip())
+            start = i + 1
+    parts.append(expr[start:].strip())
+    return parts
+
+
+def _unwrap(expr: str) -> str:
+    """Strip parentheses that enclose the whole expression"""
+    expr = expr.strip()
+    while expr.startswith('(') and expr.endswith(')'):
+        depth = 0
+        for ch in expr[1:-1]:
+            depth += {'(': 1, ')': -1}.get(ch, 0)
+            if depth < 0:
+                return expr  # "(a) + (b)": the outer pair isn't one group
+        expr = expr[1:-1].strip()
+    return expr
+
+
+def _js_expression(expr: str, param: str) -> Optional[Callable[[float], str]]:
+    """Compile `cond ? a : b` / `'pre' + value + 'post'` style expressions"""
+    expr = _unwrap(expr)
+    branches = _split_top(expr, '?')
+    if len(branches) == 2:
+        options = _split_top(branches[1], ':')
+        condition = JS_CONDITION.match(_unwrap(branches[0]))
+        if len(options) != 2 or not condition or condition.group(1) != param:
+            return None
+        then_fn, else_fn = _js_expression(options[0], param), _js_expression(options[1], param)
+        if not then_fn or not else_fn:
+            return None
+        test, limit = JS_COMPARISONS[condition.group(2)], float(condition.group(3))
+        return lambda v: then_fn(v) if test(v, limit) else else_fn(v)
+    if len(branches) != 1:
+        return None
+
+    terms = []
+    for term in map(_unwrap, _split_top(expr, '+')):
+        literal = JS_STRING.match(term)
+        method = JS_METHOD.match(term)
+        if literal:
+            terms.append(lambda v, text=literal.group(2): text)
+        elif term == param:
+            terms.append(_js_number)
+        elif method and method.group(1) == param and method.group(2) == 'toFixed':
+            terms.append(lambda v, digits=int(method.group(3) or 0): f"{v:.{digits}f}")
+        elif method and method.group(1) == param:
+            terms.append(lambda v: f"{int(v):,}" if float(v).is_integer() else f"{v:,}")
+        else:
+            return None
+    return lambda v: ''.join(term(v) for term in terms)
+
+
+def js_formatter(source) -> Optional[Callable[[float], str]]:
+    """
+    Translate a simple JavaScript formatter/callback string into Python.
+
+    Handles arrow and function forms returning string concatenations of
+    the value (optionally .toFixed(n)/.toLocaleString()) and literals,
+    with an optional numeric ternary, e.g.
+    "(value) => value > 0 ? '+$' + value + 'K' : '$' + value + 'K'".
+    Anything else returns None and the default number format is used.
+    """
+    if not isinstance(source, str):
+        return None
+    source = source.strip()
+    match = JS_ARROW.match(source) or JS_FUNCTION.match(source)
+    if not match:
+        return None
+    param, body = match.group(1), match.group(2).strip()
+    if body.startswith('{'):
+        returned = JS_RETURN.match(body)
+        if not returned:
+            return None
+        body = returned.group(1)
+    try:
+        return _js_expression(body.strip(), param)
+    except (ValueError, IndexError):
+        return None
+
+
+def _is_v3(options: Dict[str, Any]) -> bool:
+    """Chart.js v3+ configs use plugins.title/legend and scales keyed by axis id"""
+    scales = options.get('scales') or {}
+    return 'plugins' in options or any(not key.endswith('Axes') for key in scales)
+
+
+def scale_specs(options: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """{axis id: scale options} for v2 (xAxes/yAxes lists) and v3 (keyed) configs"""
+    scales = options.get('scales') or {}
+    specs = {}
+    for axis in ('x', 'y'):
+        for i, spec in enumerate(scales.get(f'{axis}Axes') or []):
+            specs[spec.get('id') or (axis if i == 0 else f'{axis}{i}')] = dict(spec, axis=axis)
+    for key, spec in scales.items():
+        if not key.endswith('Axes') and isinstance(spec, dict):
+            specs[key] = dict(spec, axis=spec.get('axis') or key[0])
+    return specs
+
+
+def _apply_scale(target, which: str, spec: Dict[str, Any], categorical: bool):
+    """Apply ticks, formatter, range, grid and title options to one matplotlib axis"""
+    axis = target.xaxis if which == 'x' else target.yaxis
+    ticks = spec.get('ticks') or {}
+    if spec.get('display') is False:
+        axis.set_visible(False)
+        return
+
+    size, weight = chart_font(ticks)
+    target.tick_params(axis=which, labelsize=size, labelcolor=_color(ticks.get('color', ticks.get('fontColor')),
+                                                                     DEFAULT_FONT_COLOR),
+                       pad=ticks.get('padding', 3) * PT_PER_PX)
+    if categorical:
+        for label in axis.get_ticklabels():
+            label.set_fontweight(weight)
+    else:
+        formatter = js_formatter(ticks.get('callback'))
+        if formatter:
+            axis.set_major_formatter(FuncFormatter(lambda v, pos: formatter(v)))
+
+        low, high = (target.get_xlim() if which == 'x' else target.get_ylim())
+        low = spec.get('min', ticks.get('min', low))
+        high = spec.get('max', ticks.get('max', high))
+        if spec.get('beginAtZero', ticks.get('beginAtZero')):
+            low, high = min(low, 0), max(high, 0)
+        (target.set_xlim if which == 'x' else target.set_ylim)(low, high)
+
+    grid = spec.get('grid') or spec.get('gridLines') or {}
+    show_grid = grid.get('display', not categorical) and grid.get('drawOnChartArea', True)
+    if show_grid:
+        target.grid(True, axis=which, color=_color(grid.get('color'), DEFAULT_GRID_COLOR),
+                    linewidth=grid.get('lineWidth', 1) * PT_PER_PX)
+        target.set_axisbelow(True)
+
+    title = spec.get('title') or {}
+    text = title.get('text')
+    if not text and (spec.get('scaleLabel') or {}).get('display'):
+        title = spec['scaleLabel']
+        text = title.get('labelString')
+    if text and title.get('display', True):
+        title_size, title_weight = chart_font(title)
+        (target.set_xlabel if which == 'x' else target.set_ylabel)(
+            text, fontsize=title_size, fontweight=title_weight,
+            color=_color(title.get('color', title.get('fontColor')), DEFAULT_FONT_COLOR))
+
+
+def _datalabel_style(datalabels: Dict[str, Any]):
+    size, weight = chart_font(datalabels)
+    color = _color(datalabels.get('color'), DEFAULT_FONT_COLOR)
+    formatter = js_formatter(datalabels.get('formatter')) or _js_number
+    return size, weight, color, formatter
+
+
+def _draw_round(fig, ax, kind, labels, datasets, options, datalabels):
+    """Doughnut and pie charts (first dataset)"""
+    dataset = datasets[0]
+    values = [_number(v) for v in dataset.get('data', [])]
+    count = len(values)
+    palette = [_color(DEFAULT_COLORS[i % len(DEFAULT_COLORS)]) for i in range(count)]
+    fills = [c or palette[i] for i, c in enumerate(_colors(dataset.get('backgroundColor'), count, None))]
+    edge = _color(dataset.get('borderColor'), (1, 1, 1, 1))
+    if isinstance(edge, list):
+        edge = edge[0]
+
+    cutout = 0.0
+    if kind == 'doughnut':
+        cutout = options.get('cutout', options.get('cutoutPercentage', 50))
+        cutout = float(str(cutout).rstrip('%')) / 100
+    wedges, _ = ax.pie(values, colors=fills, startangle=90, counterclock=False,
+                       wedgeprops={'width': 1 - cutout, 'edgecolor': edge,
+                                   'linewidth': dataset.get('borderWidth', 2) * PT_PER_PX})
+    # pie() fixes the limits; let the data limits adapt instead of shrinking the box,
+    # so a top legend sits directly above the plot
+    ax.set_autoscale_on(True)
+    ax.margins(0.02)
+    ax.set_aspect('equal', adjustable='datalim')
+    for wedge, label in zip(wedges, labels):
+        wedge.set_label(label)
+
+    if datalabels is not None:
+        size, weight, color, formatter = _datalabel_style(datalabels)
+        radius = 1 - (1 - cutout) / 2
+        for wedge, value in zip(wedges, values):
+            angle = math.radians((wedge.theta1 + wedge.theta2) / 2)
+            ax.text(radius * math.cos(angle), radius * math.sin(angle), formatter(value),
+                    ha='center', va='center', fontsize=size, fontweight=weight, color=color)
+
+
+def _draw_cartesian(fig, ax, kind, labels, datasets, options, datalabels):
+    """Bar (vertical/horizontal, grouped/stacked) and line charts, mixed allowed"""
+    horizontal = kind == 'horizontalBar' or options.get('indexAxis') == 'y'
+    value_axis, category_axis = ('x', 'y') if horizontal else ('y', 'x')
+    specs = scale_specs(options)
+    value_ids = [key for key, spec in specs.items() if spec['axis'] == value_axis] or [value_axis]
+    primary_id = value_ids[0]
+    stacked = any(spec.get('stacked') for spec in specs.values())
+
+    count = max([len(labels)] + [len(d.get('data', [])) for d in datasets])
+    positions = list(range(count))
+    targets = {primary_id: ax}
+
+    def target_for(dataset):
+        axis_id = dataset.get(f'{value_axis}AxisID') or primary_id
+        if axis_id not in targets:
+            targets[axis_id] = ax.twiny() if horizontal else ax.twinx()
+        return targets[axis_id]
+
+    bar_sets = [d for d in datasets if d.get('type', kind) in BAR_TYPES]
+    group = 0.72  # Chart.js categoryPercentage * barPercentage
+    width = group if stacked or not bar_sets else group / len(bar_sets)
+    bottoms_pos, bottoms_neg = [0.0] * count, [0.0] * count
+    label_style = _datalabel_style(datalabels) if datalabels is not None else None
+
+    for index, dataset in enumerate(datasets):
+        values = [_number(v) for v in dataset.get('data', [])]
+        values += [float('nan')] * (count - len(values))
+        base = _color(DEFAULT_COLORS[index % len(DEFAULT_COLORS)])
+        target = target_for(dataset)
+        label = dataset.get('label')
+
+        if dataset.get('type', kind) in BAR_TYPES:
+            fills = _colors(dataset.get('backgroundColor'), count, _with_alpha(base, 0.5))
+            edges = _colors(dataset.get('borderColor'), count, base)
+            if stacked:
+                offsets = positions
+                bottoms = [bottoms_pos[i] if v >= 0 else bottoms_neg[i] for i, v in enumerate(values)]
+            else:
+                shift = (bar_sets.index(dataset) - (len(bar_sets) - 1) / 2) * width
+                offsets = [p + shift for p in positions]
+                bottoms = [0.0] * count
+            draw = target.barh if horizontal else target.bar
+            container = draw(offsets, values, width, bottoms, color=fills, edgecolor=edges,
+                             linewidth=dataset.get('borderWidth', 0) * PT_PER_PX, label=label)
+            if stacked:
+                for i, v in enumerate(values):
+                    if not math.isnan(v):
+                        if v >= 0:
+                            bottoms_pos[i] += v
+                        else:
+                            bottoms_neg[i] += v
+            if label_style:
+                size, weight, color, formatter = label_style
+                centered = 'center' in (datalabels.get('anchor'), datalabels.get('align'))
+                target.bar_label(container, labels=[formatter(v) if not math.isnan(v) else '' for v in values],
+                                 label_type='center' if centered else 'edge',
+                                 padding=datalabels.get('offset', 4) * PT_PER_PX,
+                                 fontsize=size, fontweight=weight, color=color)
+        else:
+            line = _color(dataset.get('borderColor'), base)
+            fill = _color(dataset.get('backgroundColor'), _with_alpha(base, 0.5))
+            radius = dataset.get('pointRadius', 3)
+            xs, ys = (values, positions) if horizontal else (positions, values)
+            target.plot(xs, ys, color=line, linewidth=dataset.get('borderWidth', 3) * PT_PER_PX,
+                        marker='o' if radius else None, markersize=radius * 2 * PT_PER_PX, label=label)
+            if dataset.get('fill', not _is_v3(options)):
+                (target.fill_betweenx if horizontal else target.fill_between)(
+                    positions, values, 0, color=fill, linewidth=0)
+            if label_style:
+                size, weight, color, formatter = label_style
+                for x, y in zip(xs, ys):
+                    if not (math.isnan(x) or math.isnan(y)):
+                        target.annotate(formatter(x if horizontal else y), (x, y),
+                                        xytext=(0, datalabels.get('offset', 4) * PT_PER_PX + size / 2),
+                                        textcoords='offset points', ha='center', va='bottom',
+                                        fontsize=size, fontweight=weight, color=color)
+
+    # Category axis
+    set_ticks = ax.set_yticks if horizontal else ax.set_xticks
+    set_ticks(positions, labels + [''] * (count - len(labels)))
+    if horizontal:
+        ax.invert_yaxis()  # first label at the top, as in Chart.js
+    category_spec = next((s for s in specs.values() if s['axis'] == category_axis), {})
+    _apply_scale(ax, category_axis, category_spec, categorical=True)
+
+    if label_style:
+        # Headroom so labels at the bar ends stay inside the plot
+        for target in targets.values():
+            target.margins(**{value_axis: 0.12})
+            target.autoscale_view()
+
+    # Value axes (secondary ones on the right/top)
+    for axis_id, target in targets.items():
+        _apply_scale(target, value_axis, specs.get(axis_id, {}), categorical=False)
+        for side in ('top', 'right') if target is ax else ('left', 'bottom'):
+            target.spines[side].set_visible(False)
+        if target is not ax:
+            target.spines['right' if not horizontal else 'top'].set_visible(True)
+
+    if any(not math.isnan(v) and v < 0 for d in datasets for v in map(_number, d.get('data', []))):
+        (ax.axvline if horizontal else ax.axhline)(0, color=(0, 0, 0, 0.25), linewidth=1)
+
+
+def _draw(chart_config: Dict[str, Any], width: int, height: int, ratio: float):
+    kind = chart_config.get('type', 'bar')
+    data = chart_config.get('data') or {}
+    options = chart_config.get('options') or {}
+    plugins = options.get('plugins') or {}
+
+    labels = ['\n'.join(map(str, l)) if isinstance(l, list) else str(l) for l in data.get('labels', [])]
+    datasets = data.get('datasets') or []
+    if not datasets:
+        raise ValueError("chart has no datasets")
+
+    datalabels = plugins.get('datalabels')
+    if datalabels is not None and datalabels.get('display') is False:
+        datalabels = None
+
+    fig = Figure(figsize=(width / CSS_DPI, height / CSS_DPI), dpi=CSS_DPI * ratio, layout='constrained')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    padding = (options.get('layout') or {}).get('padding', 0)
+    if isinstance(padding, dict):
+        pad_w = max(padding.get('left', 0), padding.get('right', 0))
+        pad_h = max(padding.get('top', 0), padding.get('bottom', 0))
+    else:
+        pad_w = pad_h = padding
+    fig.get_layout_engine().set(w_pad=max(pad_w, 4) / CSS_DPI, h_pad=max(pad_h, 4) / CSS_DPI)
+
+    if kind in ROUND_TYPES:
+        _draw_round(fig, ax, kind, labels, datasets, options, datalabels)
+    else:
+        _draw_cartesian(fig, ax, kind, labels, datasets, options, datalabels)
+
+    title = plugins.get('title') or options.get('title') or {}
+    if title.get('display') and title.get('text'):
+        text = title['text']
+        size, weight = chart_font(title, default_weight='bold')
+        fig.suptitle('\n'.join(text) if isinstance(text, list) else text,
+                     fontsize=size, fontweight=weight,
+                     color=_color(title.get('color', title.get('fontColor')), DEFAULT_FONT_COLOR))
+
+    legend = plugins.get('legend') or options.get('legend') or {}
+    handles, names = [], []
+    for target in fig.axes:
+        for handle, name in zip(*target.get_legend_handles_labels()):
+            if name and not name.startswith('_'):
+                handles.append(handle)
+                names.append(name)
+    if legend.get('display', True) and handles:
+        # Attached to the axes (below the title), outside the plot area
+        position = legend.get('position', 'top')
+        loc, anchor = {'top': ('lower center', (0.5, 1.02)), 'bottom': ('upper center', (0.5, -0.08)),
+                       'left': ('center right', (-0.08, 0.5)), 'right': ('center left', (1.02, 0.5))
+                       }.get(position, ('lower center', (0.5, 1.02)))
+        size, _ = chart_font(legend.get('labels') or {})
+        ax.legend(handles, names, loc=loc, bbox_to_anchor=anchor, frameon=False, fontsize=size,
+                  ncols=len(handles) if position in ('top', 'bottom') else 1,
+                  labelcolor=_color((legend.get('labels') or {}).get('color'), DEFAULT_FONT_COLOR))
+    return fig
+
+
+def render_chart(chart_config: Dict[str, Any], output_path, width: int = 800, height: int = 600,
+                 device_pixel_ratio: float = DEVICE_PIXEL_RATIO) -> bool:
+    """
+    Render a Chart.js-style config to PNG without the network.
+
+    Supports bar (grouped, stacked, horizontal), line (fill, secondary
+    y axis), doughnut and pie charts; titles, legends, axis titles, tick
+    fonts, grid options, beginAtZero/min/max, and the datalabels plugin.
+    Both Chart.js v2 (options.title, scales.yAxes) and v3 (options.plugins,
+    scales.y) layouts are read. Formatter/callback strings are translated
+    when they are simple concatenations (see js_formatter). Output is
+    width x height CSS pixels scaled by device_pixel_ratio, like QuickChart.
+
+    Args:
+        chart_config: Chart.js configuration dictionary
+        output_path: Local path to save the PNG
+        width: Chart width in CSS pixels
+        height: Chart height in CSS pixels
+        device_pixel_ratio: Output pixels per CSS pixel
+
+    Returns:
+        True if successful, False otherwise
+    """
+    cache_key = AssetCache.make_key("chart-local", {
+        "chart": chart_config, "width": width, "height": height, "ratio": device_pixel_ratio
+    })
+    if CACHE.fetch(cache_key, output_path):
+        return True
+
+    if not LOCAL_CHARTS:
+        print("Local chart rendering requires matplotlib: pip install matplotlib")
+        return False
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.stem}.", suffix=".png")
+    os.close(fd)
+    try:
+        fig = _draw(chart_config, width, height, device_pixel_ratio)
+        fig.savefig(tmp_name, format='png', facecolor='white')
+    except Exception as e:
+        os.unlink(tmp_name)
+        print(f"Error rendering chart locally: {e}")
+        return False
+
+    replace_file(tmp_name, output_path)
+    CACHE.put(cache_key, output_path)
+    return True
@@ -0,0 +1,231 @@
+"""
+Deck Specification
+Loads declarative deck files (YAML/JSON) and compiles them into a build plan: unique asset jobs first, then slides.
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import yaml
+
+from asset_prefetch import AssetPrefetcher
+
+# Asset type -> provider used for the prefetch concurrency limit (None: resolved locally)
+ASSET_PROVIDERS = {
+    'image': 'ideogram',
+    'chart': 'quickchart',
+    'diagram': 'mermaid',
+    'catalog': None,
+    'file': None,
+}
+
+# Keys that only label an asset and don't change what gets generated
+COSMETIC_KEYS = {'label'}
+
+
+def load_deck_spec(path) -> Optional[Dict[str, Any]]:
+    """
+    Read a deck spec from a .yaml/.yml or .json file.
+
+    Returns:
+        Spec dict, or None if the file can't be read or parsed
+    """
+    path = Path(path)
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError as e:
+        print(f"Error reading deck spec {path}: {e}")
+        return None
+
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            spec = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            print(f"Error parsing deck spec {path}: {e}")
+            return None
+    else:
+        try:
+            spec = json.loads(text)
+        except ValueError as e:
+            print(f"Error parsing deck spec {path}: {e}")
+            return None
+
+    if not isinstance(spec, dict):
+        print(f"Error: deck spec {path} must be a mapping")
+        return None
+    spec.setdefault('base_dir', str(path.parent))
+    return spec
+
+
+def _fingerprint(definition: Dict[str, Any]) -> str:
+    """Content hash of an asset definition (identical definitions -> one job)"""
+    payload = {k: v for k, v in definition.items() if k not in COSMETIC_KEYS}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def compile_build_plan(spec: Dict[str, Any], layouts: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Validate a deck spec and compile it into a build plan.
+
+    Assets are declared by name under `assets:` or inline on a slide
+    (`image: {type: chart, config: ...}`). Only assets a slide uses become
+    jobs; definitions with identical content compile to a single job
+    however many names or slides use them, and each slide's `image` is
+    replaced by its job id.
+
+        plan = compile_build_plan(load_deck_spec("content/deck.yaml"),
+                                  layouts=["title", "content", "image"])
+
+    Args:
+        spec: Deck spec from load_deck_spec()
+        layouts: Slide layouts the builder supports (not checked if None)
+
+    Returns:
+        Plan dict: title, output, base_dir, jobs ({job_id: definition}),
+        slides (list of slide dicts), references (asset uses by slides)
+        and unused (named assets no slide uses)
+
+    Raises:
+        ValueError: If the spec has errors (all errors are listed)
+    """
+    errors = []
+    jobs = {}
+    by_fingerprint = {}
+
+    def check(definition, where):
+        if not isinstance(definition, dict) or definition.get('type') not in ASSET_PROVIDERS:
+            errors.append(f"{where}: asset type must be one of {sorted(ASSET_PROVIDERS)}")
+            return False
+        return True
+
+    def add_job(definition, preferred_id):
+        fingerprint = _fingerprint(definition)
+        job_id = by_fingerprint.get(fingerprint)
+        if job_id is None:
+            job_id = preferred_id
+            by_fingerprint[fingerprint] = job_id
+            jobs[job_id] = dict(definition)
+        return job_id
+
+    named = spec.get('assets') or {}
+    if not isinstance(named, dict):
+        errors.append("assets: expected a mapping of name -> definition")
+        named = {}
+    valid = {name for name, definition in named.items() if check(definition, f"asset {name}")}
+    used = set()
+
+    slides = spec.get('slides')
+    if not isinstance(slides, list) or not slides:
+        errors.append("slides: expected a non-empty list")
+        slides = []
+
+    layouts = set(layouts) if layouts is not None else None
+    compiled = []
+    references = 0
+    for number, slide in enumerate(slides, 1):
+        if not isinstance(slide, dict):
+            errors.append(f"slide {number}: expected a mapping")
+            continue
+        slide = dict(slide)
+        layout = slide.get('layout')
+        if layouts is not None and layout not in layouts:
+            errors.append(f"slide {number}: unknown layout {layout!r}")
+
+        image = slide.get('image')
+        if isinstance(image, str):
+            if image not in named:
+                errors.append(f"slide {number}: unknown asset {image!r}")
+            elif image in valid:
+                slide['image'] = add_job(named[image], image)
+            used.add(image)
+            references += 1
+        elif isinstance(image, dict):
+            if check(image, f"slide {number}"):
+                slide['image'] = add_job(image, f"{image['type']}-{_fingerprint(image)[:8]}")
+            references += 1
+        elif image is not None:
+            errors.append(f"slide {number}: image must be an asset name or definition")
+        compiled.append(slide)
+
+    if errors:
+        raise ValueError("Invalid deck spec:\n  " + "\n  ".join(errors))
+
+    return {
+        'title': spec.get('title', ''),
+        'output': spec.get('output', 'deck.pptx'),
+        'base_dir': spec.get('base_dir', '.'),
+        'jobs': jobs,
+        'slides': compiled,
+        'references': references,
+        'unused': sorted(set(named) - used)
+    }
+
+
+def print_build_plan(plan: Dict[str, Any]):
+    """Print the work a plan will do before anything runs"""
+    counts = {}
+    for definition in plan['jobs'].values():
+        counts[definition['type']] = counts.get(definition['type'], 0) + 1
+    summary = ", ".join(f"{n} {kind}" for kind, n in sorted(counts.items()))
+    print(f"\nBuild plan: {len(plan['slides'])} slides, {len(plan['jobs'])} unique assets "
+          f"({summary or 'none'}) for {plan['references']} slide references")
+    if plan['unused']:
+        print(f"  Skipping unused assets: {', '.join(plan['unused'])}")
+
+
+def resolve_assets(plan: Dict[str, Any], handlers: Dict[str, Callable[[str, Dict[str, Any]], Any]],
+                   catalog=None, prefetcher: Optional[AssetPrefetcher] = None,
+                   skip: Iterable[str] = ()) -> Dict[str, Path]:
+    """
+    Produce every asset in a plan before any slide is built.
+
+    Catalog and file assets are resolved locally (missing ones reported in
+    one list); generated assets run concurrently through an AssetPrefetcher
+    with per-provider limits. Handlers are called once per unique job.
+
+    Args:
+        plan: Plan from compile_build_plan()
+        handlers: {asset type: fn(job_id, definition) -> Path or None}
+                  for the generated types (image, chart, diagram)
+        catalog: AssetCatalog for `catalog` assets
+        prefetcher: AssetPrefetcher to use (a default one if None)
+        skip: Job ids the builder produces itself (e.g. native charts)
+
+    Returns:
+        {job_id: Path} for every asset that resolved
+    """
+    resolved = {}
+    base_dir = Path(plan['base_dir'])
+    catalog_names = {}
+    prefetcher = prefetcher or AssetPrefetcher()
+
+    skip = set(skip)
+    for job_id, definition in plan['jobs'].items():
+        kind = definition['type']
+        if job_id in skip:
+            continue
+        if kind == 'catalog':
+            catalog_names[job_id] = definition['name']
+        elif kind == 'file':
+            path = base_dir / definition['path']
+            if path.is_file():
+                resolved[job_id] = path
+            else:
+                print(f"  [X] {job_id}: file not found ({path})")
+        elif kind in handlers:
+            provider = definition.get('provider', ASSET_PROVIDERS[kind])
+            prefetcher.add('assets', job_id, provider, handlers[kind], job_id, definition)
+        else:
+            print(f"  [X] {job_id}: no handler for {kind} assets")
+
+    if catalog_names:
+        if catalog is None:
+            print(f"  [X] {len(catalog_names)} catalog asset(s) skipped: no catalog")
+        else:
+            resolved.update(catalog.resolve(catalog_names))
+
+    if len(prefetcher):
+        resolved.update(prefetcher.run().get('assets', {}))
+    return resolved
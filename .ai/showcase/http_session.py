@@ -0,0 +1,293 @@
+"""
+HTTP Session Pool
+Shared keep-alive sessions (one per host) with jittered retry/backoff.
+"""
+
+import os
+import time
+import random
+import hashlib
+import tempfile
+import threading
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Safe to resend after a timeout or 5xx; anything else retries only on request
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_DOWNLOAD_BYTES = int(os.getenv('MAX_DOWNLOAD_MB', '100')) * 1024 * 1024
+
+# Process umask (only readable by setting it), applied to files published from mkstemp
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None,
+                base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based).
+
+    Honours a Retry-After header (seconds or HTTP date) when present,
+    otherwise uses full jitter: uniform in [0, base * 2^attempt].
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), cap)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                return min(max(delay, 0.0), cap)
+            except (TypeError, ValueError):
+                pass
+
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def replace_file(tmp_name, output_path):
+    """
+    Rename a finished temp file into place with ordinary file permissions.
+
+    mkstemp() creates files 0600 and os.replace() keeps that mode, so the
+    temp file gets 0666 & ~umask first, as open(path, 'wb') would give it.
+    """
+    os.chmod(tmp_name, 0o666 & ~_UMASK)
+    os.replace(tmp_name, output_path)
+
+
+class AtomicDownload:
+    """
+    Chunked writer that only exposes a file once it is complete.
+
+    Chunks go to a temp file next to output_path and are renamed into place
+    on a clean exit; on any error (including exceeding max_bytes or a
+    checksum mismatch) the temp file is removed and output_path is untouched.
+
+        with AtomicDownload(path, max_bytes=10_000_000) as out:
+            for chunk in chunks:
+                out.write(chunk)
+        print(out.hexdigest)
+    """
+
+    def __init__(self, output_path, max_bytes: Optional[int] = None,
+                 hash_algorithm: Optional[str] = 'sha256',
+                 expected_digest: Optional[str] = None):
+        self.output_path = Path(output_path)
+        self.max_bytes = max_bytes
+        self.expected_digest = expected_digest
+        self._hash = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self.bytes_written = 0
+        self.hexdigest = None
+        self._file = None
+        self._tmp_name = None
+
+    def check_length(self, content_length):
+        """Reject early when the server announces a body larger than max_bytes"""
+        if self.max_bytes and content_length and int(content_length) > self.max_bytes:
+            raise ValueError(
+                f"{self.output_path.name}: {content_length} bytes exceeds limit of {self.max_bytes}"
+            )
+
+    def __enter__(self):
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_name = tempfile.mkstemp(
+            dir=self.output_path.parent, prefix=f".{self.output_path.name}.", suffix=".part"
+        )
+        self._file = os.fdopen(fd, 'wb')
+        return self
+
+    def write(self, chunk: bytes):
+        self.bytes_written += len(chunk)
+        if self.max_bytes and self.bytes_written > self.max_bytes:
+            raise ValueError(
+                f"{self.output_path.name}: download exceeds limit of {self.max_bytes} bytes"
+            )
+        if self._hash:
+            self._hash.update(chunk)
+        self._file.write(chunk)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+
+        if exc_type is None and self._hash:
+            self.hexdigest = self._hash.hexdigest()
+            if self.expected_digest and self.hexdigest != self.expected_digest.lower():
+                os.unlink(self._tmp_name)
+                raise ValueError(f"{self.output_path.name}: checksum mismatch")
+
+        if exc_type is None:
+            replace_file(self._tmp_name, self.output_path)
+        else:
+            try:
+                os.unlink(self._tmp_name)
+            except OSError:
+                pass
+        return False
+
+
+def stream_to_file(response: requests.Response, output_path,
+                   max_bytes: Optional[int] = DEFAULT_MAX_DOWNLOAD_BYTES,
+                   hash_algorithm: Optional[str] = 'sha256',
+                   expected_digest: Optional[str] = None) -> Optional[str]:
+    """
+    Stream a response body (requested with stream=True) to disk atomically.
+
+    Args:
+        response: Response opened with stream=True
+        output_path: Final destination; only created when complete
+        max_bytes: Abort when the body exceeds this size (None = unlimited)
+        hash_algorithm: hashlib name for the checksum computed while streaming
+        expected_digest: Fail instead of renaming if the checksum differs
+
+    Returns:
+        Hex digest of the body (None if hash_algorithm is None)
+    """
+    try:
+        with AtomicDownload(output_path, max_bytes, hash_algorithm, expected_digest) as out:
+            out.check_length(response.headers.get('Content-Length'))
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                out.write(chunk)
+    finally:
+        response.close()
+    return out.hexdigest
+
+
+class HTTPSessionPool:
+    """
+    Per-host pooled requests.Session objects.
+
+    Every request to the same scheme+host reuses one keep-alive connection
+    pool, so a batch of assets pays the TCP+TLS handshake once per host.
+    Idempotent requests that fail with 429/5xx or a connection error are
+    retried with jittered exponential backoff, honouring Retry-After when
+    present. Other methods (e.g. a POST that starts a paid generation) are
+    sent once unless the caller passes retry=True.
+    """
+
+    def __init__(self, pool_size: int = 10, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the shared session for the URL's scheme and host"""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.pool_size,
+                    max_retries=0
+                )
+                session.mount(host, adapter)
+                self._sessions[host] = session
+            return session
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Seconds to wait before the next attempt"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        return retry_delay(attempt, retry_after, self.backoff_base, self.backoff_max)
+
+    def request(self, method: str, url: str, retry: Optional[bool] = None,
+                **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session for url's host.
+
+        Args:
+            method: HTTP method (GET, POST, ...)
+            url: Request URL
+            retry: Retry on 429/5xx and connection errors (default: only
+                   for idempotent methods)
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            The final response (callers still call raise_for_status)
+
+        Raises:
+            requests.RequestException if every attempt failed to connect
+        """
+        kwargs.setdefault('timeout', 30)
+        session = self.session_for(url)
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+        max_retries = self.max_retries if retry else 0
+
+        for attempt in range(max_retries + 1):
+            response = None
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                    return response
+                response.close()
+
+            time.sleep(self._backoff(attempt, response))
+
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def download(self, url: str, output_path, max_bytes: Optional[int] = DEFAULT_MAX_DOWNLOAD_BYTES,
+                 expected_digest: Optional[str] = None, method: str = 'GET',
+                 **kwargs) -> Optional[str]:
+        """
+        Stream url to output_path without buffering the body in memory.
+
+        Returns:
+            SHA-256 hex digest of the downloaded body
+
+        Raises:
+            requests.HTTPError on a non-2xx response, ValueError when the
+            body exceeds max_bytes or fails the checksum
+        """
+        response = self.request(method, url, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return stream_to_file(response, output_path, max_bytes, 'sha256', expected_digest)
+
+    def close(self):
+        """Close every pooled session"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def get_pool() -> HTTPSessionPool:
+    """Return the process-wide pool, configured from HTTP_* environment variables"""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = HTTPSessionPool(
+                pool_size=int(os.getenv('HTTP_POOL_SIZE', '10')),
+                max_retries=int(os.getenv('HTTP_MAX_RETRIES', '3')),
+                backoff_base=float(os.getenv('HTTP_BACKOFF_BASE', '0.5'))
+            )
+        return _default_pool
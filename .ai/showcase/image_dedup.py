@@ -0,0 +1,83 @@
+"""
+Image Deduplication
+Reports how often each embedded image is reused across a presentation's slides.
+"""
+
+import hashlib
+from typing import Dict, Any, List
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+
+def _image_relationships(prs):
+    """Yield (source part, relationship) for every internal image relationship"""
+    for part in prs.part.package.iter_parts():
+        for rel in part.rels.values():
+            if rel.reltype == RT.IMAGE and not rel.is_external:
+                yield part, rel
+
+
+def image_reuse_report(prs) -> Dict[str, Any]:
+    """
+    Summarise image reuse within one presentation.
+
+    python-pptx already stores identical bytes passed to add_picture() as
+    a single image part (matched by SHA-1), so a picture placed on many
+    slides is embedded once; this report shows where that happens. Parts
+    that arrive through templates or copied layouts are not merged, and
+    reuse across separate decks is out of scope.
+
+    Returns:
+        Report dict: references, unique_images, duplicate_parts (image
+        parts with the same bytes as another part), image_bytes,
+        bytes_saved (versus one copy per reference) and images, a list of
+        {partname, sha256, bytes, references, used_on} sorted by reuse
+    """
+    slide_numbers = {slide.part: number for number, slide in enumerate(prs.slides, 1)}
+
+    images = {}      # sha256 -> report entry
+    parts = {}       # sha256 -> image parts holding those bytes
+    references = 0
+
+    for source, rel in _image_relationships(prs):
+        references += 1
+        target = rel.target_part
+        digest = hashlib.sha256(target.blob).hexdigest()
+        parts.setdefault(digest, set()).add(target.partname)
+
+        entry = images.setdefault(digest, {
+            'partname': str(target.partname),
+            'sha256': digest,
+            'bytes': len(target.blob),
+            'references': 0,
+            'used_on': []
+        })
+        entry['references'] += 1
+        entry['used_on'].append(
+            f"slide {slide_numbers[source]}" if source in slide_numbers else str(source.partname)
+        )
+
+    ranked: List[Dict[str, Any]] = sorted(
+        images.values(), key=lambda e: (-e['references'], e['partname'])
+    )
+    return {
+        'references': references,
+        'unique_images': len(images),
+        'duplicate_parts': sum(len(names) - 1 for names in parts.values()),
+        'image_bytes': sum(e['bytes'] * len(parts[e['sha256']]) for e in ranked),
+        'bytes_saved': sum(e['bytes'] * (e['references'] - len(parts[e['sha256']])) for e in ranked),
+        'images': ranked
+    }
+
+
+def print_image_report(report: Dict[str, Any], limit: int = 5):
+    """Print a short summary of image reuse from image_reuse_report()"""
+    print(f"\nImages: {report['references']} placements, {report['unique_images']} unique "
+          f"({report['image_bytes'] / 1e6:.1f} MB embedded, "
+          f"{report['bytes_saved'] / 1e6:.1f} MB saved by reuse)")
+    if report['duplicate_parts']:
+        print(f"  {report['duplicate_parts']} image part(s) duplicate another part's bytes")
+    for entry in report['images'][:limit]:
+        if entry['references'] < 2:
+            break
+        print(f"  {entry['partname']}: {entry['references']}x, {entry['bytes'] / 1e3:.0f} KB")
@@ -0,0 +1,165 @@
+"""
+Image Variants
+Resizes pictures to their placed size on the slide before embedding, cached per source, box and DPI.
+"""
+
+import io
+import os
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image, ImageChops
+
+from asset_cache import AssetCache
+from api_utils import CACHE
+
+EMU_PER_INCH = 914400
+# Comfortably above a 1920px-wide projector (120 px/in on a 16" slide)
+DEFAULT_DPI = 150
+JPEG_QUALITY = 90
+# JPEG must beat lossless PNG by this much to be used (as in the slide encoder)
+JPEG_MIN_SAVING = 0.8
+
+# Variants written while the cache is disabled; removed at interpreter exit
+_scratch = None
+_scratch_lock = threading.Lock()
+
+
+def _png(img: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def _palette_png(img: Image.Image) -> Optional[bytes]:
+    """Palette PNG for images with <= 256 colours, only if it reproduces them exactly"""
+    if not img.getcolors(maxcolors=256):
+        return None
+    method = Image.Quantize.FASTOCTREE if img.mode == 'RGBA' else Image.Quantize.MEDIANCUT
+    quantized = img.quantize(256, method=method, dither=Image.Dither.NONE)
+    if ImageChops.difference(quantized.convert(img.mode), img).getbbox():
+        return None
+    return _png(quantized)
+
+
+def _encode(img: Image.Image) -> bytes:
+    """
+    Exact palette PNG for flat art and charts (<= 256 colours); otherwise
+    lossless PNG, or JPEG for photos when it is clearly smaller (only for
+    images without transparency)
+    """
+    if 'A' in img.getbands() or 'transparency' in img.info:
+        img = img.convert('RGBA')
+        return _palette_png(img) or _png(img)
+
+    img = img.convert('RGB')
+    palette = _palette_png(img)
+    if palette:
+        return palette
+
+    lossless = _png(img)
+    buf = io.BytesIO()
+    img.save(buf, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+    return buf.getvalue() if len(buf.getvalue()) < len(lossless) * JPEG_MIN_SAVING else lossless
+
+
+def _scratch_dir() -> Path:
+    global _scratch
+    with _scratch_lock:
+        if _scratch is None:
+            _scratch = tempfile.TemporaryDirectory(prefix="image-variants-")
+        return Path(_scratch.name)
+
+
+def fit_in_box(source_path, box_width: int, box_height: int) -> Tuple[int, Optional[int]]:
+    """
+    Placed size of an image scaled to fit a box, keeping its aspect ratio.
+
+    Landscape images fill the box width; portrait ones are sized by the
+    box height so they don't run off the slide.
+
+    Args:
+        source_path: Image to place
+        box_width: Box width in EMU
+        box_height: Box height in EMU
+
+    Returns:
+        (width, height) in EMU, or (box_width, None) if the image can't be
+        read (python-pptx then keeps the native aspect ratio)
+    """
+    try:
+        with Image.open(source_path) as img:
+            width, height = img.size
+    except OSError as e:
+        print(f"Error reading image {Path(source_path).name}: {e}")
+        return box_width, None
+
+    scale = min(box_width / width, box_height / height)
+    return round(width * scale), round(height * scale)
+
+
+def image_variant(source_path, box_width: int, box_height: Optional[int] = None,
+                  dpi: int = DEFAULT_DPI) -> Path:
+    """
+    Return a copy of an image sized for a placement box at the given DPI.
+
+    The image is scaled (Lanczos) to fit inside the box, keeping its
+    aspect ratio, and never upscaled; smaller images are returned as-is.
+    Variants are cached under the source content hash, box and DPI.
+
+    Args:
+        source_path: Original image
+        box_width: Placed width in EMU (e.g. Inches(7))
+        box_height: Placed height in EMU, if the height is constrained too
+        dpi: Target pixel density on the slide
+
+    Returns:
+        Path to the variant (or source_path when no resize is needed or
+        the image cannot be read)
+    """
+    source_path = Path(source_path)
+    try:
+        data = source_path.read_bytes()
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+    except OSError as e:
+        print(f"Error reading image {source_path.name}: {e}")
+        return source_path
+
+    max_w = round(box_width / EMU_PER_INCH * dpi)
+    max_h = round(box_height / EMU_PER_INCH * dpi) if box_height else None
+    scale = min(max_w / width, max_h / height if max_h else 1.0)
+    if scale >= 1.0:
+        return source_path
+
+    cache_key = AssetCache.make_key("image-variant", {
+        "source": hashlib.sha256(data).hexdigest(),
+        "box": [int(box_width), int(box_height) if box_height else None],
+        "dpi": dpi
+    })
+    cached = CACHE.get(cache_key)
+    if cached:
+        return cached
+
+    with Image.open(io.BytesIO(data)) as img:
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        encoded = _encode(img.resize(size, Image.Resampling.LANCZOS))
+
+    # Only worth it if the variant is actually smaller
+    if len(encoded) >= len(data):
+        return source_path
+
+    fd, tmp_name = tempfile.mkstemp(dir=_scratch_dir(),
+                                    suffix='.jpg' if encoded[:2] == b'\xff\xd8' else '.png')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(encoded)
+
+    entry = CACHE.put(cache_key, tmp_name)
+    if entry:
+        os.unlink(tmp_name)
+        return entry
+    # Cache disabled: hand back the scratch file (deleted when the build exits)
+    return Path(tmp_name)
@@ -0,0 +1,234 @@
+"""
+Local Mermaid Renderer
+Renders Mermaid diagrams to PNG offline through one persistent headless Chromium (Playwright) kept warm for the whole build.
+"""
+
+import os
+import atexit
+import asyncio
+import hashlib
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+from asset_cache import AssetCache
+from api_utils import CACHE
+from http_session import replace_file
+
+# mermaid.min.js is loaded from disk, never from a CDN: MERMAID_JS, or `npm install mermaid` at the repo root
+DEFAULT_MERMAID_JS = Path(__file__).parent.parent.parent / "node_modules" / "mermaid" / "dist" / "mermaid.min.js"
+
+# Optional Chrome/Chromium binary instead of Playwright's own (e.g. an existing puppeteer install)
+MERMAID_BROWSER = os.getenv('MERMAID_BROWSER')
+
+# Pages rendering in parallel inside the one browser
+DEFAULT_PAGES = 4
+# Output pixels per CSS pixel (like mmdc -s 2)
+DEFAULT_SCALE = 2
+# Page background behind each theme (mermaid.ink renders on these)
+THEME_BACKGROUNDS = {'dark': '#333333'}
+
+PAGE_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<style>body { margin: 0; } #diagram { display: inline-block; padding: 8px; }</style>
+</head><body><div id="diagram"></div></body></html>"""
+
+RENDER_JS = """async ([code, theme, background, id]) => {
+    mermaid.initialize({startOnLoad: false, theme: theme});
+    const {svg} = await mermaid.render(id, code);
+    document.body.style.background = background;
+    document.getElementById('diagram').innerHTML = svg;
+}"""
+
+
+def mermaid_script() -> Optional[Path]:
+    """Path of the local mermaid.min.js, or None if it isn't installed"""
+    path = Path(os.getenv('MERMAID_JS') or DEFAULT_MERMAID_JS)
+    return path if path.is_file() else None
+
+
+@lru_cache(maxsize=4)
+def _script_digest(path: str, mtime: float) -> str:
+    """Content hash of a Mermaid build (part of the cache key, computed once per file version)"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+LOCAL_MERMAID = async_playwright is not None and mermaid_script() is not None
+
+
+class MermaidRenderer:
+    """
+    One headless Chromium with a pool of pages that have Mermaid loaded.
+
+    The browser starts on the first render and stays up until close(), so
+    each diagram costs one in-page render and a screenshot instead of a
+    browser launch or an HTTP round-trip. Playwright runs on a private
+    event loop thread; render() is thread-safe and blocks the caller, and
+    up to `pages` diagrams render at once (e.g. from AssetPrefetcher).
+
+        renderer = MermaidRenderer()
+        png = renderer.render("graph TD\\n  A --> B", theme="forest")
+        renderer.close()
+    """
+
+    def __init__(self, script=None, pages: int = DEFAULT_PAGES, scale: float = DEFAULT_SCALE,
+                 timeout: float = 30):
+        self.script = Path(script) if script else mermaid_script()
+        self.pages = pages
+        self.scale = scale
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._browser = None
+        self._started = None
+        self._error = None
+        self._counter = 0
+
+    def start(self) -> bool:
+        """Launch the browser and load Mermaid into every page (idempotent)"""
+        with self._lock:
+            if self._started is not None:
+                return self._started
+            if async_playwright is None:
+                self._error = "Local Mermaid rendering requires playwright: pip install playwright"
+            elif self.script is None:
+                self._error = ("Local Mermaid rendering needs mermaid.min.js: npm install mermaid "
+                               "(or set MERMAID_JS)")
+            else:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="mermaid-renderer",
+                                                daemon=True)
+                self._thread.start()
+                try:
+                    self._call(self._launch())
+                except Exception as e:
+                    self._error = (f"Could not start headless Chromium ({str(e).splitlines()[0]}); "
+                                   "run: playwright install chromium")
+                    self._stop()
+            self._started = self._error is None
+            return self._started
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(self.timeout * 4)
+
+    async def _launch(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(executable_path=MERMAID_BROWSER)
+        self._context = await self._browser.new_context(device_scale_factor=self.scale)
+        self._pool = asyncio.Queue()
+        for _ in range(self.pages):
+            page = await self._context.new_page()
+            await page.set_content(PAGE_HTML)
+            await page.add_script_tag(path=str(self.script))
+            self._pool.put_nowait(page)
+
+    async def _render(self, code: str, theme: str, diagram_id: str) -> bytes:
+        page = await self._pool.get()
+        try:
+            await page.evaluate(RENDER_JS, [code, theme, THEME_BACKGROUNDS.get(theme, 'white'), diagram_id])
+            return await page.locator('#diagram').screenshot(timeout=self.timeout * 1000)
+        finally:
+            self._pool.put_nowait(page)
+
+    def render(self, code: str, theme: str = "default") -> bytes:
+        """
+        Render Mermaid source to PNG bytes.
+
+        Raises:
+            RuntimeError: If the renderer can't start
+            Exception: Mermaid syntax errors and Playwright errors
+        """
+        if not self.start():
+            raise RuntimeError(self._error)
+        with self._lock:
+            self._counter += 1
+            diagram_id = f"mermaid-{self._counter}"
+        return self._call(self._render(code, theme, diagram_id))
+
+    async def _shutdown(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = None
+
+    def _stop(self):
+        """Close the browser and Playwright driver, then end the loop thread"""
+        try:
+            self._call(self._shutdown())
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def close(self):
+        """Shut the browser down; the next render() starts a new one"""
+        with self._lock:
+            if self._started:
+                self._stop()
+            self._started = None
+            self._error = None
+
+
+_default_renderer = None
+_default_lock = threading.Lock()
+
+
+def get_renderer() -> MermaidRenderer:
+    """Return the process-wide renderer (started on first use, closed at exit)"""
+    global _default_renderer
+    with _default_lock:
+        if _default_renderer is None:
+            _default_renderer = MermaidRenderer(pages=int(os.getenv('MERMAID_PAGES', str(DEFAULT_PAGES))))
+            atexit.register(_default_renderer.close)
+        return _default_renderer
+
+
+def render_mermaid(mermaid_code: str, output_path, theme: str = "default") -> bool:
+    """
+    Render a Mermaid diagram to PNG without the network.
+
+    Uses the shared warm renderer (see MermaidRenderer). Results are
+    cached by source, theme, scale and the Mermaid build, so unchanged
+    diagrams are copied from the cache without starting the browser.
+
+    Args:
+        mermaid_code: Mermaid diagram code
+        output_path: Local path to save the PNG
+        theme: Diagram theme (default, dark, forest, neutral)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    script = mermaid_script()
+    renderer = get_renderer()
+    cache_key = AssetCache.make_key("mermaid-local", {
+        "code": mermaid_code, "theme": theme, "scale": renderer.scale,
+        "mermaid": _script_digest(str(script), script.stat().st_mtime) if script else None
+    })
+    if CACHE.fetch(cache_key, output_path):
+        return True
+
+    try:
+        png = renderer.render(mermaid_code, theme)
+    except Exception as e:
+        print(f"Error rendering Mermaid diagram locally: {e}")
+        return False
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.stem}.", suffix=".png")
+    with os.fdopen(fd, 'wb') as f:
+        f.write(png)
+    replace_file(tmp_name, output_path)
+    CACHE.put(cache_key, output_path)
+    return True
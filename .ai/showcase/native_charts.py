@@ -0,0 +1,358 @@
+"""
+Native Charts
+Converts Chart.js-style configs into native, editable PowerPoint charts (no PNG, no network).
+"""
+
+import re
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION, XL_TICK_LABEL_POSITION
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.util import Emu, Pt
+
+from chart_render import (
+    CSS_RGBA, DEFAULT_COLORS, DEFAULT_FONT_COLOR, PT_PER_PX, chart_font, js_formatter, scale_specs
+)
+
+# Chart.js type -> (PowerPoint type, stacked variant)
+CHART_TYPES = {
+    'bar': (XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.COLUMN_STACKED),
+    'horizontalBar': (XL_CHART_TYPE.BAR_CLUSTERED, XL_CHART_TYPE.BAR_STACKED),
+    'line': (XL_CHART_TYPE.LINE_MARKERS, XL_CHART_TYPE.LINE_MARKERS_STACKED),
+    'doughnut': (XL_CHART_TYPE.DOUGHNUT, XL_CHART_TYPE.DOUGHNUT),
+    'pie': (XL_CHART_TYPE.PIE, XL_CHART_TYPE.PIE),
+}
+LEGEND_POSITIONS = {
+    'top': XL_LEGEND_POSITION.TOP, 'bottom': XL_LEGEND_POSITION.BOTTOM,
+    'left': XL_LEGEND_POSITION.LEFT, 'right': XL_LEGEND_POSITION.RIGHT,
+}
+CSS_HEX = re.compile(r'#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})')
+NUMBER = re.compile(r'-?[\d,]*\.?\d+')
+
+# Value probed through JS formatters to recover their prefix/suffix/precision
+PROBE = 1234.5678
+
+
+def _value_axis_ids(chart_config: Dict[str, Any]) -> set:
+    """Value axes the datasets are plotted against (x axes for horizontal bars)"""
+    horizontal = (chart_config.get('type') == 'horizontalBar'
+                  or (chart_config.get('options') or {}).get('indexAxis') == 'y')
+    key = 'xAxisID' if horizontal else 'yAxisID'
+    datasets = (chart_config.get('data') or {}).get('datasets') or []
+    return {dataset.get(key) for dataset in datasets}
+
+
+def native_chart_supported(chart_config: Dict[str, Any]) -> bool:
+    """
+    True if the config's chart type has a native PowerPoint equivalent and
+    every dataset uses the same value axis (python-pptx has no
+    secondary-axis API, so dual-axis charts stay on the PNG path).
+    """
+    if chart_config.get('type', 'bar') not in CHART_TYPES:
+        return False
+    if not (chart_config.get('data') or {}).get('datasets'):
+        return False
+    return len(_value_axis_ids(chart_config)) == 1
+
+
+def _rgb(value) -> Optional[Tuple[RGBColor, float]]:
+    """CSS colour (rgb()/rgba()/#hex) -> (RGBColor, alpha), None if not parseable"""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    match = CSS_RGBA.fullmatch(value)
+    if match:
+        r, g, b, a = match.groups()
+        return RGBColor(int(float(r)), int(float(g)), int(float(b))), float(a) if a else 1.0
+    match = CSS_HEX.fullmatch(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = ''.join(ch * 2 for ch in digits)
+        alpha = int(digits[6:], 16) / 255 if len(digits) == 8 else 1.0
+        return RGBColor.from_string(digits[:6].upper()), alpha
+    return None
+
+
+def _pick(value, index: int):
+    """One colour from a single value or a (cycled) per-point list"""
+    if isinstance(value, list):
+        return value[index % len(value)] if value else None
+    return value
+
+
+def _fill(fill, color) -> bool:
+    """Solid fill from a CSS colour, alpha kept as <a:alpha>"""
+    parsed = _rgb(color)
+    if parsed is None:
+        return False
+    rgb, alpha = parsed
+    fill.solid()
+    fill.fore_color.rgb = rgb
+    if alpha < 1:
+        srgb = fill._xPr.xpath('./a:solidFill/a:srgbClr')[0]
+        element = OxmlElement('a:alpha')
+        element.set('val', str(int(round(alpha * 100000))))
+        srgb.append(element)
+    return True
+
+
+def _font(font, spec: Dict[str, Any], scale: float, default_weight='normal', default_color=None):
+    """Apply a Chart.js font spec (v2 or v3) to a python-pptx Font"""
+    size, weight = chart_font(spec, default_weight=default_weight)
+    font.size = Pt(round(size * scale, 1))
+    font.bold = weight == 'bold'
+    parsed = _rgb(spec.get('color', spec.get('fontColor', default_color)))
+    if parsed:
+        font.color.rgb = parsed[0]
+
+
+def number_format(source) -> Optional[str]:
+    """
+    Excel number format equivalent to a JS formatter/callback string.
+
+    The formatter is translated with js_formatter() and probed with a
+    positive, negative and zero value; the text around the number becomes
+    quoted literals and its digits the precision, e.g.
+    "(v) => v > 0 ? '+$' + v + 'K' : '$' + v + 'K'" -> '"+$"General"K";"$-"General"K";"$"General"K"'.
+    Returns None when there is no formatter or it can't be mapped.
+    """
+    formatter = js_formatter(source)
+    if formatter is None:
+        return None
+
+    sections = []
+    for probe in (PROBE, -PROBE, 0):
+        try:
+            text = formatter(float(probe))
+        except (TypeError, ValueError):
+            return None
+        match = NUMBER.search(text)
+        if not match or '"' in text:
+            return None
+        digits = match.group(0)
+        prefix, suffix = text[:match.start()], text[match.end():]
+        if digits.startswith('-'):
+            prefix, digits = prefix + '-', digits[1:]  # Excel drops the sign in the negative section
+        if probe == 0:
+            code = '0.' + digits.split('.')[1] if '.' in digits else 'General'
+        elif digits.replace(',', '') == str(PROBE):  # full precision: not rounded by the formatter
+            code = '#,##0' if ',' in digits else 'General'
+        else:
+            code = '#,##0' if ',' in digits else '0'
+            if '.' in digits:
+                code += '.' + '0' * len(digits.split('.')[1])
+        sections.append((f'"{prefix}"' if prefix else '') + code + (f'"{suffix}"' if suffix else ''))
+    return ';'.join(sections)
+
+
+def _series_values(dataset: Dict[str, Any], count: int) -> List[Optional[float]]:
+    values = []
+    for value in (dataset.get('data') or [])[:count]:
+        if isinstance(value, dict):  # {x, y} points
+            value = value.get('y')
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            value = None
+        values.append(None if value is None or math.isnan(value) else value)
+    return values + [None] * (count - len(values))
+
+
+def _style_axis(axis, spec: Dict[str, Any], scale: float, categorical: bool):
+    """Ticks, number format, range, gridlines and title for one chart axis"""
+    if spec.get('display') is False:
+        axis.visible = False
+        return
+    ticks = spec.get('ticks') or {}
+    _font(axis.tick_labels.font, ticks, scale, default_color=DEFAULT_FONT_COLOR)
+
+    if not categorical:
+        code = number_format(ticks.get('callback'))
+        if code:
+            axis.tick_labels.number_format = code
+            axis.tick_labels.number_format_is_linked = False
+        low = spec.get('min', ticks.get('min'))
+        high = spec.get('max', ticks.get('max'))
+        if low is not None:
+            axis.minimum_scale = low
+        if high is not None:
+            axis.maximum_scale = high
+
+    grid = spec.get('grid') or spec.get('gridLines') or {}
+    axis.has_major_gridlines = bool(grid.get('display', not categorical) and grid.get('drawOnChartArea', True))
+    if axis.has_major_gridlines:
+        line = axis.major_gridlines.format.line
+        _fill(line.fill, grid.get('color', 'rgba(0, 0, 0, 0.1)'))
+        line.width = Pt(grid.get('lineWidth', 1) * scale)
+
+    title = spec.get('title') or {}
+    text = title.get('text')
+    if not text and (spec.get('scaleLabel') or {}).get('display'):
+        title = spec['scaleLabel']
+        text = title.get('labelString')
+    if text and title.get('display', True):
+        axis.has_title = True
+        axis.axis_title.text_frame.text = text
+        _font(axis.axis_title.text_frame.paragraphs[0].font, title, scale, default_color=DEFAULT_FONT_COLOR)
+
+
+def add_native_chart(slide, chart_config: Dict[str, Any], left, top, width, height,
+                     width_px: int = 800):
+    """
+    Add a Chart.js-style config to a slide as a native PowerPoint chart.
+
+    The chart is stored as DrawingML plus an embedded workbook, so it stays
+    sharp at any zoom, adds a few KB instead of a PNG, needs no network and
+    its data can be edited in PowerPoint. Maps bar (grouped/stacked/
+    horizontal), line, doughnut and pie charts with dataset and per-point
+    colours (alpha kept), title, legend, tick fonts, axis titles, gridlines,
+    min/max, and number formats from ticks.callback / datalabels.formatter
+    (see number_format). Pixel sizes are scaled so the chart looks as it
+    would rendered at width_px and placed at width. All series share one
+    value axis; check native_chart_supported() first, which rejects
+    dual-axis configs.
+
+        add_native_chart(slide, config, Inches(2), Inches(2), Inches(12), Inches(6),
+                         width_px=1200)
+
+    Args:
+        slide: Slide to add the chart to
+        chart_config: Chart.js configuration dictionary
+        left, top, width, height: Placement (EMU/Length)
+        width_px: Canvas width the config's pixel sizes were designed for
+
+    Returns:
+        The chart's graphic frame, or None if the config can't be converted
+    """
+    if not native_chart_supported(chart_config):
+        print(f"Native chart: unsupported chart type {chart_config.get('type')!r}")
+        return None
+
+    kind = chart_config.get('type', 'bar')
+    data = chart_config.get('data') or {}
+    options = chart_config.get('options') or {}
+    plugins = options.get('plugins') or {}
+    datasets = data['datasets']
+    round_chart = kind in ('doughnut', 'pie')
+    if kind == 'bar' and options.get('indexAxis') == 'y':
+        kind = 'horizontalBar'
+
+    # chart_font() sizes are CSS px * PT_PER_PX; rescale to the placed size
+    scale = Emu(width).pt / width_px / PT_PER_PX
+    specs = scale_specs(options)
+    stacked = any(spec.get('stacked') for spec in specs.values())
+
+    labels = [' '.join(map(str, l)) if isinstance(l, list) else str(l) for l in data.get('labels', [])]
+    count = max([len(labels)] + [len(d.get('data') or []) for d in datasets])
+    chart_data = CategoryChartData()
+    chart_data.categories = labels + [''] * (count - len(labels))
+    for index, dataset in enumerate(datasets[:1] if round_chart else datasets):
+        chart_data.add_series(dataset.get('label') or f"Series {index + 1}", _series_values(dataset, count))
+
+    try:
+        frame = slide.shapes.add_chart(CHART_TYPES[kind][stacked], left, top, width, height, chart_data)
+    except (ValueError, TypeError) as e:
+        print(f"Error creating native chart: {e}")
+        return None
+    chart = frame.chart
+    _font(chart.font, {}, scale, default_color=DEFAULT_FONT_COLOR)
+
+    # Title
+    title = plugins.get('title') or options.get('title') or {}
+    text = title.get('text')
+    if title.get('display') and text:
+        chart.has_title = True
+        chart.chart_title.text_frame.text = '\n'.join(text) if isinstance(text, list) else text
+        _font(chart.chart_title.text_frame.paragraphs[0].font, title, scale, default_weight='bold',
+              default_color=DEFAULT_FONT_COLOR)
+    else:
+        chart.has_title = False
+
+    # Legend
+    legend = plugins.get('legend') or options.get('legend') or {}
+    chart.has_legend = legend.get('display', True) and (round_chart or any(d.get('label') for d in datasets))
+    if chart.has_legend:
+        chart.legend.position = LEGEND_POSITIONS.get(legend.get('position', 'top'), XL_LEGEND_POSITION.TOP)
+        chart.legend.include_in_layout = False
+        _font(chart.legend.font, legend.get('labels') or {}, scale, default_color=DEFAULT_FONT_COLOR)
+
+    # Series colours
+    plot = chart.plots[0]
+    plot.vary_by_categories = False
+    for index, (series, dataset) in enumerate(zip(plot.series, datasets)):
+        default = DEFAULT_COLORS[index % len(DEFAULT_COLORS)]
+        background = dataset.get('backgroundColor')
+        border = dataset.get('borderColor')
+        border_width = dataset.get('borderWidth', 3 if kind == 'line' else 0)
+        if round_chart:
+            for point_index in range(count):
+                point = series.points[point_index]
+                _fill(point.format.fill, _pick(background, point_index)
+                      or DEFAULT_COLORS[point_index % len(DEFAULT_COLORS)])
+                _fill(point.format.line.fill, _pick(border, point_index) or '#ffffff')
+                point.format.line.width = Pt(dataset.get('borderWidth', 2) * scale)
+        elif kind == 'line':
+            color = border if isinstance(border, str) else default
+            _fill(series.format.line.fill, color)
+            series.format.line.width = Pt(border_width * scale)
+            series.smooth = bool(dataset.get('tension', dataset.get('lineTension', 0)))
+            _fill(series.marker.format.fill, _pick(dataset.get('pointBackgroundColor'), 0) or color)
+            _fill(series.marker.format.line.fill, color)
+        else:
+            if isinstance(background, list) or isinstance(border, list):
+                for point_index in range(count):
+                    point = series.points[point_index]
+                    _fill(point.format.fill, _pick(background, point_index) or default)
+                    if border_width and _fill(point.format.line.fill, _pick(border, point_index) or default):
+                        point.format.line.width = Pt(border_width * scale)
+            else:
+                _fill(series.format.fill, background or default)
+                if border_width and _fill(series.format.line.fill, border or default):
+                    series.format.line.width = Pt(border_width * scale)
+
+    # Bar spacing (Chart.js categoryPercentage * barPercentage of each category)
+    if kind in ('bar', 'horizontalBar'):
+        first = datasets[0]
+        filled = first.get('categoryPercentage', 0.8) * first.get('barPercentage', 0.9)
+        plot.gap_width = max(0, min(500, int(round(100 * (1 - filled) / filled))))
+        plot.overlap = 100 if stacked else 0
+
+    # Data labels
+    datalabels = plugins.get('datalabels')
+    if datalabels is not None and datalabels.get('display') is not False:
+        plot.has_data_labels = True
+        labels_format = plot.data_labels
+        labels_format.show_value = True
+        _font(labels_format.font, datalabels, scale, default_color=DEFAULT_FONT_COLOR)
+        code = number_format(datalabels.get('formatter'))
+        if code:
+            labels_format.number_format = code
+            labels_format.number_format_is_linked = False
+        centered = 'center' in (datalabels.get('anchor'), datalabels.get('align'))
+        if kind in ('bar', 'horizontalBar') and not stacked:
+            labels_format.position = XL_LABEL_POSITION.CENTER if centered else XL_LABEL_POSITION.OUTSIDE_END
+        elif kind == 'line':
+            labels_format.position = XL_LABEL_POSITION.ABOVE
+
+    if round_chart:
+        return frame
+
+    # Axes: the value axis is x for horizontal bars
+    value_key, category_key = ('x', 'y') if kind == 'horizontalBar' else ('y', 'x')
+    value_spec = next((s for s in specs.values() if s['axis'] == value_key), {})
+    category_spec = next((s for s in specs.values() if s['axis'] == category_key), {})
+    _style_axis(chart.value_axis, value_spec, scale, categorical=False)
+    _style_axis(chart.category_axis, category_spec, scale, categorical=True)
+
+    values = [v for d in datasets for v in _series_values(d, count) if v is not None]
+    if values and min(values) < 0:
+        # Keep category labels clear of negative bars
+        chart.category_axis.tick_label_position = XL_TICK_LABEL_POSITION.LOW
+    elif value_spec.get('beginAtZero', (value_spec.get('ticks') or {}).get('beginAtZero')) \
+            and value_spec.get('min') is None:
+        chart.value_axis.minimum_scale = 0
+    return frame
@@ -24,6 +24,7 @@ from lxml import etree
 
 # Import our API utilities
 from api_utils import APIUtils
+from asset_prefetch import AssetPrefetcher
 
 
 class PresentationGenerator:
@@ -49,6 +50,108 @@ class PresentationGenerator:
             'success': RGBColor(16, 124, 16),           # #107c10
         }
 
+        # Chart name -> generated PNG path (filled by prefetch_charts)
+        self.chart_paths = {}
+
+    def chart_jobs(self):
+        """Chart.js configs for every chart slide, generated in one batch by prefetch_charts()"""
+        return {
+            # Slide 2: quarterly revenue
+            "q1_q4": {
+                "output_path": f"{self.assets_dir}/chart_q1_q4.png",
+                "width": 900,
+                "height": 500,
+                "config": {
+                    "type": "bar",
+                    "data": {
+                        "labels": ["Q1", "Q2", "Q3", "Q4"],
+                        "datasets": [{
+                            "label": "Revenue (Millions)",
+                            "data": [12, 19, 15, 25],
+                            "backgroundColor": "rgba(0, 120, 212, 0.7)"
+                        }]
+                    },
+                    "options": {
+                        "title": {
+                            "display": True,
+                            "text": "Quarterly Revenue 2025"
+                        },
+                        "scales": {
+                            "yAxes": [{
+                                "ticks": {
+                                    "beginAtZero": True
+                                }
+                            }]
+                        }
+                    }
+                }
+            },
+            # Slide 3: same chart, updated data (morphs from slide 2)
+            "updated": {
+                "output_path": f"{self.assets_dir}/chart_updated.png",
+                "width": 900,
+                "height": 500,
+                "config": {
+                    "type": "bar",
+                    "data": {
+                        "labels": ["Q1", "Q2", "Q3", "Q4"],
+                        "datasets": [{
+                            "label": "Revenue (Millions)",
+                            "data": [15, 23, 20, 32],
+                            "backgroundColor": "rgba(135, 100, 184, 0.7)"
+                        }]
+                    },
+                    "options": {
+                        "title": {
+                            "display": True,
+                            "text": "Quarterly Revenue 2026 (Projected)"
+                        },
+                        "scales": {
+                            "yAxes": [{
+                                "ticks": {
+                                    "beginAtZero": True
+                                }
+                            }]
+                        }
+                    }
+                }
+            },
+            # Slide 8: growth overlay
+            "mini": {
+                "output_path": f"{self.assets_dir}/mini_chart.png",
+                "width": 500,
+                "height": 300,
+                "config": {
+                    "type": "line",
+                    "data": {
+                        "labels": ["Jan", "Feb", "Mar", "Apr", "May"],
+                        "datasets": [{
+                            "label": "Growth",
+                            "data": [10, 15, 13, 20, 25],
+                            "borderColor": "rgb(135, 100, 184)",
+                            "backgroundColor": "rgba(135, 100, 184, 0.1)"
+                        }]
+                    }
+                }
+            }
+        }
+
+    def prefetch_charts(self):
+        """Generate all charts concurrently before the slides are built"""
+        jobs = self.chart_jobs()
+        results = APIUtils.generate_quickcharts(jobs)
+        self.chart_paths = {name: jobs[name]["output_path"] if ok else None for name, ok in results.items()}
+        print(f"Charts: {sum(results.values())}/{len(jobs)} generated")
+
+    def chart_path(self, name):
+        """Path of a generated chart (rendered on demand if it wasn't batched), or None"""
+        if name not in self.chart_paths:
+            job = self.chart_jobs()[name]
+            ok = APIUtils.generate_quickchart(job["config"], job["output_path"],
+                                              width=job["width"], height=job["height"])
+            self.chart_paths[name] = job["output_path"] if ok else None
+        return self.chart_paths.get(name)
+
     def add_morph_transition(self, slide, duration_ms=1000):
         """Add morph transition to a slide"""
         xml = f'''
@@ -166,34 +269,9 @@ class PresentationGenerator:
             run.font.bold = True
             run.font.color.rgb = self.colors['dark_gray']
 
-        # Generate chart
-        chart_config = {
-            "type": "bar",
-            "data": {
-                "labels": ["Q1", "Q2", "Q3", "Q4"],
-                "datasets": [{
-                    "label": "Revenue (Millions)",
-                    "data": [12, 19, 15, 25],
-                    "backgroundColor": "rgba(0, 120, 212, 0.7)"
-                }]
-            },
-            "options": {
-                "title": {
-                    "display": True,
-                    "text": "Quarterly Revenue 2025"
-                },
-                "scales": {
-                    "yAxes": [{
-                        "ticks": {
-                            "beginAtZero": True
-                        }
-                    }]
-                }
-            }
-        }
-
-        chart_path = f"{self.assets_dir}/chart_q1_q4.png"
-        if APIUtils.generate_quickchart(chart_config, chart_path, width=900, height=500):
+        # Chart (generated in the batch before the slides)
+        chart_path = self.chart_path("q1_q4")
+        if chart_path:
             slide.shapes.add_picture(
                 chart_path,
                 Inches(2.5), Inches(2),
@@ -219,34 +297,9 @@ class PresentationGenerator:
             run.font.bold = True
             run.font.color.rgb = self.colors['dark_gray']
 
-        # Updated chart data
-        chart_config = {
-            "type": "bar",
-            "data": {
-                "labels": ["Q1", "Q2", "Q3", "Q4"],
-                "datasets": [{
-                    "label": "Revenue (Millions)",
-                    "data": [15, 23, 20, 32],
-                    "backgroundColor": "rgba(135, 100, 184, 0.7)"
-                }]
-            },
-            "options": {
-                "title": {
-                    "display": True,
-                    "text": "Quarterly Revenue 2026 (Projected)"
-                },
-                "scales": {
-                    "yAxes": [{
-                        "ticks": {
-                            "beginAtZero": True
-                        }
-                    }]
-                }
-            }
-        }
-
-        chart_path = f"{self.assets_dir}/chart_updated.png"
-        if APIUtils.generate_quickchart(chart_config, chart_path, width=900, height=500):
+        # Updated chart (generated in the batch before the slides)
+        chart_path = self.chart_path("updated")
+        if chart_path:
             slide.shapes.add_picture(
                 chart_path,
                 Inches(2.5), Inches(2),
@@ -397,6 +450,13 @@ class PresentationGenerator:
 
         self.add_fade_transition(slide, 600)
 
+    def generate_avatar(self, name, style, size=200):
+        """Generate one avatar into the assets directory (path, or None on failure)"""
+        avatar_path = f"{self.assets_dir}/avatar_{name.lower()}.png"
+        if APIUtils.get_dicebear_avatar(name, avatar_path, style=style, size=size):
+            return avatar_path
+        return None
+
     def slide_7_avatar_grid(self):
         """Slide 7: DiceBear avatar grid"""
         print("Creating Slide 7: Avatar Grid...")
@@ -424,6 +484,12 @@ class PresentationGenerator:
             ("Frank", "personas"),
         ]
 
+        # All avatars first (local: instant; DiceBear: concurrent requests), then the grid
+        prefetcher = AssetPrefetcher()
+        for name, style in avatar_data:
+            prefetcher.add('avatars', name, 'dicebear', self.generate_avatar, name, style)
+        avatars = prefetcher.run().get('avatars', {})
+
         start_x = 1.5
         start_y = 2.2
         spacing = 2.0
@@ -436,9 +502,8 @@ class PresentationGenerator:
             x = start_x + (col * spacing)
             y = start_y + (row * spacing)
 
-            # Generate avatar
-            avatar_path = f"{self.assets_dir}/avatar_{name.lower()}.png"
-            if APIUtils.get_dicebear_avatar(name, avatar_path, style=style, size=200):
+            avatar_path = avatars.get(name)
+            if avatar_path:
                 slide.shapes.add_picture(
                     avatar_path,
                     Inches(x), Inches(y),
@@ -496,20 +561,8 @@ class PresentationGenerator:
             )
 
         # Chart overlay
-        mini_chart_config = {
-            "type": "line",
-            "data": {
-                "labels": ["Jan", "Feb", "Mar", "Apr", "May"],
-                "datasets": [{
-                    "label": "Growth",
-                    "data": [10, 15, 13, 20, 25],
-                    "borderColor": "rgb(135, 100, 184)",
-                    "backgroundColor": "rgba(135, 100, 184, 0.1)"
-                }]
-            }
-        }
-        mini_chart_path = f"{self.assets_dir}/mini_chart.png"
-        if APIUtils.generate_quickchart(mini_chart_config, mini_chart_path, width=500, height=300):
+        mini_chart_path = self.chart_path("mini")
+        if mini_chart_path:
             slide.shapes.add_picture(
                 mini_chart_path,
                 Inches(8), Inches(1.5),
@@ -546,6 +599,7 @@ class PresentationGenerator:
         print("=" * 60)
 
         try:
+            self.prefetch_charts()
             self.slide_1_title()
             self.slide_2_chart_basic()
             self.slide_3_chart_morph()
@@ -0,0 +1,102 @@
+"""
+SVG Rasterizer
+Renders local SVGs (e.g. assets/From-Figma) to PNG for python-pptx, cached by content and size.
+"""
+
+import os
+import tempfile
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # OSError: the package is installed but the cairo library is not
+    cairosvg = None
+
+from asset_cache import AssetCache
+from api_utils import CACHE
+from http_session import replace_file
+
+# SVG user units are CSS pixels: 96 per inch
+SVG_DPI = 96
+
+
+def rasterize_svg(svg_path, output_path=None, width: Optional[int] = None,
+                  height: Optional[int] = None, dpi: int = SVG_DPI) -> Optional[Path]:
+    """
+    Render an SVG to PNG, reusing a cached raster when possible.
+
+    Rasters are cached under the SVG's content hash plus the requested
+    size, so editing the SVG invalidates them and each size variant is
+    only rendered once.
+
+    Args:
+        svg_path: Path to the SVG file
+        output_path: Where to write the PNG; if omitted the cached file
+                     itself is returned (use it directly with add_picture)
+        width: Output width in pixels (height follows the aspect ratio
+               unless also given)
+        height: Output height in pixels
+        dpi: Used when no width/height is given: the SVG's intrinsic size
+             is scaled by dpi / 96 (e.g. 192 for a 2x raster)
+
+    Returns:
+        Path to the PNG, or None if rendering failed
+    """
+    svg_path = Path(svg_path)
+    try:
+        svg_bytes = svg_path.read_bytes()
+    except OSError as e:
+        print(f"Error reading SVG {svg_path}: {e}")
+        return None
+
+    cache_key = AssetCache.make_key("svg-raster", {
+        "svg": hashlib.sha256(svg_bytes).hexdigest(),
+        "width": width,
+        "height": height,
+        "dpi": None if (width or height) else dpi
+    })
+
+    if output_path:
+        if CACHE.fetch(cache_key, output_path):
+            return Path(output_path)
+    else:
+        cached = CACHE.get(cache_key)
+        if cached:
+            return cached
+
+    if cairosvg is None:
+        print("SVG rasterization requires cairosvg (and the cairo library): pip install cairosvg")
+        return None
+
+    target_dir = Path(output_path).parent if output_path else Path(tempfile.gettempdir())
+    target_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target_dir, prefix=f".{svg_path.stem}.", suffix=".png")
+    os.close(fd)
+
+    try:
+        cairosvg.svg2png(
+            bytestring=svg_bytes,
+            write_to=tmp_name,
+            url=str(svg_path),  # resolves relative <image href> references
+            output_width=width,
+            output_height=height,
+            scale=1 if (width or height) else dpi / SVG_DPI
+        )
+    except Exception as e:
+        os.unlink(tmp_name)
+        print(f"Error rasterizing {svg_path.name}: {e}")
+        return None
+
+    entry = CACHE.put(cache_key, tmp_name)
+
+    if output_path:
+        replace_file(tmp_name, output_path)
+        return Path(output_path)
+    if entry:
+        os.unlink(tmp_name)
+        return entry
+    # Cache disabled: hand back the rendered temp file
+    return Path(tmp_name)
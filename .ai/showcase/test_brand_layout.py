@@ -0,0 +1,58 @@
+"""
+Brand Layout tests
+Run from this directory: python -m pytest -q test_brand_layout.py
+"""
+
+import io
+
+from PIL import Image
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.util import Inches
+
+from brand_layout import install_brand_layout
+
+
+def _branded_deck(tmp_path):
+    logo = tmp_path / "logo.png"
+    Image.new('RGB', (60, 30), (0, 102, 204)).save(logo)
+
+    def draw(slide):
+        slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(16), Inches(0.5))
+        slide.shapes.add_picture(str(logo), Inches(14), Inches(8), width=Inches(1.5))
+
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Inches(16), Inches(9)
+    layout = install_brand_layout(prs, prs.slide_layouts[6], draw,
+                                  background=RGBColor(255, 255, 255), name="Brand")
+    return prs, layout
+
+
+def test_layout_holds_the_brand_shapes(tmp_path):
+    prs, layout = _branded_deck(tmp_path)
+
+    types = [shape.shape_type for shape in layout.shapes]
+    assert MSO_SHAPE_TYPE.AUTO_SHAPE in types
+    assert MSO_SHAPE_TYPE.PICTURE in types
+    assert layout.name == "Brand"
+    assert len(prs.slides) == 0
+
+
+def test_no_orphan_slide_part_after_save(tmp_path):
+    prs, layout = _branded_deck(tmp_path)
+    prs.slides.add_slide(layout)
+
+    buf = io.BytesIO()
+    prs.save(buf)
+    reopened = Presentation(io.BytesIO(buf.getvalue()))
+
+    slide_parts = [str(part.partname) for part in reopened.part.package.iter_parts()
+                   if str(part.partname).startswith('/ppt/slides/')]
+    assert slide_parts == ['/ppt/slides/slide1.xml']
+    assert len(reopened.slides) == 1
+
+    # The logo is linked from the layout and survives the round trip
+    layout = reopened.slides[0].slide_layout
+    picture = next(s for s in layout.shapes if s.shape_type == MSO_SHAPE_TYPE.PICTURE)
+    assert picture.image.size == (60, 30)
@@ -1,12 +1,20 @@
 """
 PNG to PowerPoint Assembler
 Inserts rendered PNGs as full-slide images with speaker notes for rehearsal.
+With --optimize, slide images are re-encoded in parallel first (see
+slide_encoder.py) so the deck is a fraction of the size.
 """
 
+import os
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches
 
+from slide_encoder import encode_slide_image, JPEG_QUALITY
+
 
 # Enhanced speaker notes for Presenter View rehearsal.
 # Format: WHY this slide matters → WHAT to say → HOW to deliver it.
@@ -429,20 +437,30 @@ SPEAKER_NOTES = {
 class PowerPointAssembler:
     """Assemble PNG slides into a PowerPoint presentation with speaker notes"""
 
-    def __init__(self, png_dir, output_file):
+    def __init__(self, png_dir, output_file, optimize=False, workers=None,
+                 max_width=1920, jpeg_quality=JPEG_QUALITY):
         self.png_dir = Path(png_dir)
         self.output_file = Path(output_file)
+        self.optimize = optimize
+        self.workers = workers or os.cpu_count() or 1
+        self.max_width = max_width
+        self.jpeg_quality = jpeg_quality
         self.prs = Presentation()
         # Standard 16:9 widescreen
         self.prs.slide_width = Inches(13.333)
         self.prs.slide_height = Inches(7.5)
 
-    def add_slide(self, png_file):
-        """Add a PNG as a full-slide image with optional speaker notes"""
+    def add_slide(self, png_file, image_file=None):
+        """
+        Add a PNG as a full-slide image with optional speaker notes.
+
+        image_file is an optimized encoding of png_file to embed instead;
+        speaker notes are still looked up by the PNG's name.
+        """
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])  # Blank layout
 
         slide.shapes.add_picture(
-            str(png_file),
+            str(image_file or png_file),
             Inches(0), Inches(0),
             width=self.prs.slide_width,
             height=self.prs.slide_height,
@@ -455,6 +473,42 @@ class PowerPointAssembler:
 
         return slide
 
+    def encode_images(self, png_files, output_dir):
+        """
+        Re-encode slide images across a process pool.
+
+        Returns:
+            {png_file: encoded image path}; slides that fail to encode are
+            left out and embedded as-is
+        """
+        encoded = {}
+        original_total = encoded_total = 0
+        formats = {}
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(png_files))) as pool:
+            futures = {
+                png_file: pool.submit(encode_slide_image, png_file, output_dir,
+                                      self.max_width, self.jpeg_quality)
+                for png_file in png_files
+            }
+            for png_file, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"  [X]  encode {png_file.name}: {e}")
+                    continue
+                encoded[png_file] = result["path"]
+                original_total += result["original_bytes"]
+                encoded_total += result["encoded_bytes"]
+                formats[result["format"]] = formats.get(result["format"], 0) + 1
+
+        if original_total:
+            saved = 1 - encoded_total / original_total
+            print(f"Images: {original_total / 1e6:.1f} MB -> {encoded_total / 1e6:.1f} MB "
+                  f"({saved:.0%} smaller; "
+                  + ", ".join(f"{n} {fmt}" for fmt, n in sorted(formats.items())) + ")")
+        return encoded
+
     def assemble_all(self):
         png_files = sorted(self.png_dir.glob("*.png"))
         if not png_files:
@@ -469,30 +523,51 @@ class PowerPointAssembler:
         print(f"Found {len(png_files)} slides")
         print("=" * 60)
 
+        with tempfile.TemporaryDirectory() as encode_dir:
+            encoded = self.encode_images(png_files, encode_dir) if self.optimize else {}
+            notes_count = self._add_slides(png_files, encoded)
+
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            self.prs.save(str(self.output_file))
+
+        print(f"\nCOMPLETE: {len(self.prs.slides)} slides, {notes_count} with speaker notes")
+        print(f"Saved to: {self.output_file} ({self.output_file.stat().st_size / 1e6:.1f} MB)")
+        return True
+
+    def _add_slides(self, png_files, encoded):
         notes_count = 0
         for png_file in png_files:
             try:
-                self.add_slide(png_file)
+                self.add_slide(png_file, encoded.get(png_file))
                 has_notes = png_file.stem in SPEAKER_NOTES
                 if has_notes:
                     notes_count += 1
                 print(f"  [OK] {png_file.name}" + (" + notes" if has_notes else ""))
             except Exception as e:
                 print(f"  [X]  {png_file.name}: {e}")
-
-        self.output_file.parent.mkdir(parents=True, exist_ok=True)
-        self.prs.save(str(self.output_file))
-
-        print(f"\nCOMPLETE: {len(self.prs.slides)} slides, {notes_count} with speaker notes")
-        print(f"Saved to: {self.output_file}")
-        return True
+        return notes_count
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Assemble slide PNGs into PowerPoint")
+    parser.add_argument("--optimize", action="store_true",
+                        help="Re-encode slide images (palette PNG / JPEG) before embedding")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes used by --optimize (default: CPU count)")
+    parser.add_argument("--max-width", type=int, default=1920,
+                        help="Downscale wider slide images to this width with --optimize")
+    parser.add_argument("--jpeg-quality", type=int, default=JPEG_QUALITY,
+                        help="JPEG quality for photographic slides with --optimize")
+    args = parser.parse_args()
+
     base = Path(__file__).parent
     assembler = PowerPointAssembler(
         png_dir=base / "output",
         output_file=base.parent / "output" / "AI-Workforce-Deck.pptx",
+        optimize=args.optimize,
+        workers=args.workers,
+        max_width=args.max_width,
+        jpeg_quality=args.jpeg_quality,
     )
     success = assembler.assemble_all()
     if success:
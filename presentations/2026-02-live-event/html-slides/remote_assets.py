@@ -0,0 +1,169 @@
+"""
+Remote Asset Cache for HTML Slides
+Caches Google Fonts stylesheets, font files and other remote slide assets
+on disk and serves them to Playwright through request routing, so slides
+render without network access once the cache is warm.
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Shared HTTP helpers live alongside api_utils
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / ".ai" / "showcase"))
+
+from http_session import get_pool, stream_to_file
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent.parent / ".cache" / "remote-assets"
+
+# <link>, <img> and <script> tags in slide HTML, and their attributes
+ASSET_TAG = re.compile(r'''<(link|img|script)\b([^>]*)>''', re.IGNORECASE)
+REMOTE_REF = re.compile(r'''\b(?:href|src)\s*=\s*["'](https?://[^"']+)["']''', re.IGNORECASE)
+REL_ATTR = re.compile(r'''\brel\s*=\s*["']([^"']+)["']''', re.IGNORECASE)
+# url(...) references inside fetched stylesheets (font files)
+CSS_URL = re.compile(r'''url\(\s*["']?(https?://[^"')]+)["']?\s*\)''', re.IGNORECASE)
+
+# Google Fonts serves woff2 only to modern browsers, so ask like one
+BROWSER_UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
+
+
+class RemoteAssetCache:
+    """
+    URL-keyed on-disk cache of remote slide assets.
+
+    Each entry is stored as <sha256(url)>.body plus a .json sidecar with
+    the URL and content type. prefetch() warms the cache from the slide
+    HTML; route() is a Playwright route handler that serves cached entries,
+    records misses when online, and aborts them when offline.
+    """
+
+    def __init__(self, cache_dir=None, offline=False):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
+
+    def get(self, url):
+        """Return (body_path, content_type) for a cached URL, or None"""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not body_path.exists():
+            return None
+        return body_path, meta.get('content_type', 'application/octet-stream')
+
+    def _write_meta(self, url, content_type):
+        _, meta_path = self._paths(url)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'url': url, 'content_type': content_type}, f)
+        os.replace(tmp_name, meta_path)
+
+    def store(self, url, body, content_type):
+        """Cache a response body that is already in memory"""
+        body_path, _ = self._paths(url)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_name, body_path)
+        self._write_meta(url, content_type)
+
+    def fetch(self, url):
+        """Download url into the cache (no-op if already cached)"""
+        if self.get(url):
+            return True
+
+        body_path, _ = self._paths(url)
+        try:
+            response = get_pool().get(url, headers={"User-Agent": BROWSER_UA}, stream=True)
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', 'application/octet-stream')
+            stream_to_file(response, body_path, hash_algorithm=None)
+            self._write_meta(url, content_type)
+            return True
+        except Exception as e:
+            print(f"  [X]  {url}: {e}")
+            return False
+
+    def prefetch(self, html_files):
+        """
+        Cache every remote stylesheet, script and image the slides reference,
+        plus the font files referenced from those stylesheets.
+
+        Returns:
+            Number of remote URLs now available offline
+        """
+        urls = set()
+        for html_file in html_files:
+            text = Path(html_file).read_text(encoding='utf-8', errors='ignore')
+            for tag, attrs in ASSET_TAG.findall(text):
+                ref = REMOTE_REF.search(attrs)
+                if not ref:
+                    continue
+                # Skip <link rel="preconnect"> and similar resource hints
+                rel = REL_ATTR.search(attrs)
+                if tag.lower() == 'link' and (not rel or 'stylesheet' not in rel.group(1).lower()):
+                    continue
+                urls.add(ref.group(1).replace('&amp;', '&'))
+
+        cached = 0
+        for url in sorted(urls):
+            if not self.fetch(url):
+                continue
+            cached += 1
+            body_path, content_type = self.get(url)
+            if 'css' in content_type:
+                css = body_path.read_text(encoding='utf-8', errors='ignore')
+                for font_url in sorted(set(CSS_URL.findall(css))):
+                    if self.fetch(font_url):
+                        cached += 1
+
+        print(f"Remote assets cached: {cached} ({self.cache_dir})")
+        return cached
+
+    async def route(self, route):
+        """Playwright route handler: serve from cache, record or block misses"""
+        url = route.request.url
+        if not url.startswith(('http://', 'https://')):
+            await route.continue_()
+            return
+
+        entry = self.get(url)
+        if entry:
+            self.hits += 1
+            body_path, content_type = entry
+            await route.fulfill(status=200, path=str(body_path),
+                                headers={"Content-Type": content_type,
+                                         "Access-Control-Allow-Origin": "*"})
+            return
+
+        self.misses += 1
+        if self.offline:
+            await route.abort()
+            return
+
+        try:
+            response = await route.fetch()
+            if response.ok:
+                self.store(url, await response.body(),
+                           response.headers.get('content-type', 'application/octet-stream'))
+        except Exception as e:
+            # DNS failure, reset connection, etc.: fail this request like the browser would,
+            # instead of leaving it unanswered until the slide times out
+            print(f"  [X]  {url}: {e}")
+            await route.abort('failed')
+            return
+        await route.fulfill(response=response)
@@ -1,29 +1,70 @@
 """
 HTML Slides to PNG Renderer
 Uses Playwright to render HTML slides to high-quality PNG images.
-Single browser instance for speed.
+Single browser instance for speed; --workers N renders slides in parallel
+across N isolated browser contexts (or N browser processes). Slides whose
+HTML and referenced files are unchanged since the last run are skipped.
+
+Readiness protocol: a slide is captured once its web fonts have loaded,
+its images are decoded and finite CSS animations have finished. Slides
+with extra async work can set `window.__slideReady = false` early and
+`true` when done; the renderer waits (up to --ready-timeout) for it.
+
+Remote fonts and stylesheets are served from a local cache (see
+remote_assets.py); --prefetch-assets warms it and --offline renders
+without touching the network.
 """
 
+import os
 import sys
+import time
+import asyncio
+import argparse
 from pathlib import Path
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
 except ImportError:
     print("ERROR: Playwright not installed")
     print("Install with: pip install playwright && playwright install chromium")
     sys.exit(1)
 
+from slide_fingerprint import SlideFingerprinter, load_manifest, save_manifest
+from remote_assets import RemoteAssetCache
+
+# Resolves when fonts, images and finite animations are done, then waits
+# two frames so the final state has been painted.
+READY_SCRIPT = """
+async () => {
+  await document.fonts.ready;
+  await Promise.all(Array.from(document.images).map(img => img.decode().catch(() => {})));
+  await Promise.all(document.getAnimations()
+    .filter(a => a.effect && a.effect.getComputedTiming().endTime !== Infinity)
+    .map(a => a.finished.catch(() => {})));
+  await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+}
+"""
+
 
 class HTMLSlideRenderer:
     """Render HTML slides to PNG using Playwright (single browser instance)"""
 
-    def __init__(self, slides_dir, output_dir, width=1920, height=1080, scale=1):
+    def __init__(self, slides_dir, output_dir, width=1920, height=1080, scale=1,
+                 workers=1, separate_browsers=False, force=False, ready_timeout=10000,
+                 remote_assets=None):
         self.slides_dir = Path(slides_dir)
         self.output_dir = Path(output_dir)
         self.width = width
         self.height = height
         self.scale = scale
+        self.workers = max(1, workers)
+        self.separate_browsers = separate_browsers
+        self.force = force
+        self.ready_timeout = ready_timeout
+        self.remote_assets = remote_assets or RemoteAssetCache()
+        self.timings = {}
+        # PNGs captured after the readiness wait timed out (may be incomplete)
+        self.unready = set()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def render_all(self):
@@ -32,55 +73,193 @@ class HTMLSlideRenderer:
             print(f"No HTML files found in {self.slides_dir}")
             return []
 
+        # Fingerprint each slide with everything it references
+        fingerprinter = SlideFingerprinter({
+            "width": self.width, "height": self.height, "scale": self.scale
+        })
+        fingerprints = {f: fingerprinter.fingerprint(f) for f in html_files}
+        previous = {} if self.force else load_manifest(self.output_dir)
+
+        results = [None] * len(html_files)
+        pending = []
+        for index, html_file in enumerate(html_files):
+            out = self.output_dir / html_file.with_suffix(".png").name
+            if previous.get(out.name) == fingerprints[html_file] and out.exists():
+                results[index] = out
+            else:
+                pending.append((index, html_file))
+
+        workers = min(self.workers, len(pending)) or 1
+
         print("=" * 60)
         print("HTML SLIDE RENDERER")
         print("=" * 60)
         print(f"Slides: {self.slides_dir}")
         print(f"Output: {self.output_dir}")
         print(f"Viewport: {self.width}x{self.height} @ {self.scale}x")
-        print(f"Found {len(html_files)} slides")
+        print(f"Workers: {workers}" + (" (separate browsers)" if self.separate_browsers else ""))
+        print(f"Remote assets: {self.remote_assets.cache_dir}"
+              + (" (offline)" if self.remote_assets.offline else ""))
+        print(f"Found {len(html_files)} slides, {len(html_files) - len(pending)} unchanged")
         print("=" * 60)
 
-        rendered = []
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page(
-                viewport={"width": self.width, "height": self.height},
-                device_scale_factor=self.scale,
-            )
+        if pending:
+            asyncio.run(self._render_files(pending, results, workers))
 
-            for html_file in html_files:
-                out = self.output_dir / html_file.with_suffix(".png").name
-                try:
-                    file_url = html_file.absolute().as_uri()
-                    page.goto(file_url)
-                    page.wait_for_load_state("networkidle")
-                    page.wait_for_timeout(400)
+        # Record fingerprints of every slide whose PNG is now current; slides
+        # captured before they were ready are re-rendered on the next run
+        save_manifest(self.output_dir, {
+            out.name: fingerprints[html_file]
+            for html_file, out in zip(html_files, results)
+            if out is not None and out not in self.unready
+        })
 
-                    # Hide the toolbar if present
-                    page.evaluate("document.getElementById('slide-toolbar')?.remove()")
+        # Results are indexed by slide position, so output order is deterministic
+        rendered = [out for out in results if out is not None]
 
-                    page.screenshot(path=str(out), full_page=False, type="png")
-                    rendered.append(out)
-                    print(f"  [OK] {html_file.name} -> {out.name}")
-                except Exception as e:
-                    print(f"  [X]  {html_file.name}: {e}")
+        self.print_timing_report()
 
-            browser.close()
+        if pending:
+            print(f"\nRemote assets: {self.remote_assets.hits} served from cache, "
+                  f"{self.remote_assets.misses} "
+                  + ("blocked (offline)" if self.remote_assets.offline else "fetched"))
 
-        print(f"\nCOMPLETE: {len(rendered)}/{len(html_files)} rendered")
+        print(f"\nCOMPLETE: {len(rendered)}/{len(html_files)} up to date "
+              f"({len(pending)} rendered, {len(html_files) - len(pending)} skipped)")
         return rendered
 
+    async def _render_files(self, pending, results, workers):
+        queue = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+
+        async with async_playwright() as p:
+            browser_count = workers if self.separate_browsers else 1
+            browsers = [await p.chromium.launch() for _ in range(browser_count)]
+
+            await asyncio.gather(*(
+                self._worker(browsers[i % browser_count], queue, results)
+                for i in range(workers)
+            ))
+
+            for browser in browsers:
+                await browser.close()
+
+    async def _worker(self, browser, queue, results):
+        """Render slides from the queue on one isolated context/page"""
+        context = await browser.new_context(
+            viewport={"width": self.width, "height": self.height},
+            device_scale_factor=self.scale,
+        )
+        # Fonts/stylesheets come from the local cache instead of the network
+        await context.route("**/*", self.remote_assets.route)
+        page = await context.new_page()
+
+        while True:
+            try:
+                index, html_file = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            results[index] = await self._render_slide(page, html_file)
+
+        await context.close()
+
+    async def wait_until_ready(self, page):
+        """
+        Wait for the slide readiness contract.
+
+        Returns:
+            True if the slide became ready, False if ready_timeout expired
+        """
+        deadline = time.perf_counter() + self.ready_timeout / 1000
+        try:
+            await asyncio.wait_for(page.evaluate(READY_SCRIPT), self.ready_timeout / 1000)
+            # Playwright treats timeout=0 as "no timeout", so keep at least 1 ms
+            remaining_ms = max(1, (deadline - time.perf_counter()) * 1000)
+            await page.wait_for_function("window.__slideReady !== false",
+                                         timeout=remaining_ms)
+            return True
+        except Exception:
+            return False
+
+    async def _render_slide(self, page, html_file):
+        out = self.output_dir / html_file.with_suffix(".png").name
+        try:
+            start = time.perf_counter()
+            file_url = html_file.absolute().as_uri()
+            await page.goto(file_url, wait_until="load")
+            loaded = time.perf_counter()
+
+            ready = await self.wait_until_ready(page)
+            settled = time.perf_counter()
+
+            # Hide the toolbar if present
+            await page.evaluate("document.getElementById('slide-toolbar')?.remove()")
+
+            await page.screenshot(path=str(out), full_page=False, type="png")
+            done = time.perf_counter()
+
+            self.timings[html_file.name] = {
+                "load_ms": round((loaded - start) * 1000),
+                "ready_ms": round((settled - loaded) * 1000),
+                "total_ms": round((done - start) * 1000),
+                "timed_out": not ready,
+            }
+            if not ready:
+                self.unready.add(out)
+            note = " (readiness timed out)" if not ready else ""
+            print(f"  [OK] {html_file.name} -> {out.name}  "
+                  f"{self.timings[html_file.name]['total_ms']} ms{note}")
+            return out
+        except Exception as e:
+            print(f"  [X]  {html_file.name}: {e}")
+            return None
+
+    def print_timing_report(self, limit=10):
+        """Print load/ready/total times for the slowest slides"""
+        if not self.timings:
+            return
+
+        print(f"\nTIMING ({min(limit, len(self.timings))} slowest)")
+        print(f"  {'slide':<34} {'load':>7} {'ready':>7} {'total':>7}")
+        ranked = sorted(self.timings.items(), key=lambda item: -item[1]["total_ms"])
+        for name, t in ranked[:limit]:
+            flag = "  timeout" if t["timed_out"] else ""
+            print(f"  {name:<34} {t['load_ms']:>5}ms {t['ready_ms']:>5}ms {t['total_ms']:>5}ms{flag}")
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Render HTML slides to PNG")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Slides rendered in parallel (isolated browser contexts)")
+    parser.add_argument("--separate-browsers", action="store_true",
+                        help="Give each worker its own browser process")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every slide, ignoring the render manifest")
+    parser.add_argument("--ready-timeout", type=int, default=10000,
+                        help="Max ms to wait for fonts/images/window.__slideReady per slide")
+    parser.add_argument("--prefetch-assets", action="store_true",
+                        help="Download remote fonts/stylesheets into the cache before rendering")
+    parser.add_argument("--offline", action="store_true",
+                        help="Never hit the network; uncached remote assets are blocked")
+    args = parser.parse_args()
+
     base = Path(__file__).parent
+    remote_assets = RemoteAssetCache(offline=args.offline)
+    if args.prefetch_assets:
+        remote_assets.prefetch(sorted((base / "slides").glob('*.html')))
+
     renderer = HTMLSlideRenderer(
         slides_dir=base / "slides",
         output_dir=base / "output",
         width=1920,
         height=1080,
         scale=1,  # 1x = native 1920x1080 PNGs (smaller files, correct for pptx)
+        workers=args.workers,
+        separate_browsers=args.separate_browsers,
+        force=args.force,
+        ready_timeout=args.ready_timeout,
+        remote_assets=remote_assets,
     )
     rendered = renderer.render_all()
     if rendered:
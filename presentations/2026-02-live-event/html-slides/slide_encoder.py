@@ -0,0 +1,101 @@
+"""
+Slide Image Encoder
+Re-encodes rendered slide PNGs before they are embedded in the deck:
+exact palette PNG for flat-colour slides, high-quality JPEG for slides
+with photos or gradients, whichever is smallest.
+"""
+
+import io
+from pathlib import Path
+
+from PIL import Image, ImageFile
+
+# 4:4:4 chroma keeps coloured text edges crisp at this quality
+JPEG_QUALITY = 92
+# Lossy output must beat the best lossless candidate by this much to be used
+JPEG_MIN_SAVING = 0.8
+
+
+def _palette_png(img, colors):
+    """Exact palette PNG (no dithering, no colour loss) for <= 256 colours"""
+    palette = []
+    for _, color in colors:
+        palette.extend(color[:3])
+    palette_img = Image.new('P', (1, 1))
+    palette_img.putpalette(palette + [0] * (768 - len(palette)))
+    quantized = img.quantize(palette=palette_img, dither=Image.Dither.NONE)
+
+    buf = io.BytesIO()
+    quantized.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def _png(img):
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def _jpeg(img, quality):
+    buf = io.BytesIO()
+    # optimize=True encodes the whole image in one buffer; Pillow's default is
+    # too small for noisy full-HD slides at 4:4:4 ("broken data stream")
+    maxblock = ImageFile.MAXBLOCK
+    ImageFile.MAXBLOCK = max(maxblock, img.width * img.height * 3)
+    try:
+        img.save(buf, format='JPEG', quality=quality, subsampling=0, optimize=True)
+    finally:
+        ImageFile.MAXBLOCK = maxblock
+    return buf.getvalue()
+
+
+def encode_slide_image(png_path, output_dir, max_width=None, jpeg_quality=JPEG_QUALITY):
+    """
+    Write the smallest acceptable encoding of a slide image to output_dir.
+
+    Module-level (not a method) so it can run in a ProcessPoolExecutor.
+
+    Args:
+        png_path: Rendered slide PNG
+        output_dir: Directory for the encoded file (same stem as png_path)
+        max_width: Downscale (Lanczos) wider images to this width
+        jpeg_quality: JPEG quality for photographic slides
+
+    Returns:
+        Dict with path, format, original_bytes and encoded_bytes
+    """
+    png_path = Path(png_path)
+    original_bytes = png_path.stat().st_size
+
+    with Image.open(png_path) as img:
+        img.load()
+        has_alpha = img.mode in ('RGBA', 'LA') and img.getextrema()[-1][0] < 255
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+
+    resized = bool(max_width and img.width > max_width)
+    if resized:
+        height = round(img.height * max_width / img.width)
+        img = img.resize((max_width, height), Image.Resampling.LANCZOS)
+
+    candidates = []
+    colors = img.getcolors(maxcolors=256) if not has_alpha else None
+    if colors:
+        candidates.append(('png', _palette_png(img, colors)))
+    else:
+        candidates.append(('png', _png(img)))
+        if not has_alpha:
+            jpeg = _jpeg(img, jpeg_quality)
+            if len(jpeg) < len(candidates[0][1]) * JPEG_MIN_SAVING:
+                candidates.append(('jpg', jpeg))
+
+    fmt, data = min(candidates, key=lambda c: len(c[1]))
+
+    # Keep the original when re-encoding doesn't help and nothing was resized
+    if len(data) >= original_bytes and not resized:
+        return {"path": png_path, "format": "png",
+                "original_bytes": original_bytes, "encoded_bytes": original_bytes}
+
+    out = Path(output_dir) / f"{png_path.stem}.{fmt}"
+    out.write_bytes(data)
+    return {"path": out, "format": fmt,
+            "original_bytes": original_bytes, "encoded_bytes": len(data)}
@@ -0,0 +1,111 @@
+"""
+Slide Dependency Fingerprints
+Hashes each HTML slide together with every local file it references,
+so the renderer can skip slides whose output would not change.
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# src="..." / href="..." attributes in HTML
+ATTR_REF = re.compile(r'''\b(?:src|href)\s*=\s*["']([^"']+)["']''', re.IGNORECASE)
+# url(...) in CSS (inline <style> blocks, style="" attributes, stylesheets)
+CSS_URL = re.compile(r'''url\(\s*["']?([^"')]+)["']?\s*\)''', re.IGNORECASE)
+# @import "..." without url()
+CSS_IMPORT = re.compile(r'''@import\s+["']([^"']+)["']''', re.IGNORECASE)
+
+MANIFEST_NAME = ".render-manifest.json"
+
+
+def _is_local(ref):
+    if ref.startswith(('#', 'data:', 'mailto:', 'javascript:', '//')):
+        return False
+    return urlsplit(ref).scheme in ('', 'file')
+
+
+class SlideFingerprinter:
+    """
+    Compute content fingerprints for HTML slides.
+
+    A fingerprint covers the slide HTML, every local file it references
+    (stylesheets, scripts, images, fonts), files referenced from those
+    stylesheets, and the render settings. File hashes are memoised so
+    shared files like styles/brand.css are read once per run.
+    """
+
+    def __init__(self, render_settings=None):
+        self.render_settings = render_settings or {}
+        self._file_hashes = {}
+
+    def _hash_file(self, path):
+        key = str(path)
+        if key not in self._file_hashes:
+            self._file_hashes[key] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self._file_hashes[key]
+
+    def _refs(self, path):
+        """Local files referenced directly by an HTML or CSS file"""
+        try:
+            text = path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            return []
+
+        if path.suffix.lower() == '.css':
+            refs = CSS_URL.findall(text) + CSS_IMPORT.findall(text)
+        elif path.suffix.lower() in ('.html', '.htm'):
+            refs = ATTR_REF.findall(text) + CSS_URL.findall(text)
+        else:
+            return []
+
+        resolved = []
+        for ref in refs:
+            ref = ref.strip()
+            if not _is_local(ref):
+                continue
+            target = (path.parent / unquote(urlsplit(ref).path)).resolve()
+            if target.is_file():
+                resolved.append(target)
+        return resolved
+
+    def dependencies(self, html_file):
+        """All local files the slide depends on (transitively through CSS)"""
+        seen = set()
+        pending = [Path(html_file).resolve()]
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            pending.extend(self._refs(path))
+        return sorted(seen)
+
+    def fingerprint(self, html_file):
+        """SHA-256 over render settings plus (path, content hash) of every dependency"""
+        base = Path(html_file).resolve().parent
+        digest = hashlib.sha256()
+        digest.update(json.dumps(self.render_settings, sort_keys=True).encode('utf-8'))
+        for path in self.dependencies(html_file):
+            # Relative paths keep fingerprints stable when the repo moves
+            digest.update(os.path.relpath(path, base).encode('utf-8'))
+            digest.update(self._hash_file(path).encode('ascii'))
+        return digest.hexdigest()
+
+
+def load_manifest(output_dir):
+    """Return {png name: fingerprint} from the last render (empty if none)"""
+    path = Path(output_dir) / MANIFEST_NAME
+    try:
+        with open(path) as f:
+            return json.load(f).get('slides', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, slides):
+    path = Path(output_dir) / MANIFEST_NAME
+    with open(path, 'w') as f:
+        json.dump({'slides': slides}, f, indent=2, sort_keys=True)
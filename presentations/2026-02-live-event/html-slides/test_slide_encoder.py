@@ -0,0 +1,40 @@
+"""
+Slide Image Encoder tests
+Run from this directory: python -m pytest -q
+"""
+
+from PIL import Image, ImageChops
+
+from slide_encoder import encode_slide_image
+
+
+def _photo_slide(size=(1920, 1080), sigma=20):
+    """Full-HD gradient with film-grain noise: millions of colours, like a photo slide"""
+    gradient = Image.linear_gradient('L').rotate(90).resize(size)
+    return Image.merge('RGB', [
+        ImageChops.add(gradient, Image.effect_noise(size, sigma), offset=-128) for _ in range(3)
+    ])
+
+
+def test_noisy_full_hd_slide_encodes_as_jpeg(tmp_path):
+    png = tmp_path / "slide-01.png"
+    _photo_slide().save(png)
+    out_dir = tmp_path / "encoded"
+    out_dir.mkdir()
+
+    result = encode_slide_image(png, out_dir)
+
+    assert result["format"] == "jpg"
+    assert result["encoded_bytes"] < result["original_bytes"]
+    with Image.open(result["path"]) as img:
+        assert img.format == "JPEG"
+        assert img.size == (1920, 1080)
+
+
+def test_flat_slide_stays_lossless(tmp_path):
+    png = tmp_path / "slide-02.png"
+    Image.new('RGB', (1920, 1080), (255, 107, 53)).save(png)
+
+    result = encode_slide_image(png, tmp_path)
+
+    assert result["format"] == "png"
@@ -16,12 +16,18 @@ from pptx.enum.shapes import MSO_SHAPE
 from pptx.oxml.xmlchemy import OxmlElement
 from lxml import etree
 from api_utils import APIUtils
+from svg_raster import rasterize_svg
+from asset_catalog import AssetCatalog
+from image_dedup import image_reuse_report, print_image_report
+from brand_layout import install_brand_layout
+from native_charts import add_native_chart, native_chart_supported
 
 class ShowcaseV2Improved:
     """Showcase demonstrating professional presentation generation with eSided branding"""
 
-    def __init__(self):
+    def __init__(self, native_charts=True):
         self.prs = Presentation()
+        self.native_charts = native_charts  # Editable PowerPoint chart instead of a QuickChart PNG
         self.prs.slide_width = Inches(16)
         self.prs.slide_height = Inches(9)
 
@@ -29,6 +35,8 @@ class ShowcaseV2Improved:
         self.project_root = Path(__file__).parent.parent.parent
         self.assets_dir = self.project_root / "assets"
         self.assets_local = Path(__file__).parent / "assets-local"
+        self.catalog = AssetCatalog(self.assets_dir)
+        self.catalog.refresh()
         self.output_dir = Path(__file__).parent / "output"
         self.output_dir.mkdir(exist_ok=True)
 
@@ -40,11 +48,22 @@ class ShowcaseV2Improved:
         self.success_green = RGBColor(16, 124, 16)
         self.white = RGBColor(255, 255, 255)
 
-        # Logo path
-        self.logo_path = self.assets_local / "eSided-Logo.png"
+        # Logo path: raster of the Figma SVG at the placed size (1.5" @ 300 DPI),
+        # falling back to the exported PNG when cairosvg is unavailable
+        logo_svg = self.catalog.path("eSided-Original-Logo")
+        self.logo_path = (
+            (logo_svg and rasterize_svg(logo_svg, width=450))
+            or self.assets_local / "eSided-Logo.png"
+        )
+
+        # Brand elements and white background live in the layout, not on each slide
+        self.brand_layout = install_brand_layout(
+            self.prs, self.prs.slide_layouts[6], self.add_brand_elements,
+            background=self.white, name="eSided Brand"
+        )
 
     def add_brand_elements(self, slide):
-        """Add eSided logo, curved shapes, and website info to slide"""
+        """Draw eSided logo, curved shapes, and website info (installed into the brand layout)"""
 
         # 1. Add curved shape decorations
         # Top curve (blue)
@@ -102,6 +121,10 @@ class ShowcaseV2Improved:
         para.font.color.rgb = self.dark_gray
         para.alignment = PP_ALIGN.RIGHT
 
+    def new_slide(self):
+        """Add a slide that inherits the brand elements and background"""
+        return self.prs.slides.add_slide(self.brand_layout)
+
     def create_table_comparison(self, slide, left_header, right_header, rows):
         """Create a professional 2-column comparison table"""
         # Table dimensions
@@ -169,16 +192,7 @@ class ShowcaseV2Improved:
 
     def create_question_slide(self, title, subtext=None):
         """Create a provocative question slide with brand elements"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # White background (NO GRAY)
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.white
-
-        # Add brand elements
-        self.add_brand_elements(slide)
+        slide = self.new_slide()
 
         # Large provocative question
         question_box = slide.shapes.add_textbox(
@@ -212,12 +226,10 @@ class ShowcaseV2Improved:
 
         return slide
 
-    def generate_advanced_chart(self):
-        """Generate chart with IMPROVED readability - larger fonts, better spacing"""
-        print("Generating improved chart...")
-
+    def advanced_chart_config(self):
+        """Chart.js config with IMPROVED readability - larger fonts, better spacing (1600x800 canvas)"""
         # Simplified, more readable chart
-        chart_config = {
+        return {
             "type": "bar",
             "data": {
                 "labels": ["Platform Cost", "Config & Training", "Value Created", "Net ROI"],
@@ -300,8 +312,11 @@ class ShowcaseV2Improved:
             }
         }
 
+    def generate_advanced_chart(self):
+        """Render the improved chart to PNG with QuickChart"""
+        print("Generating improved chart...")
         chart_path = self.output_dir / "showcase_chart_improved.png"
-        if APIUtils.generate_quickchart(chart_config, str(chart_path), width=1600, height=800):
+        if APIUtils.generate_quickchart(self.advanced_chart_config(), str(chart_path), width=1600, height=800):
             print(f"  [OK] Improved chart saved (larger fonts, better spacing)")
             return chart_path
         return None
@@ -315,16 +330,7 @@ class ShowcaseV2Improved:
 
         # SLIDE 1: Professional Title Slide
         print("\n[1/7] Professional title slide with hero image")
-        slide1 = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # White background
-        background = slide1.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.white
-
-        # Add brand elements
-        self.add_brand_elements(slide1)
+        slide1 = self.new_slide()
 
         # Title (left side)
         title_box = slide1.shapes.add_textbox(
@@ -365,16 +371,7 @@ class ShowcaseV2Improved:
 
         # SLIDE 2: Team Leadership
         print("[2/7] Team slide with actual photos")
-        slide2 = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # White background
-        background = slide2.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.white
-
-        # Add brand elements
-        self.add_brand_elements(slide2)
+        slide2 = self.new_slide()
 
         # Title
         title_box = slide2.shapes.add_textbox(
@@ -455,16 +452,7 @@ class ShowcaseV2Improved:
 
         # SLIDE 4: Workers vs Tools (TABLE)
         print("[4/7] Comparison table (Workers vs Tools)")
-        slide4 = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # White background
-        background = slide4.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.white
-
-        # Add brand elements
-        self.add_brand_elements(slide4)
+        slide4 = self.new_slide()
 
         # Title
         title_box = slide4.shapes.add_textbox(
@@ -496,19 +484,11 @@ class ShowcaseV2Improved:
 
         # SLIDE 5: Advanced Chart
         print("[5/7] Improved chart with larger fonts and better spacing")
-        chart_path = self.generate_advanced_chart()
-
-        if chart_path:
-            slide5 = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        native = self.native_charts and native_chart_supported(self.advanced_chart_config())
+        chart_path = None if native else self.generate_advanced_chart()
 
-            # White background
-            background = slide5.background
-            fill = background.fill
-            fill.solid()
-            fill.fore_color.rgb = self.white
-
-            # Add brand elements
-            self.add_brand_elements(slide5)
+        if native or chart_path:
+            slide5 = self.new_slide()
 
             # Title
             title_box = slide5.shapes.add_textbox(
@@ -525,11 +505,18 @@ class ShowcaseV2Improved:
             title_para.alignment = PP_ALIGN.CENTER
 
             # Chart (centered, larger)
-            slide5.shapes.add_picture(
-                str(chart_path),
-                Inches(2), Inches(2),
-                width=Inches(12)
-            )
+            if native:
+                add_native_chart(
+                    slide5, self.advanced_chart_config(),
+                    Inches(2), Inches(2), Inches(12), Inches(6),
+                    width_px=1600
+                )
+            else:
+                slide5.shapes.add_picture(
+                    str(chart_path),
+                    Inches(2), Inches(2),
+                    width=Inches(12)
+                )
 
             # Key insight callout
             insight_box = slide5.shapes.add_textbox(
@@ -547,16 +534,7 @@ class ShowcaseV2Improved:
 
         # SLIDE 6: Short Provocative Statement
         print("[6/7] Short provocative statement")
-        slide6 = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # White background (NO GRAY)
-        background = slide6.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.white
-
-        # Add brand elements
-        self.add_brand_elements(slide6)
+        slide6 = self.new_slide()
 
         # Statement
         statement_box = slide6.shapes.add_textbox(
@@ -594,7 +572,8 @@ class ShowcaseV2Improved:
             "Resisting? Accepting? Participating?"
         )
 
-        # Save presentation
+        # python-pptx stores each distinct picture once; report the reuse, then save
+        image_report = image_reuse_report(self.prs)
         output_file = self.output_dir / "V2_Showcase_Improved.pptx"
         self.prs.save(str(output_file))
 
@@ -603,6 +582,7 @@ class ShowcaseV2Improved:
         print("="*60)
         print(f"Saved to: {output_file}")
         print(f"Total slides: {len(self.prs.slides)}")
+        print_image_report(image_report)
         print("\nDesign improvements:")
         print("  [OK] eSided logo on all slides (top)")
         print("  [OK] Website info on all slides (bottom right)")
@@ -1,48 +1,125 @@
 """
 Figma Asset Sync
 Automatically download assets from Figma and organize into project structure.
+
+Interactive by default; pass --yes (and optionally --json) to run from a
+scheduler. Exit codes: 0 synced/up to date, 1 Figma error, 2 bad
+configuration, 3 partial (downloads failed or frames unverified), 4 cancelled.
 """
 
 import os
 import sys
 import json
-import requests
+import time
+import hashlib
+import argparse
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import requests
 from dotenv import load_dotenv
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Shared HTTP helpers live alongside api_utils
+sys.path.insert(0, str(Path(__file__).parent.parent / ".ai" / "showcase"))
+
+from http_session import get_pool
+
 # Load environment variables
 load_dotenv()
 
 FIGMA_TOKEN = os.getenv('FIGMA_ACCESS_TOKEN')
 FIGMA_FILE_KEY = os.getenv('FIGMA_FILE_KEY')
 
-if not FIGMA_TOKEN:
-    print("ERROR: FIGMA_ACCESS_TOKEN not found in .env")
-    sys.exit(1)
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_CONFIG = 2
+EXIT_PARTIAL = 3
+EXIT_CANCELLED = 4
+
+# Node IDs per /images request; keeps the query string well under URL limits
+EXPORT_CHUNK_SIZE = 50
+
+# Category -> (label, destination under assets/)
+CATEGORY_DESTINATIONS = {
+    'logos': ('logos', ('brand', 'logos')),
+    'team': ('team photos', ('team', 'headshots')),
+    'illustrations': ('illustrations', ('illustrations', 'concepts')),
+    'icons': ('icons', ('illustrations', 'icons')),
+    'other': ('other assets', ('illustrations', 'concepts')),
+}
 
-if not FIGMA_FILE_KEY:
-    print("ERROR: FIGMA_FILE_KEY not found in .env")
-    sys.exit(1)
+
+def node_hash(node):
+    """Content signature of a Figma node: SHA-256 of its canonical JSON"""
+    canonical = json.dumps(node, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class RateLimiter:
+    """Space calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
 
 class FigmaSync:
     """Sync assets from Figma to local project structure"""
 
-    def __init__(self):
-        self.token = FIGMA_TOKEN
-        self.file_key = FIGMA_FILE_KEY
+    def __init__(self, token=None, file_key=None, export_concurrency=4, export_rate=5,
+                 download_workers=8, chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Raises:
+            ValueError if no token/file key is given or set in .env
+        """
+        self.token = token or FIGMA_TOKEN
+        self.file_key = file_key or FIGMA_FILE_KEY
+        if not self.token:
+            raise ValueError("FIGMA_ACCESS_TOKEN not found in .env")
+        if not self.file_key:
+            raise ValueError("FIGMA_FILE_KEY not found in .env")
         self.base_url = "https://api.figma.com/v1"
         self.headers = {
             "X-Figma-Token": self.token
         }
         self.assets_dir = Path(__file__).parent.parent / "assets"
+        self.manifest_path = self.assets_dir / 'figma-sync-manifest.json'
+        self.http = get_pool()
+        self.export_concurrency = export_concurrency
+        self.export_limiter = RateLimiter(export_rate)
+        self.download_workers = download_workers
+        self.chunk_size = chunk_size
+
+    def get_file_info(self, depth=2):
+        """
+        Get file information and structure
 
-    def get_file_info(self):
-        """Get file information and structure"""
+        Args:
+            depth: Document levels to fetch. 2 returns pages and their
+                   top-level frames only, which is all the sync needs;
+                   None fetches the entire document.
+        """
         url = f"{self.base_url}/files/{self.file_key}"
+        params = {'depth': depth} if depth else None
 
         print(f"Connecting to Figma file: {self.file_key}...")
-        response = requests.get(url, headers=self.headers)
+        response = self.http.get(url, headers=self.headers, params=params)
 
         if response.status_code == 200:
             data = response.json()
@@ -54,8 +131,97 @@ class FigmaSync:
             print(response.text)
             return None
 
-    def list_pages_and_frames(self, file_data):
-        """List all pages and frames in the file"""
+    def get_file_version(self):
+        """
+        Get just the file's version and lastModified (depth=1, a few KB)
+
+        Returns:
+            {'version': ..., 'lastModified': ...} or None on error
+        """
+        url = f"{self.base_url}/files/{self.file_key}"
+        response = self.http.get(url, headers=self.headers, params={'depth': 1})
+
+        if response.status_code == 200:
+            data = response.json()
+            return {'version': data.get('version'), 'lastModified': data.get('lastModified')}
+        else:
+            print(f"Error checking file version: {response.status_code}")
+            return None
+
+    def _hash_node_chunk(self, node_ids):
+        """
+        Fetch full subtrees for a chunk of nodes and return {id: node_hash},
+        or None if Figma returned an error for the chunk.
+
+        With ijson installed the response is parsed one node at a time, so
+        only a single frame's JSON is in memory at once.
+        """
+        url = f"{self.base_url}/files/{self.file_key}/nodes"
+        params = {'ids': ','.join(node_ids)}
+
+        self.export_limiter.wait()
+        response = self.http.get(url, headers=self.headers, params=params, stream=True)
+        try:
+            if response.status_code != 200:
+                print(f"Error fetching nodes: {response.status_code}")
+                return None
+
+            if ijson is not None:
+                response.raw.decode_content = True
+                entries = ijson.kvitems(response.raw, 'nodes', use_float=True)
+            else:
+                entries = (response.json().get('nodes') or {}).items()
+
+            hashes = {}
+            for node_id, entry in entries:
+                if entry and entry.get('document'):
+                    hashes[node_id] = node_hash(entry['document'])
+            return hashes
+        finally:
+            response.close()
+
+    def get_node_hashes(self, node_ids):
+        """
+        Content hashes for the given nodes, fetched via /nodes in chunks
+
+        Returns:
+            {node_id: SHA-256 of the node's canonical JSON}; nodes in a chunk
+            that failed are left out
+        """
+        if not node_ids:
+            return {}
+
+        chunks = [node_ids[i:i + self.chunk_size]
+                  for i in range(0, len(node_ids), self.chunk_size)]
+
+        print(f"\nFetching {len(node_ids)} frames in {len(chunks)} request(s) "
+              f"({'streaming' if ijson is not None else 'buffered'} parse)...")
+
+        hashes = {}
+        with ThreadPoolExecutor(max_workers=min(self.export_concurrency, len(chunks))) as pool:
+            for chunk_hashes in pool.map(self._hash_node_chunk, chunks):
+                if chunk_hashes is not None:
+                    hashes.update(chunk_hashes)
+
+        missing = len(node_ids) - len(hashes)
+        if missing:
+            print(f"Could not verify {missing} frame(s); keeping their previous hashes")
+        return hashes
+
+    def list_pages_and_frames(self, file_data, hashes=None, previous=None):
+        """
+        List all pages and frames in the file
+
+        Args:
+            file_data: File JSON (depth 2 is enough)
+            hashes: {frame_id: hash} from get_node_hashes. Frames missing
+                    from it (their /nodes request failed) keep their hash
+                    from `previous` and are marked 'unverified'. Without
+                    hashes, frames are hashed from the JSON in file_data
+                    (only meaningful for a full-depth document).
+            previous: Previous manifest 'nodes' entries
+        """
+        previous = previous or {}
         if not file_data:
             return []
 
@@ -73,8 +239,14 @@ class FigmaSync:
                 frame_info = {
                     'name': frame.get('name'),
                     'id': frame.get('id'),
-                    'type': frame.get('type')
+                    'type': frame.get('type'),
+                    'hash': node_hash(frame) if hashes is None else hashes.get(frame.get('id'))
                 }
+                if frame_info['hash'] is None:
+                    # A depth-2 frame has no children, so hashing it would miss
+                    # content changes: fall back to the last verified hash
+                    frame_info['hash'] = previous.get(frame_info['id'], {}).get('hash')
+                    frame_info['unverified'] = True
                 page_info['frames'].append(frame_info)
 
             structure.append(page_info)
@@ -86,7 +258,7 @@ class FigmaSync:
         url = f"{self.base_url}/files/{self.file_key}/images"
 
         print("\nFetching exportable images...")
-        response = requests.get(url, headers=self.headers)
+        response = self.http.get(url, headers=self.headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -95,65 +267,81 @@ class FigmaSync:
             print(f"Error fetching images: {response.status_code}")
             return {}
 
+    def _export_chunk(self, node_ids, format, scale):
+        """Export one chunk of node IDs (rate limited)"""
+        url = f"{self.base_url}/images/{self.file_key}"
+        params = {
+            'ids': ','.join(node_ids),  # Figma API accepts comma-separated IDs
+            'format': format,
+            'scale': scale
+        }
+
+        self.export_limiter.wait()
+        response = self.http.get(url, headers=self.headers, params=params)
+
+        if response.status_code == 200:
+            data = response.json()
+            return data.get('images') or {}
+        else:
+            print(f"Error exporting nodes: {response.status_code}")
+            print(response.text)
+            return {}
+
     def export_nodes(self, node_ids, format='png', scale=2):
         """
         Export specific nodes as images
 
+        IDs are split into chunks of chunk_size and the chunks are requested
+        concurrently (export_concurrency at a time, at most export_rate
+        requests per second).
+
         Args:
             node_ids: List of node IDs to export
             format: Image format (png, jpg, svg, pdf)
             scale: Export scale (1, 2, 3, 4)
+
+        Returns:
+            {node_id: image URL} for every node Figma rendered
         """
         if not node_ids:
             print("No node IDs provided for export")
             return {}
 
-        # Figma API accepts comma-separated IDs
-        ids_param = ','.join(node_ids)
+        chunks = [node_ids[i:i + self.chunk_size]
+                  for i in range(0, len(node_ids), self.chunk_size)]
 
-        url = f"{self.base_url}/images/{self.file_key}"
-        params = {
-            'ids': ids_param,
-            'format': format,
-            'scale': scale
-        }
+        print(f"\nExporting {len(node_ids)} nodes as {format} (scale {scale}x) "
+              f"in {len(chunks)} request(s)...")
 
-        print(f"\nExporting {len(node_ids)} nodes as {format} (scale {scale}x)...")
-        response = requests.get(url, headers=self.headers, params=params)
-
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('images', {})
-        else:
-            print(f"Error exporting nodes: {response.status_code}")
-            print(response.text)
-            return {}
+        image_urls = {}
+        with ThreadPoolExecutor(max_workers=min(self.export_concurrency, len(chunks))) as pool:
+            for urls in pool.map(lambda chunk: self._export_chunk(chunk, format, scale), chunks):
+                # Nodes Figma failed to render come back as null
+                image_urls.update({k: v for k, v in urls.items() if v})
+        return image_urls
 
     def download_image(self, url, output_path):
-        """Download an image from URL"""
+        """Download an image from URL (streamed to disk, renamed into place when complete)"""
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-
+            self.http.download(url, output_path, timeout=30)
             return True
         except Exception as e:
             print(f"Error downloading {output_path.name}: {e}")
             return False
 
-    def organize_assets(self, file_data):
+    def organize_assets(self, file_data, hashes=None, previous=None):
         """
         Analyze file structure and suggest organization into project folders
+
+        Args:
+            file_data: File JSON
+            hashes, previous: See list_pages_and_frames
         """
         print("\n" + "="*60)
         print("FIGMA FILE STRUCTURE")
         print("="*60)
 
-        structure = self.list_pages_and_frames(file_data)
+        structure = self.list_pages_and_frames(file_data, hashes, previous)
 
         organization = {
             'logos': [],
@@ -181,134 +369,285 @@ class FigmaSync:
                     safe_name = frame['name'].encode('ascii', 'ignore').decode('ascii')
                     print(f"    - {safe_name} ({frame['type']}) [ID: {frame['id']}]")
 
+                item = {
+                    'name': frame['name'],
+                    'id': frame['id'],
+                    'page': page['name'],
+                    'hash': frame['hash']
+                }
+                if frame.get('unverified'):
+                    item['unverified'] = True
+
                 # Categorize
                 if 'logo' in page_name_lower or 'logo' in frame_name_lower:
-                    organization['logos'].append({
-                        'name': frame['name'],
-                        'id': frame['id'],
-                        'page': page['name']
-                    })
+                    organization['logos'].append(item)
                 elif 'team' in page_name_lower or 'headshot' in frame_name_lower or 'photo' in frame_name_lower:
-                    organization['team'].append({
-                        'name': frame['name'],
-                        'id': frame['id'],
-                        'page': page['name']
-                    })
+                    organization['team'].append(item)
                 elif 'icon' in page_name_lower or 'icon' in frame_name_lower:
-                    organization['icons'].append({
-                        'name': frame['name'],
-                        'id': frame['id'],
-                        'page': page['name']
-                    })
+                    organization['icons'].append(item)
                 elif 'illustration' in page_name_lower or 'graphic' in frame_name_lower:
-                    organization['illustrations'].append({
-                        'name': frame['name'],
-                        'id': frame['id'],
-                        'page': page['name']
-                    })
+                    organization['illustrations'].append(item)
                 else:
-                    organization['other'].append({
-                        'name': frame['name'],
-                        'id': frame['id'],
-                        'page': page['name']
-                    })
+                    organization['other'].append(item)
 
         return organization
 
-    def download_all_assets(self, organization):
-        """Download all categorized assets to appropriate folders"""
+    def asset_path(self, category, item):
+        """Local destination for a categorized node"""
+        _, destination = CATEGORY_DESTINATIONS[category]
+        filename = item['name'].lower().replace(' ', '-') + '.png'
+        return self.assets_dir.joinpath(*destination, filename)
+
+    def download_all_assets(self, organization, only_ids=None):
+        """
+        Download all categorized assets to appropriate folders
+
+        Args:
+            organization: Output of organize_assets
+            only_ids: Restrict the export/download to these node IDs
+        """
         print("\n" + "="*60)
         print("DOWNLOADING ASSETS")
         print("="*60)
 
-        downloads = []
+        for category, (label, _) in CATEGORY_DESTINATIONS.items():
+            if organization.get(category):
+                print(f"{len(organization[category])} {label}")
+
+        # One chunked export for every category instead of one call each
+        node_ids = list(dict.fromkeys(
+            item['id'] for category in CATEGORY_DESTINATIONS
+            for item in organization.get(category, [])
+            if only_ids is None or item['id'] in only_ids
+        ))
+        image_urls = self.export_nodes(node_ids, format='png', scale=2) if node_ids else {}
+
+        jobs = []
+        for category in CATEGORY_DESTINATIONS:
+            for item in organization.get(category, []):
+                if item['id'] in image_urls:
+                    jobs.append((image_urls[item['id']], self.asset_path(category, item)))
 
-        # Download logos
-        if organization['logos']:
-            print(f"\nDownloading {len(organization['logos'])} logos...")
-            node_ids = [item['id'] for item in organization['logos']]
-            image_urls = self.export_nodes(node_ids, format='png', scale=2)
+        print(f"\nDownloading {len(jobs)} images ({self.download_workers} at a time)...")
 
-            for item in organization['logos']:
-                if item['id'] in image_urls:
-                    filename = item['name'].lower().replace(' ', '-') + '.png'
-                    output_path = self.assets_dir / 'brand' / 'logos' / filename
-                    if self.download_image(image_urls[item['id']], output_path):
-                        downloads.append(str(output_path))
-                        print(f"  [OK] {filename}")
-
-        # Download team photos
-        if organization['team']:
-            print(f"\nDownloading {len(organization['team'])} team photos...")
-            node_ids = [item['id'] for item in organization['team']]
-            image_urls = self.export_nodes(node_ids, format='png', scale=2)
-
-            for item in organization['team']:
-                if item['id'] in image_urls:
-                    filename = item['name'].lower().replace(' ', '-') + '.png'
-                    output_path = self.assets_dir / 'team' / 'headshots' / filename
-                    if self.download_image(image_urls[item['id']], output_path):
-                        downloads.append(str(output_path))
-                        print(f"  [OK] {filename}")
-
-        # Download illustrations
-        if organization['illustrations']:
-            print(f"\nDownloading {len(organization['illustrations'])} illustrations...")
-            node_ids = [item['id'] for item in organization['illustrations']]
-            image_urls = self.export_nodes(node_ids, format='png', scale=2)
-
-            for item in organization['illustrations']:
-                if item['id'] in image_urls:
-                    filename = item['name'].lower().replace(' ', '-') + '.png'
-                    output_path = self.assets_dir / 'illustrations' / 'concepts' / filename
-                    if self.download_image(image_urls[item['id']], output_path):
-                        downloads.append(str(output_path))
-                        print(f"  [OK] {filename}")
-
-        # Download icons
-        if organization['icons']:
-            print(f"\nDownloading {len(organization['icons'])} icons...")
-            node_ids = [item['id'] for item in organization['icons']]
-            image_urls = self.export_nodes(node_ids, format='png', scale=2)
-
-            for item in organization['icons']:
-                if item['id'] in image_urls:
-                    filename = item['name'].lower().replace(' ', '-') + '.png'
-                    output_path = self.assets_dir / 'illustrations' / 'icons' / filename
-                    if self.download_image(image_urls[item['id']], output_path):
-                        downloads.append(str(output_path))
-                        print(f"  [OK] {filename}")
-
-        # Download other assets
-        if organization['other']:
-            print(f"\nDownloading {len(organization['other'])} other assets...")
-            node_ids = [item['id'] for item in organization['other']]
-            image_urls = self.export_nodes(node_ids, format='png', scale=2)
-
-            for item in organization['other']:
-                if item['id'] in image_urls:
-                    filename = item['name'].lower().replace(' ', '-') + '.png'
-                    output_path = self.assets_dir / 'illustrations' / 'concepts' / filename
-                    if self.download_image(image_urls[item['id']], output_path):
-                        downloads.append(str(output_path))
-                        print(f"  [OK] {filename}")
+        def download(job):
+            url, output_path = job
+            if self.download_image(url, output_path):
+                print(f"  [OK] {output_path.name}")
+                return str(output_path)
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+            results = list(pool.map(download, jobs))
+
+        # Same order as the categories/items, whichever download finished first
+        return [path for path in results if path]
+
+    def load_manifest(self):
+        """Return the previous sync manifest for this file, or None"""
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('file_key') != self.file_key:
+            return None
+        return manifest
+
+    def diff_nodes(self, organization, manifest):
+        """
+        Compare categorized nodes against the previous manifest.
 
-        return downloads
+        A node is changed when its content hash differs, its destination
+        moved, or its file is missing locally. With no manifest (or one
+        written before per-node hashes existed) every node counts as added.
 
-    def sync(self):
-        """Main sync function"""
+        Returns:
+            {'added': [...], 'changed': [...], 'unchanged': [...], 'removed': [...]}
+            where the first three hold node IDs and 'removed' holds previous
+            manifest entries ({'id', 'name', 'path', ...})
+        """
+        previous = (manifest or {}).get('nodes', {})
+        diff = {'added': [], 'changed': [], 'unchanged': [], 'removed': []}
+        current_ids = set()
+
+        for category in CATEGORY_DESTINATIONS:
+            for item in organization.get(category, []):
+                current_ids.add(item['id'])
+                before = previous.get(item['id'])
+                path = self.asset_path(category, item)
+                if before is None:
+                    diff['added'].append(item['id'])
+                elif (before.get('hash') != item['hash']
+                      or before.get('path') != path.relative_to(self.assets_dir).as_posix()
+                      or not path.exists()):
+                    diff['changed'].append(item['id'])
+                else:
+                    diff['unchanged'].append(item['id'])
+
+        for node_id, before in previous.items():
+            if node_id not in current_ids:
+                diff['removed'].append(dict(before, id=node_id))
+
+        return diff
+
+    def handle_removed(self, removed, organization, prune=False):
+        """Report nodes deleted in Figma; with prune=True delete their files"""
+        if not removed:
+            return []
+
+        # Never delete a file that a current node still writes to
+        current_paths = {
+            self.asset_path(category, item)
+            for category in CATEGORY_DESTINATIONS
+            for item in organization.get(category, [])
+        }
+
+        print(f"\n{len(removed)} node(s) removed from Figma:")
+        pruned = []
+        for entry in removed:
+            path = self.assets_dir / entry['path']
+            if prune and path not in current_paths and path.exists():
+                path.unlink()
+                pruned.append(str(path))
+                print(f"  [DEL] {entry['path']}")
+            else:
+                print(f"  [!]  {entry['path']} ({entry['name']})")
+        if not prune:
+            print("Run with --prune to delete these files.")
+        return pruned
+
+    def save_manifest(self, file_data, organization, downloads, pending_ids=(), previous=None):
+        """
+        Record the file version and every node's hash and local path
+
+        Nodes in pending_ids (due for download) that did not make it into
+        downloads keep their previous entry, so the next sync retries them;
+        in that case, or when some frames could not be verified, the
+        previous version is kept too, so the version check does not skip
+        the retry. Removed nodes whose files were not pruned
+        stay listed with 'removed': true so a later --prune can still
+        delete them.
+        """
+        previous_nodes = (previous or {}).get('nodes', {})
+        downloaded = set(downloads)
+
+        nodes = {}
+        complete = True
+        for category in CATEGORY_DESTINATIONS:
+            for item in organization.get(category, []):
+                path = self.asset_path(category, item)
+                if item.get('unverified'):
+                    complete = False
+                if item['id'] in pending_ids and str(path) not in downloaded:
+                    complete = False
+                    if item['id'] in previous_nodes:
+                        nodes[item['id']] = previous_nodes[item['id']]
+                elif path.exists():
+                    nodes[item['id']] = {
+                        'name': item['name'],
+                        'category': category,
+                        'hash': item['hash'],
+                        'path': path.relative_to(self.assets_dir).as_posix()
+                    }
+
+        for node_id, entry in previous_nodes.items():
+            if node_id not in nodes and (self.assets_dir / entry['path']).exists():
+                nodes[node_id] = dict(entry, removed=True)
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump({
+                'file_key': self.file_key,
+                'file_name': file_data['name'],
+                'sync_date': file_data.get('lastModified'),
+                'version': file_data.get('version') if complete else (previous or {}).get('version'),
+                'organization': organization,
+                'downloaded': downloads,
+                'nodes': nodes
+            }, f, indent=2)
+
+        print(f"Manifest saved to: {self.manifest_path}")
+
+    def sync(self, full=False, prune=False, assume_yes=False, dry_run=False,
+             categories=None, since_version=None):
+        """
+        Main sync function
+
+        Args:
+            full: Ignore the manifest and re-download every asset
+            prune: Delete local files whose Figma nodes were removed
+            assume_yes: Download without asking for confirmation
+            dry_run: Report what would change without downloading or
+                     writing the manifest
+            categories: Only download these categories (default: all)
+            since_version: Treat this Figma version as already synced
+                           instead of the manifest's version
+
+        Returns:
+            Result dict: status ('up_to_date', 'synced', 'partial',
+            'dry_run', 'cancelled' or 'error'; 'partial' when a download
+            failed or a frame could not be verified), version, and lists of
+            added/changed/removed nodes, downloaded/failed/pruned paths,
+            and unverified frame IDs (their /nodes request failed, so
+            changes to them may have been missed).
+            Network and API failures (including those raised in worker
+            threads) give status 'error' with the reason in 'error'.
+        """
         print("="*60)
         print("FIGMA ASSET SYNC")
         print("="*60)
 
+        result = {
+            'status': 'error', 'error': None, 'version': None,
+            'added': [], 'changed': [], 'unchanged': 0, 'removed': [],
+            'downloaded': [], 'failed': [], 'pruned': [], 'unverified': []
+        }
+        try:
+            return self._sync(result, full, prune, assume_yes, dry_run, categories, since_version)
+        except requests.RequestException as e:
+            print(f"\nFigma request failed: {e}")
+            result.update(status='error', error=f"Figma request failed: {e}")
+        except Exception as e:
+            print(f"\nSync failed: {e}")
+            result.update(status='error', error=f"{type(e).__name__}: {e}")
+        return result
+
+    def _sync(self, result, full, prune, assume_yes, dry_run, categories, since_version):
+        """Body of sync(); fills in and returns result"""
+        selected = set(categories or CATEGORY_DESTINATIONS)
+
+        manifest = None if full else self.load_manifest()
+        baseline = since_version or (manifest or {}).get('version')
+
+        flagged = [n for n in (manifest or {}).get('nodes', {}).values() if n.get('removed')]
+
+        # Cheap version check first: an unchanged file needs no document fetch
+        if baseline and not full and not (prune and flagged):
+            current = self.get_file_version()
+            if current and current['version'] == baseline:
+                print(f"\nUp to date: version {current['version']} "
+                      f"(last modified {current['lastModified']})")
+                result.update(status='up_to_date', version=current['version'])
+                return result
+
         # Get file info
         file_data = self.get_file_info()
         if not file_data:
             print("\nFailed to connect to Figma. Check your token and file key.")
-            return False
+            result['error'] = "Could not fetch the Figma file"
+            return result
+        result['version'] = file_data.get('version')
+
+        # Full frame JSON is only fetched per frame, for content hashes
+        frame_ids = [frame['id']
+                     for page in file_data.get('document', {}).get('children', [])
+                     for frame in page.get('children', [])]
+        hashes = self.get_node_hashes(frame_ids)
+        result['unverified'] = sorted(set(frame_ids) - set(hashes))
 
         # Analyze structure
-        organization = self.organize_assets(file_data)
+        organization = self.organize_assets(file_data, hashes, (manifest or {}).get('nodes'))
 
         # Summary
         print("\n" + "="*60)
@@ -321,41 +660,138 @@ class FigmaSync:
         print(f"Other: {len(organization['other'])}")
         print(f"Total: {sum(len(v) for v in organization.values())}")
 
+        diff = self.diff_nodes(organization, manifest)
+        pending = set(diff['added']) | set(diff['changed'])
+
+        # Nodes outside the selected categories stay pending for a later run
+        paths = {}
+        for category in CATEGORY_DESTINATIONS:
+            for item in organization.get(category, []):
+                if category in selected:
+                    paths[item['id']] = self.asset_path(category, item)
+        to_download = {node_id for node_id in pending if node_id in paths}
+        removed = [entry for entry in diff['removed'] if entry.get('category') in selected]
+
+        def describe(node_id):
+            return {'id': node_id,
+                    'path': paths[node_id].relative_to(self.assets_dir).as_posix()}
+
+        result.update(
+            added=[describe(i) for i in diff['added'] if i in to_download],
+            changed=[describe(i) for i in diff['changed'] if i in to_download],
+            unchanged=len(diff['unchanged']),
+            removed=[{'id': e['id'], 'path': e['path']} for e in removed],
+        )
+        print(f"\nAdded: {len(result['added'])}  Changed: {len(result['changed'])}  "
+              f"Unchanged: {len(diff['unchanged'])}  Removed: {len(removed)}")
+
+        if dry_run:
+            print("\nDry run: nothing downloaded, manifest unchanged.")
+            result['status'] = 'dry_run'
+            return result
+
+        if not to_download:
+            result['pruned'] = self.handle_removed(removed, organization, prune)
+            print("\nNo assets to download.")
+            self.save_manifest(file_data, organization, [], pending, manifest)
+            result['status'] = 'partial' if result['unverified'] else 'synced'
+            if result['unverified']:
+                print(f"{len(result['unverified'])} frame(s) could not be verified; run again to re-check them.")
+            return result
+
         # Ask for confirmation
+        if not assume_yes:
+            print("\n" + "="*60)
+            if not sys.stdin.isatty():
+                print("\nNo terminal to confirm on; re-run with --yes to download.")
+                result['status'] = 'cancelled'
+                return result
+            response = input(f"\nDownload {len(to_download)} new/changed assets? (y/n): ")
+            if response.lower() != 'y':
+                print("\nSync cancelled.")
+                result['status'] = 'cancelled'
+                return result
+
+        downloads = self.download_all_assets(organization, only_ids=to_download)
+        result['pruned'] = self.handle_removed(removed, organization, prune)
+        result['downloaded'] = downloads
+        result['failed'] = sorted(
+            describe(i)['path'] for i in to_download if str(paths[i]) not in set(downloads)
+        )
+        result['status'] = 'partial' if result['failed'] or result['unverified'] else 'synced'
+
         print("\n" + "="*60)
-        response = input("\nDownload all assets? (y/n): ")
+        print("SYNC COMPLETE")
+        print("="*60)
+        print(f"Downloaded {len(downloads)} assets"
+              + (f", {len(result['failed'])} failed" if result['failed'] else "")
+              + (f", {len(result['unverified'])} frame(s) unverified" if result['unverified'] else ""))
+        print(f"\nAssets saved to: {self.assets_dir}")
 
-        if response.lower() == 'y':
-            downloads = self.download_all_assets(organization)
+        # Save manifest
+        self.save_manifest(file_data, organization, downloads, pending, manifest)
+        return result
 
-            print("\n" + "="*60)
-            print("SYNC COMPLETE")
-            print("="*60)
-            print(f"Downloaded {len(downloads)} assets")
-            print(f"\nAssets saved to: {self.assets_dir}")
-
-            # Save manifest
-            manifest_path = self.assets_dir / 'figma-sync-manifest.json'
-            with open(manifest_path, 'w') as f:
-                json.dump({
-                    'file_key': self.file_key,
-                    'file_name': file_data['name'],
-                    'sync_date': file_data.get('lastModified'),
-                    'organization': organization,
-                    'downloaded': downloads
-                }, f, indent=2)
-
-            print(f"Manifest saved to: {manifest_path}")
-            return True
-        else:
-            print("\nSync cancelled.")
-            return False
+
+EXIT_CODES = {
+    'up_to_date': EXIT_OK,
+    'synced': EXIT_OK,
+    'dry_run': EXIT_OK,
+    'partial': EXIT_PARTIAL,
+    'cancelled': EXIT_CANCELLED,
+    'error': EXIT_ERROR,
+}
 
 
 def main():
-    syncer = FigmaSync()
-    syncer.sync()
+    parser = argparse.ArgumentParser(description="Sync assets from Figma")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the manifest and re-download every asset")
+    parser.add_argument("--prune", action="store_true",
+                        help="Delete local files whose Figma nodes were removed")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="Download without asking for confirmation")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be downloaded; change nothing")
+    parser.add_argument("--categories", type=lambda v: v.split(','),
+                        help="Comma-separated subset of: " + ",".join(CATEGORY_DESTINATIONS))
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Parallel image downloads")
+    parser.add_argument("--export-concurrency", type=int, default=4,
+                        help="Parallel Figma API requests (rate limited)")
+    parser.add_argument("--since-version",
+                        help="Skip the sync if the Figma file is still at this version")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the result as JSON on stdout (logs go to stderr)")
+    args = parser.parse_args()
+
+    unknown = set(args.categories or []) - set(CATEGORY_DESTINATIONS)
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(sorted(unknown))}")
+
+    # With --json, keep stdout for the machine-readable result
+    log = sys.stderr if args.json else sys.stdout
+    exit_code = None
+    try:
+        with contextlib.redirect_stdout(log):
+            syncer = FigmaSync(export_concurrency=args.export_concurrency,
+                               download_workers=args.concurrency)
+            result = syncer.sync(full=args.full, prune=args.prune,
+                                 assume_yes=args.yes, dry_run=args.dry_run,
+                                 categories=args.categories,
+                                 since_version=args.since_version)
+    # requests.JSONDecodeError is also a ValueError: check network errors first
+    except (requests.JSONDecodeError, requests.RequestException) as e:
+        print(f"ERROR: Figma request failed: {e}", file=log)
+        result, exit_code = {'status': 'error', 'error': f"Figma request failed: {e}"}, EXIT_ERROR
+    except ValueError as e:
+        print(f"ERROR: {e}", file=log)
+        result, exit_code = {'status': 'error', 'error': str(e)}, EXIT_CONFIG
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    return exit_code if exit_code is not None else EXIT_CODES[result['status']]
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())